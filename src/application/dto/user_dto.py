@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 
@@ -26,3 +26,23 @@ class UserDTO:
             updated_at=user.updated_at
         )
 
+
+
+@dataclass
+class DeletedUserDTO:
+    id: UUID
+    deleted_at: datetime
+
+
+@dataclass
+class UserChangesDTO:
+    users: List[UserDTO]
+    deleted: List[DeletedUserDTO]
+    next_token: str
+    has_more: bool
+
+
+@dataclass
+class UserAvailabilityDTO:
+    email_available: Optional[bool]
+    username_available: Optional[bool]
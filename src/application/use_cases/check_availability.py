@@ -0,0 +1,27 @@
+from typing import Optional
+
+from src.application.dto.user_dto import UserAvailabilityDTO
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.membership import UserAvailabilityIndex
+from src.infrastructure.tracing import traced
+
+
+class CheckAvailabilityUseCase:
+    def __init__(self, uow: UnitOfWork, availability: Optional[UserAvailabilityIndex] = None):
+        self.uow = uow
+        self.availability = availability
+
+    @traced("usecase")
+    async def execute(self, email: Optional[str] = None, username: Optional[str] = None) -> UserAvailabilityDTO:
+        # A definite negative from the filter answers without touching the database.
+        email_available = None
+        if email is not None:
+            email_available = (
+                self.availability is not None and not self.availability.may_contain_email(email)
+            ) or await self.uow.users.get_by_email(email) is None
+        username_available = None
+        if username is not None:
+            username_available = (
+                self.availability is not None and not self.availability.may_contain_username(username)
+            ) or await self.uow.users.get_by_username(username) is None
+        return UserAvailabilityDTO(email_available=email_available, username_available=username_available)
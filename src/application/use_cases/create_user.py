@@ -4,23 +4,33 @@ from src.application.dto.user_dto import UserDTO
 from src.domain.entities.user import User
 from src.domain.exceptions import UserAlreadyExistsException
 from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.membership import UserAvailabilityIndex
+from src.infrastructure.tracing import traced
 
 
 class CreateUserUseCase:
-    def __init__(self, uow: UnitOfWork):
+    def __init__(self, uow: UnitOfWork, availability: Optional[UserAvailabilityIndex] = None):
         self.uow = uow
+        self.availability = availability
 
+    @traced("usecase")
     async def execute(self, email: str, username: str, full_name: Optional[str] = None) -> UserDTO:
-        existing = await self.uow.users.get_by_email(email)
-        if existing:
-            raise UserAlreadyExistsException(f"User with email {email} already exists")
+        # Definite negatives skip the lookups; the unique indexes still reject anything the filter missed.
+        if self.availability is None or self.availability.may_contain_email(email):
+            existing = await self.uow.users.get_by_email(email)
+            if existing:
+                raise UserAlreadyExistsException(f"User with email {email} already exists")
 
-        existing = await self.uow.users.get_by_username(username)
-        if existing:
-            raise UserAlreadyExistsException(f"User with username {username} already exists")
+        if self.availability is None or self.availability.may_contain_username(username):
+            existing = await self.uow.users.get_by_username(username)
+            if existing:
+                raise UserAlreadyExistsException(f"User with username {username} already exists")
 
         user = User.create(email=email, username=username, full_name=full_name)
         created = await self.uow.users.create(user)
+        if self.availability is not None:
+            # Before the commit: a rollback then only leaves a false positive behind.
+            self.availability.add(created.email, created.username)
         await self.uow.commit()
         return UserDTO.from_entity(created)
 
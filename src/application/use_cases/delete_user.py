@@ -2,12 +2,14 @@ from uuid import UUID
 
 from src.domain.exceptions import UserNotFoundException
 from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.tracing import traced
 
 
 class DeleteUserUseCase:
     def __init__(self, uow: UnitOfWork):
         self.uow = uow
 
+    @traced("usecase")
     async def execute(self, user_id: UUID) -> bool:
         user = await self.uow.users.get_by_id(user_id)
         if not user:
@@ -1,15 +1,35 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from src.application.dto.user_dto import UserDTO
+from src.domain.repositories.user_repository import UserProjection
 from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.single_flight import SingleFlight
+from src.infrastructure.tracing import traced
 
 
 class GetAllUsersUseCase:
-    def __init__(self, uow: UnitOfWork):
+    def __init__(self, uow: UnitOfWork, coalescer: Optional[SingleFlight] = None):
         self.uow = uow
+        self.coalescer = coalescer
 
+    @traced("usecase")
     async def execute(self, skip: int = 0, limit: int = 100) -> Tuple[List[UserDTO], int]:
+        if self.coalescer is None:
+            return await self._load(skip, limit)
+        return await self.coalescer.do(("users", skip, limit), lambda: self._load(skip, limit))
+
+    @traced("usecase")
+    async def execute_projected(self, fields: Tuple[str, ...], skip: int = 0, limit: int = 100) -> Tuple[List[UserProjection], int]:
+        if self.coalescer is None:
+            return await self._load_projected(fields, skip, limit)
+        return await self.coalescer.do(("users", skip, limit, fields), lambda: self._load_projected(fields, skip, limit))
+
+    async def _load(self, skip: int, limit: int) -> Tuple[List[UserDTO], int]:
         users = await self.uow.users.get_all(skip=skip, limit=limit)
         total = await self.uow.users.count()
         return [UserDTO.from_entity(u) for u in users], total
 
+    async def _load_projected(self, fields: Tuple[str, ...], skip: int, limit: int) -> Tuple[List[UserProjection], int]:
+        users = await self.uow.users.get_all_projected(fields, skip=skip, limit=limit)
+        total = await self.uow.users.count()
+        return users, total
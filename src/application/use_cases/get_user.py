@@ -1,17 +1,39 @@
+from typing import Optional, Tuple
 from uuid import UUID
 
 from src.application.dto.user_dto import UserDTO
 from src.domain.exceptions import UserNotFoundException
+from src.domain.repositories.user_repository import UserProjection
 from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.single_flight import SingleFlight
+from src.infrastructure.tracing import traced
 
 
 class GetUserUseCase:
-    def __init__(self, uow: UnitOfWork):
+    def __init__(self, uow: UnitOfWork, coalescer: Optional[SingleFlight] = None):
         self.uow = uow
+        self.coalescer = coalescer
 
+    @traced("usecase")
     async def execute(self, user_id: UUID) -> UserDTO:
+        if self.coalescer is None:
+            return await self._load(user_id)
+        return await self.coalescer.do(("user", user_id), lambda: self._load(user_id))
+
+    @traced("usecase")
+    async def execute_projected(self, user_id: UUID, fields: Tuple[str, ...]) -> UserProjection:
+        if self.coalescer is None:
+            return await self._load_projected(user_id, fields)
+        return await self.coalescer.do(("user", user_id, fields), lambda: self._load_projected(user_id, fields))
+
+    async def _load(self, user_id: UUID) -> UserDTO:
         user = await self.uow.users.get_by_id(user_id)
         if not user:
             raise UserNotFoundException(f"User with id {user_id} not found")
         return UserDTO.from_entity(user)
 
+    async def _load_projected(self, user_id: UUID, fields: Tuple[str, ...]) -> UserProjection:
+        projected = await self.uow.users.get_projection_by_id(user_id, fields)
+        if projected is None:
+            raise UserNotFoundException(f"User with id {user_id} not found")
+        return projected
@@ -0,0 +1,60 @@
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from uuid import UUID
+
+from src.application.dto.user_dto import DeletedUserDTO, UserChangesDTO, UserDTO
+from src.domain.exceptions import InvalidSyncTokenException
+from src.domain.repositories.user_repository import ChangeCursor
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.tracing import traced
+
+SyncPosition = Tuple[Optional[ChangeCursor], Optional[ChangeCursor]]
+
+
+def encode_sync_token(users_after: Optional[ChangeCursor], deleted_after: Optional[ChangeCursor]) -> str:
+    payload = {
+        "u": [users_after[0].isoformat(), str(users_after[1])] if users_after else None,
+        "d": [deleted_after[0].isoformat(), str(deleted_after[1])] if deleted_after else None,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_sync_token(token: Optional[str]) -> SyncPosition:
+    if not token:
+        return None, None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        cursors = []
+        for key in ("u", "d"):
+            value = payload[key]
+            cursors.append((datetime.fromisoformat(value[0]), UUID(value[1])) if value is not None else None)
+        return cursors[0], cursors[1]
+    except (binascii.Error, ValueError, TypeError, KeyError, IndexError) as e:
+        raise InvalidSyncTokenException("Invalid sync token") from e
+
+
+class GetUserChangesUseCase:
+    def __init__(self, uow: UnitOfWork, settle_seconds: float = 2.0):
+        self.uow = uow
+        self.settle_seconds = settle_seconds
+
+    @traced("usecase")
+    async def execute(self, token: Optional[str], limit: int = 500) -> UserChangesDTO:
+        users_after, deleted_after = decode_sync_token(token)
+        until = datetime.now(timezone.utc) - timedelta(seconds=self.settle_seconds)
+        users = await self.uow.users.get_changed_since(users_after, until, limit)
+        deleted = await self.uow.users.get_deleted_since(deleted_after, until, limit)
+        if users:
+            users_after = (users[-1].updated_at, users[-1].id)
+        if deleted:
+            deleted_after = (deleted[-1].deleted_at, deleted[-1].id)
+        return UserChangesDTO(
+            users=[UserDTO.from_entity(u) for u in users],
+            deleted=[DeletedUserDTO(id=t.id, deleted_at=t.deleted_at) for t in deleted],
+            next_token=encode_sync_token(users_after, deleted_after),
+            has_more=len(users) == limit or len(deleted) == limit,
+        )
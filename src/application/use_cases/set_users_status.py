@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from src.domain.exceptions import InvalidUserFilterException
+from src.domain.repositories.user_repository import UserFilter
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.tracing import traced
+
+
+class SetUsersStatusUseCase:
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    @traced("usecase")
+    async def execute(self, user_filter: UserFilter, is_active: bool, batch_size: int = 1000) -> int:
+        if user_filter.is_empty:
+            raise InvalidUserFilterException("At least one filter criterion is required")
+        affected = 0
+        while True:
+            # Each batch commits on its own so row locks are held for one chunk at a time.
+            changed = await self.uow.users.set_active_status(user_filter, is_active, datetime.now(timezone.utc), limit=batch_size)
+            await self.uow.commit()
+            affected += len(changed)
+            if len(changed) < batch_size:
+                return affected
@@ -4,12 +4,16 @@ from uuid import UUID
 from src.application.dto.user_dto import UserDTO
 from src.domain.exceptions import UserNotFoundException, UserAlreadyExistsException
 from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.membership import UserAvailabilityIndex
+from src.infrastructure.tracing import traced
 
 
 class UpdateUserUseCase:
-    def __init__(self, uow: UnitOfWork):
+    def __init__(self, uow: UnitOfWork, availability: Optional[UserAvailabilityIndex] = None):
         self.uow = uow
+        self.availability = availability
 
+    @traced("usecase")
     async def execute(self, user_id: UUID, email: Optional[str] = None, username: Optional[str] = None, full_name: Optional[str] = None) -> UserDTO:
         user = await self.uow.users.get_by_id(user_id)
         if not user:
@@ -27,6 +31,8 @@ class UpdateUserUseCase:
 
         user.update(email=email, username=username, full_name=full_name)
         updated = await self.uow.users.update(user)
+        if self.availability is not None:
+            self.availability.add(updated.email, updated.username)
         await self.uow.commit()
         return UserDTO.from_entity(updated)
 
@@ -59,11 +59,17 @@ class User:
             self.full_name = full_name.strip() if full_name.strip() else None
         self.updated_at = datetime.now(timezone.utc)
 
-    def deactivate(self) -> None:
+    def deactivate(self) -> bool:
+        if not self.is_active:
+            return False
         self.is_active = False
         self.updated_at = datetime.now(timezone.utc)
+        return True
 
-    def activate(self) -> None:
+    def activate(self) -> bool:
+        if self.is_active:
+            return False
         self.is_active = True
         self.updated_at = datetime.now(timezone.utc)
+        return True
 
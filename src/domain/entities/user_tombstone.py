@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class UserTombstone:
+    id: UUID
+    deleted_at: datetime
@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict
+from uuid import UUID
+
+from src.domain.entities.user import User
+
+
+class UserEventType:
+    CREATED = "user.created"
+    UPDATED = "user.updated"
+    DELETED = "user.deleted"
+    ACTIVATED = "user.activated"
+    DEACTIVATED = "user.deactivated"
+
+
+@dataclass(frozen=True)
+class UserEvent:
+    type: str
+    user_id: UUID
+    payload: Dict[str, Any]
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @classmethod
+    def snapshot(cls, event_type: str, user: User) -> "UserEvent":
+        return cls(
+            type=event_type,
+            user_id=user.id,
+            payload={
+                "id": str(user.id),
+                "email": user.email,
+                "username": user.username,
+                "full_name": user.full_name,
+                "is_active": user.is_active,
+                "created_at": user.created_at.isoformat(),
+                "updated_at": user.updated_at.isoformat(),
+            },
+        )
+
+    @classmethod
+    def deleted(cls, user_id: UUID) -> "UserEvent":
+        return cls(type=UserEventType.DELETED, user_id=user_id, payload={"id": str(user_id)})
+
+    @classmethod
+    def status_changed(cls, user_id: UUID, is_active: bool, updated_at: datetime) -> "UserEvent":
+        return cls(
+            type=UserEventType.ACTIVATED if is_active else UserEventType.DEACTIVATED,
+            user_id=user_id,
+            payload={"id": str(user_id), "is_active": is_active, "updated_at": updated_at.isoformat()},
+        )
@@ -17,3 +17,11 @@ class InvalidEmailException(DomainException):
 class InvalidUsernameException(DomainException):
     pass
 
+
+
+class InvalidUserFilterException(DomainException):
+    pass
+
+
+class InvalidSyncTokenException(DomainException):
+    pass
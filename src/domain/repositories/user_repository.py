@@ -1,11 +1,44 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities.user import User
+from src.domain.entities.user_tombstone import UserTombstone
+from src.domain.events import UserEvent
+
+ChangeCursor = Tuple[datetime, UUID]
+UserProjection = Dict[str, Any]
+
+USER_FIELDS = ("id", "email", "username", "full_name", "is_active", "created_at", "updated_at")
+
+
+def normalize_fields(names: Iterable[str]) -> Tuple[str, ...]:
+    # Canonical order, so equivalent requests share one projection (and one cached statement).
+    requested = {name.strip() for name in names if name.strip()}
+    unknown = requested.difference(USER_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown user fields: {', '.join(sorted(unknown))}")
+    if not requested:
+        raise ValueError("At least one field is required")
+    return tuple(name for name in USER_FIELDS if name in requested)
+
+
+@dataclass(frozen=True)
+class UserFilter:
+    ids: Optional[Tuple[UUID, ...]] = None
+    created_before: Optional[datetime] = None
+    email_domain: Optional[str] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.ids is None and self.created_before is None and self.email_domain is None
 
 
 class UserRepository(ABC):
+    pending_events: List[UserEvent]
+
     @abstractmethod
     async def create(self, user: User) -> User:
         pass
@@ -26,6 +59,14 @@ class UserRepository(ABC):
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         pass
 
+    @abstractmethod
+    async def get_projection_by_id(self, user_id: UUID, fields: Tuple[str, ...]) -> Optional[UserProjection]:
+        pass
+
+    @abstractmethod
+    async def get_all_projected(self, fields: Tuple[str, ...], skip: int = 0, limit: int = 100) -> List[UserProjection]:
+        pass
+
     @abstractmethod
     async def count(self) -> int:
         pass
@@ -37,3 +78,15 @@ class UserRepository(ABC):
     @abstractmethod
     async def delete(self, user_id: UUID) -> bool:
         pass
+
+    @abstractmethod
+    async def set_active_status(self, user_filter: UserFilter, is_active: bool, updated_at: datetime, limit: int) -> List[UUID]:
+        pass
+
+    @abstractmethod
+    async def get_changed_since(self, after: Optional[ChangeCursor], until: datetime, limit: int) -> List[User]:
+        pass
+
+    @abstractmethod
+    async def get_deleted_since(self, after: Optional[ChangeCursor], until: datetime, limit: int) -> List[UserTombstone]:
+        pass
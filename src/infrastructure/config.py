@@ -1,7 +1,23 @@
-from pydantic import Field, field_validator
+from typing import Dict, List, Optional
+
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
-from src.infrastructure.constants import DatabaseConstants
+from src.infrastructure.constants import (
+    AvailabilityConstants,
+    ConcurrencyConstants,
+    DatabaseConstants,
+    DeadlineConstants,
+    HealthConstants,
+    JobConstants,
+    LoopMonitorConstants,
+    MemoryConstants,
+    OutboxConstants,
+    ProfilingConstants,
+    ServerConstants,
+    SQLiteConstants,
+    TracingConstants,
+)
 
 
 class Settings(BaseSettings):
@@ -11,9 +27,89 @@ class Settings(BaseSettings):
     api_title: str = "Test API"
     api_version: str = "1.0.0"
     api_prefix: str = "/api/v1"
+    server_host: str = ServerConstants.DEFAULT_HOST
+    server_port: int = ServerConstants.DEFAULT_PORT
+    server_workers: Optional[int] = None
+    server_graceful_timeout: int = ServerConstants.DEFAULT_GRACEFUL_TIMEOUT
+
+    database_backend: str = DatabaseConstants.BACKEND_SQLALCHEMY
+    database_shard_urls: List[str] = Field(default_factory=list)
     database_pool_size: int = DatabaseConstants.DEFAULT_POOL_SIZE
     database_max_overflow: int = DatabaseConstants.DEFAULT_MAX_OVERFLOW
-    database_pool_pre_ping: bool = True
+    database_pool_pre_ping: bool = False
+    database_max_connections: Optional[int] = None
+    database_pool_warmup: bool = True
+    database_pool_liveness_interval: float = DatabaseConstants.DEFAULT_POOL_LIVENESS_INTERVAL
+    database_pool_adaptive: bool = False
+    database_pool_adaptive_interval: float = DatabaseConstants.DEFAULT_POOL_ADAPTIVE_INTERVAL
+    database_pool_adaptive_min_overflow: int = DatabaseConstants.DEFAULT_POOL_ADAPTIVE_MIN_OVERFLOW
+    database_pool_adaptive_max_overflow: int = DatabaseConstants.DEFAULT_POOL_ADAPTIVE_MAX_OVERFLOW
+    database_pool_target_wait_ms: float = DatabaseConstants.DEFAULT_POOL_TARGET_WAIT_MS
+    database_cached_statements: bool = True
+
+    concurrency_limit_enabled: bool = True
+    concurrency_limit_initial: Optional[int] = None
+    concurrency_limit_min: int = ConcurrencyConstants.DEFAULT_MIN_LIMIT
+    concurrency_limit_max: Optional[int] = None
+    concurrency_queue_factor: float = ConcurrencyConstants.DEFAULT_QUEUE_FACTOR
+    concurrency_queue_timeout: float = ConcurrencyConstants.DEFAULT_QUEUE_TIMEOUT
+    concurrency_latency_target_ms: float = ConcurrencyConstants.DEFAULT_LATENCY_TARGET_MS
+    concurrency_retry_after: int = ConcurrencyConstants.DEFAULT_RETRY_AFTER
+
+    request_deadline_enabled: bool = True
+    request_deadline_default: float = Field(default=DeadlineConstants.DEFAULT_TIMEOUT, gt=0.0)
+    # Full paths, matched by longest prefix; overrides DeadlineConstants.ROUTE_TIMEOUTS.
+    request_deadline_routes: Dict[str, Optional[float]] = Field(default_factory=dict)
+
+    sqlite_journal_mode: str = SQLiteConstants.DEFAULT_PRAGMAS["journal_mode"]
+    sqlite_synchronous: str = SQLiteConstants.DEFAULT_PRAGMAS["synchronous"]
+    sqlite_mmap_size: int = SQLiteConstants.DEFAULT_PRAGMAS["mmap_size"]
+    sqlite_busy_timeout_ms: int = SQLiteConstants.DEFAULT_PRAGMAS["busy_timeout"]
+
+    read_coalescing_enabled: bool = True
+    availability_filter_enabled: bool = True
+    availability_filter_capacity: int = AvailabilityConstants.DEFAULT_CAPACITY
+    availability_filter_error_rate: float = Field(default=AvailabilityConstants.DEFAULT_ERROR_RATE, gt=0.0, lt=1.0)
+    availability_filter_rebuild_interval: float = AvailabilityConstants.DEFAULT_REBUILD_INTERVAL
+    write_batching_enabled: bool = False
+    write_batch_max_delay_ms: float = DatabaseConstants.DEFAULT_WRITE_BATCH_MAX_DELAY_MS
+    write_batch_max_size: int = DatabaseConstants.DEFAULT_WRITE_BATCH_MAX_SIZE
+
+    jobs_enabled: bool = True
+    jobs_workers: int = JobConstants.DEFAULT_WORKERS
+    jobs_database_pool_size: int = JobConstants.DEFAULT_POOL_SIZE
+    jobs_poll_interval: float = JobConstants.DEFAULT_POLL_INTERVAL
+    jobs_heartbeat_interval: float = JobConstants.DEFAULT_HEARTBEAT_INTERVAL
+
+    outbox_enabled: bool = True
+    outbox_poll_interval: float = OutboxConstants.DEFAULT_POLL_INTERVAL
+    outbox_batch_size: int = OutboxConstants.DEFAULT_BATCH_SIZE
+    outbox_gap_timeout: float = OutboxConstants.DEFAULT_GAP_TIMEOUT
+    outbox_retention_hours: int = OutboxConstants.DEFAULT_RETENTION_HOURS
+    outbox_subscriber_queue_size: int = OutboxConstants.DEFAULT_SUBSCRIBER_QUEUE_SIZE
+
+    server_timing_enabled: bool = False
+    trace_sample_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    trace_file: str = TracingConstants.DEFAULT_FILE
+    trace_file_max_bytes: int = TracingConstants.DEFAULT_FILE_MAX_BYTES
+    trace_file_backup_count: int = TracingConstants.DEFAULT_FILE_BACKUP_COUNT
+
+    admin_token: Optional[str] = None
+    profiling_enabled: bool = False
+    profiling_dir: str = ProfilingConstants.DEFAULT_DIR
+    profiling_max_stored: int = ProfilingConstants.DEFAULT_MAX_STORED
+
+    memory_monitor_enabled: bool = True
+    memory_monitor_interval: float = MemoryConstants.DEFAULT_MONITOR_INTERVAL
+
+    health_sample_interval: float = Field(default=HealthConstants.DEFAULT_SAMPLE_INTERVAL, gt=0.0)
+    health_sample_timeout: float = Field(default=HealthConstants.DEFAULT_SAMPLE_TIMEOUT, gt=0.0)
+
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval: float = Field(default=LoopMonitorConstants.DEFAULT_INTERVAL, gt=0.0)
+    # 0 turns the watchdog thread off; the lag histogram is still recorded.
+    loop_block_threshold_ms: float = Field(default=LoopMonitorConstants.DEFAULT_BLOCK_THRESHOLD_MS, ge=0.0)
+    loop_debug: bool = False
 
     @field_validator("database_url")
     @classmethod
@@ -22,6 +118,44 @@ class Settings(BaseSettings):
             raise ValueError("Database URL cannot be empty")
         return v
 
+    @field_validator("database_backend")
+    @classmethod
+    def validate_database_backend(cls, v: str) -> str:
+        if v not in (DatabaseConstants.BACKEND_SQLALCHEMY, DatabaseConstants.BACKEND_MEMORY, DatabaseConstants.BACKEND_SHARDED):
+            raise ValueError(f"Unsupported database backend: {v}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_shards(self) -> "Settings":
+        if self.sharded and not self.database_shard_urls:
+            raise ValueError("The sharded backend requires database_shard_urls")
+        return self
+
+    @property
+    def sqlite_pragmas(self) -> dict:
+        return {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "mmap_size": self.sqlite_mmap_size,
+            "busy_timeout": self.sqlite_busy_timeout_ms,
+        }
+
+    @property
+    def tracing_enabled(self) -> bool:
+        return self.server_timing_enabled or self.trace_sample_rate > 0
+
+    @property
+    def profiling_available(self) -> bool:
+        return self.profiling_enabled and bool(self.admin_token)
+
+    @property
+    def in_memory(self) -> bool:
+        return self.database_backend == DatabaseConstants.BACKEND_MEMORY
+
+    @property
+    def sharded(self) -> bool:
+        return self.database_backend == DatabaseConstants.BACKEND_SHARDED
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -6,8 +6,140 @@ class PaginationConstants:
     MIN_PAGE_SIZE = 1
 
 
+class BulkConstants:
+    DEFAULT_BATCH_SIZE = 1000
+    MAX_IDS = 10000
+
+
 class DatabaseConstants:
+    BACKEND_SQLALCHEMY = "sqlalchemy"
+    BACKEND_MEMORY = "memory"
+    BACKEND_SHARDED = "sharded"
     DEFAULT_POOL_SIZE = 10
     DEFAULT_MAX_OVERFLOW = 20
     DEFAULT_POOL_RECYCLE = 3600
+    DEFAULT_POOL_LIVENESS_INTERVAL = 30.0
+    DEFAULT_POOL_ADAPTIVE_INTERVAL = 5.0
+    DEFAULT_POOL_ADAPTIVE_MIN_OVERFLOW = 0
+    DEFAULT_POOL_ADAPTIVE_MAX_OVERFLOW = 40
+    DEFAULT_POOL_TARGET_WAIT_MS = 50.0
+    DEFAULT_WRITE_BATCH_MAX_DELAY_MS = 2.0
+    DEFAULT_WRITE_BATCH_MAX_SIZE = 64
+
+
+
+class ConcurrencyConstants:
+    DEFAULT_MIN_LIMIT = 1
+    DEFAULT_QUEUE_FACTOR = 2.0
+    DEFAULT_QUEUE_TIMEOUT = 5.0
+    DEFAULT_LATENCY_TARGET_MS = 250.0
+    DEFAULT_RETRY_AFTER = 1
+    PRIORITY_PATHS = ("/health", "/livez", "/readyz", "/metrics")
+
+
+class JobConstants:
+    DEFAULT_WORKERS = 2
+    DEFAULT_POOL_SIZE = 2
+    DEFAULT_POLL_INTERVAL = 5.0
+    DEFAULT_HEARTBEAT_INTERVAL = 10.0
+    DEFAULT_BATCH_SIZE = 500
+
+
+class ServerConstants:
+    DEFAULT_HOST = "0.0.0.0"
+    DEFAULT_PORT = 8000
+    DEFAULT_GRACEFUL_TIMEOUT = 30
+
+
+class AvailabilityConstants:
+    DEFAULT_CAPACITY = 1_000_000
+    DEFAULT_ERROR_RATE = 0.01
+    DEFAULT_REBUILD_INTERVAL = 3600.0
+    SCAN_BATCH_SIZE = 10_000
+
+
+class ShardingConstants:
+    # A directory claim this old whose user never reached its shard is left over from a failed write.
+    STALE_CLAIM_SECONDS = 60.0
+
+
+class SQLiteConstants:
+    DEFAULT_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,
+        "busy_timeout": 5000,
+        "foreign_keys": "ON",
+    }
+
+
+class SyncConstants:
+    DEFAULT_LIMIT = 500
+    MAX_LIMIT = 1000
+    # Rows newer than this are held back a sync so transactions still in flight can't commit behind the cursor.
+    SETTLE_SECONDS = 2.0
+
+
+class OutboxConstants:
+    DEFAULT_POLL_INTERVAL = 0.5
+    DEFAULT_BATCH_SIZE = 500
+    # How long the relay waits for a lower id to commit before treating the hole as a rolled-back insert.
+    DEFAULT_GAP_TIMEOUT = 2.0
+    DEFAULT_RETENTION_HOURS = 24
+    DEFAULT_SUBSCRIBER_QUEUE_SIZE = 1000
+    PURGE_INTERVAL = 300.0
+    SSE_KEEPALIVE_INTERVAL = 15.0
+    SSE_RETRY_MS = 3000
+
+
+class TracingConstants:
+    DEFAULT_FILE = "traces/traces-{pid}.jsonl"
+    DEFAULT_FILE_MAX_BYTES = 50 * 1024 * 1024
+    DEFAULT_FILE_BACKUP_COUNT = 5
+    MAX_STATEMENT_LENGTH = 1000
+
+
+class DeadlineConstants:
+    DEFAULT_TIMEOUT = 10.0
+    CLIENT_HEADER = "x-request-timeout-ms"
+    # Relative to the API prefix; None means the route runs without a deadline.
+    ROUTE_TIMEOUTS = {
+        "/users/events": None,
+        "/users/bulk": 60.0,
+        "/admin/profiling/sample": None,
+    }
+
+
+class ProfilingConstants:
+    DEFAULT_DIR = "profiles"
+    DEFAULT_MAX_STORED = 50
+    REQUEST_HEADER = "x-profile"
+    TOKEN_HEADER = "x-admin-token"
+    SAMPLE_DEFAULT_SECONDS = 10.0
+    SAMPLE_MAX_SECONDS = 60.0
+    SAMPLE_DEFAULT_INTERVAL_MS = 10.0
+    SAMPLE_MIN_INTERVAL_MS = 1.0
+    REPORT_LINES = 60
+
+
+class HealthConstants:
+    DEFAULT_SAMPLE_INTERVAL = 5.0
+    DEFAULT_SAMPLE_TIMEOUT = 2.0
+    # Samples older than this many intervals no longer count as a healthy database.
+    STALE_INTERVALS = 3
+
+
+class LoopMonitorConstants:
+    DEFAULT_INTERVAL = 0.1
+    DEFAULT_BLOCK_THRESHOLD_MS = 250.0
+    LAG_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
+    REQUEST_TASK_PREFIX = "request:"
+    STACK_LIMIT = 40
+
 
+class MemoryConstants:
+    DEFAULT_MONITOR_INTERVAL = 60.0
+    DEFAULT_TRACEMALLOC_FRAMES = 1
+    MAX_TRACEMALLOC_FRAMES = 64
+    DEFAULT_TOP_LIMIT = 25
+    MAX_TOP_LIMIT = 500
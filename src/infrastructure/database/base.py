@@ -1,40 +1,128 @@
-from typing import AsyncGenerator
+import asyncio
+from typing import Any, AsyncGenerator, Dict, Optional
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
     AsyncEngine,
 )
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import Session, SessionTransaction, declarative_base
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.constants import SQLiteConstants
+from src.infrastructure.database.pool import ResizableQueuePool
 
 Base = declarative_base()
 
+_sqlite_write_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _release_write_lock(session: Session) -> None:
+    if session.info.pop("write_lock_held", False):
+        session.info["write_lock"].release()
+
+
+class SQLiteSession(Session):
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            _release_write_lock(self)
+
+
+@event.listens_for(SQLiteSession, "after_transaction_end")
+def _on_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        _release_write_lock(session)
+
+
+async def prepare_session(session: AsyncSession) -> None:
+    # Sessions opened for a write unit of work take the lock before their first read.
+    if session.info.get("write_intent"):
+        await acquire_write_lock(session)
+
+
+async def acquire_write_lock(session: AsyncSession) -> None:
+    # SQLite allows one writer at a time. Writers queue here instead of failing with
+    # "database is locked"; taking the lock before the transaction's first statement also
+    # avoids the busy-snapshot error a WAL read transaction gets when it upgrades to a write.
+    # The lock is released when the outermost transaction ends or the session closes.
+    lock: Optional[asyncio.Lock] = session.info.get("write_lock")
+    if lock is None or session.info.get("write_lock_held"):
+        return
+    await lock.acquire()
+    session.info["write_lock_held"] = True
+
 
 class Database:
-    def __init__(self, database_url: str, echo: bool = False, pool_size: int = 10, max_overflow: int = 20, pool_pre_ping: bool = True):
-        connect_args = {}
+    def __init__(
+        self,
+        database_url: str,
+        echo: bool = False,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_pre_ping: bool = False,
+        sqlite_pragmas: Optional[Dict[str, Any]] = None,
+    ):
+        self.is_sqlite = database_url.startswith("sqlite")
+        connect_args: Dict[str, Any] = {}
+        engine_args: Dict[str, Any] = {}
         if "mysql" in database_url:
             connect_args = {"connect_timeout": 10}
-        
+
+        if self.is_sqlite and ":memory:" in database_url:
+            engine_args = {"poolclass": StaticPool}
+            connect_args = {"check_same_thread": False}
+        else:
+            engine_args = {
+                "poolclass": ResizableQueuePool,
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_recycle": 3600,
+            }
+
         self._engine: AsyncEngine = create_async_engine(
             database_url,
             echo=echo,
             pool_pre_ping=pool_pre_ping,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-            pool_recycle=3600,
             pool_reset_on_return="commit",
             connect_args=connect_args,
+            **engine_args,
         )
+
+        session_args: Dict[str, Any] = {}
+        if self.is_sqlite:
+            self._configure_sqlite({**SQLiteConstants.DEFAULT_PRAGMAS, **(sqlite_pragmas or {})})
+            lock = _sqlite_write_locks.setdefault(database_url, asyncio.Lock())
+            session_args = {"sync_session_class": SQLiteSession, "info": {"write_lock": lock}}
+
         self._session_factory = async_sessionmaker(
             self._engine,
             class_=AsyncSession,
             expire_on_commit=False,
             autoflush=False,
             autocommit=False,
+            **session_args,
         )
 
+    def _configure_sqlite(self, pragmas: Dict[str, Any]) -> None:
+        sync_engine = self._engine.sync_engine
+
+        @event.listens_for(sync_engine, "connect")
+        def _on_connect(dbapi_connection, connection_record) -> None:
+            # Disabling the driver's own transaction handling lets SAVEPOINT work; BEGIN is emitted below.
+            dbapi_connection.isolation_level = None
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+        @event.listens_for(sync_engine, "begin")
+        def _on_begin(conn) -> None:
+            conn.exec_driver_sql("BEGIN")
+
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         async with self._session_factory() as session:
             try:
@@ -54,6 +142,14 @@ class Database:
     async def close(self) -> None:
         await self._engine.dispose()
 
+    def discard_after_fork(self) -> None:
+        # Drops inherited pooled connections without closing the sockets the parent still uses.
+        self._engine.sync_engine.dispose(close=False)
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
     @property
     def session_factory(self) -> async_sessionmaker:
         return self._session_factory
@@ -0,0 +1,36 @@
+from types import TracebackType
+from typing import Dict, Optional, Type
+from uuid import UUID
+
+from src.domain.entities.user import User
+from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository, InMemoryUserStore
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    def __init__(self, store: InMemoryUserStore) -> None:
+        self.store = store
+        self._journal: Dict[UUID, Optional[User]] = {}
+        self.users = InMemoryUserRepository(store, self._journal)
+
+    async def __aenter__(self) -> "InMemoryUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]) -> bool:
+        if exc_type is not None:
+            await self.rollback()
+        return False
+
+    async def commit(self) -> None:
+        # The in-memory backend has no relay, so recorded events are dropped.
+        self.users.pending_events.clear()
+        self._journal.clear()
+
+    async def rollback(self) -> None:
+        for user_id, previous in self._journal.items():
+            self.store.remove(user_id)
+            if previous is not None:
+                self.store.put(previous)
+                self.store.tombstones.pop(user_id, None)
+        self._journal.clear()
+        self.users.pending_events.clear()
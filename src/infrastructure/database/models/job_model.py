@@ -0,0 +1,31 @@
+from sqlalchemy import Boolean, CHAR, Column, DateTime, Float, Index, Integer, String, Text, func
+
+from src.infrastructure.database.base import Base
+
+
+class JobModel(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("idx_jobs_status_created_at", "status", "created_at"),
+        {"mysql_engine": "InnoDB", "mysql_charset": "utf8mb4"},
+    )
+
+    id = Column(CHAR(36), primary_key=True)
+    type = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False)
+    params = Column(Text, nullable=False)
+    progress = Column(Float, default=0.0, nullable=False)
+    message = Column(String(255), nullable=True)
+    checkpoint = Column(Text, nullable=True)
+    result = Column(Text(length=2**32 - 1), nullable=True)
+    error = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, default=False, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    owner = Column(String(100), nullable=True)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<JobModel(id={self.id}, type={self.type}, status={self.status})>"
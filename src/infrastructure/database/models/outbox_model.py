@@ -0,0 +1,21 @@
+from sqlalchemy import BigInteger, CHAR, Column, DateTime, Index, Integer, String, Text
+
+from src.infrastructure.database.base import Base
+
+
+class OutboxEventModel(Base):
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        Index("idx_outbox_created_at", "created_at"),
+        # Without AUTOINCREMENT SQLite may hand out ids again once the newest rows are purged.
+        {"mysql_engine": "InnoDB", "mysql_charset": "utf8mb4", "sqlite_autoincrement": True},
+    )
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    event_type = Column(String(50), nullable=False)
+    aggregate_id = Column(CHAR(36), nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<OutboxEventModel(id={self.id}, event_type={self.event_type})>"
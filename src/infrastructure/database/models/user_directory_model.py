@@ -0,0 +1,16 @@
+from sqlalchemy import CHAR, Column, DateTime, String
+
+from src.infrastructure.database.base import Base
+
+
+class UserDirectoryModel(Base):
+    __tablename__ = "user_directory"
+    __table_args__ = ({"mysql_engine": "InnoDB", "mysql_charset": "utf8mb4"},)
+
+    user_id = Column(CHAR(36), primary_key=True)
+    email = Column(String(255), unique=True, nullable=False)
+    username = Column(String(100), unique=True, nullable=False)
+    claimed_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<UserDirectoryModel(user_id={self.user_id}, email={self.email})>"
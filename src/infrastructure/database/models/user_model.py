@@ -1,7 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Boolean, DateTime, func, Index
-from sqlalchemy.dialects.mysql import CHAR
+from sqlalchemy import CHAR, Column, String, Boolean, DateTime, func, Index
 
 from src.infrastructure.database.base import Base
 
@@ -12,6 +11,7 @@ class UserModel(Base):
         Index("idx_email", "email"),
         Index("idx_username", "username"),
         Index("idx_created_at", "created_at"),
+        Index("idx_updated_at_id", "updated_at", "id"),
         {"mysql_engine": "InnoDB", "mysql_charset": "utf8mb4"},
     )
 
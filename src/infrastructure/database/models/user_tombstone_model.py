@@ -0,0 +1,17 @@
+from sqlalchemy import CHAR, Column, DateTime, Index
+
+from src.infrastructure.database.base import Base
+
+
+class UserTombstoneModel(Base):
+    __tablename__ = "user_tombstones"
+    __table_args__ = (
+        Index("idx_tombstones_deleted_at_id", "deleted_at", "id"),
+        {"mysql_engine": "InnoDB", "mysql_charset": "utf8mb4"},
+    )
+
+    id = Column(CHAR(36), primary_key=True)
+    deleted_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<UserTombstoneModel(id={self.id}, deleted_at={self.deleted_at})>"
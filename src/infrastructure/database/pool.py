@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+from typing import Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.infrastructure.logger import logger
+
+
+class ResizableQueuePool(AsyncAdaptedQueuePool):
+    # QueuePool fixes its overflow bound at construction and has no way to report how long checkouts wait.
+    # This pool owns both, so the adaptive sizing neither reaches into QueuePool nor takes connections to measure.
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._waits_lock = threading.Lock()
+        self._wait_count = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @property
+    def max_overflow(self) -> int:
+        return self._max_overflow
+
+    def resize_overflow(self, max_overflow: int) -> None:
+        # Read on every checkout, so the new bound applies to the next one; surplus connections close as they return.
+        self._max_overflow = max(0, max_overflow)
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            wait = time.perf_counter() - started
+            with self._waits_lock:
+                self._wait_count += 1
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+
+    def take_checkout_waits(self) -> Tuple[int, float, float]:
+        # Count, mean and max of the checkouts since the previous call.
+        with self._waits_lock:
+            count, total, peak = self._wait_count, self._wait_total, self._wait_max
+            self._wait_count, self._wait_total, self._wait_max = 0, 0.0, 0.0
+        return count, (total / count if count else 0.0), peak
+
+
+class PoolMaintainer:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        liveness_interval: float = 0.0,
+        adaptive: bool = False,
+        adaptive_interval: float = 5.0,
+        min_overflow: int = 0,
+        max_overflow: int = 20,
+        target_wait_ms: float = 50.0,
+    ) -> None:
+        self._engine = engine
+        self._liveness_interval = liveness_interval
+        self._adaptive = adaptive
+        self._adaptive_interval = adaptive_interval
+        self._min_overflow = min_overflow
+        self._max_overflow = max(min_overflow, max_overflow)
+        self._target_wait = target_wait_ms / 1000
+        self._tasks: list[asyncio.Task] = []
+        self.last_checkout_wait: Optional[float] = None
+
+    @property
+    def pool(self) -> Optional[ResizableQueuePool]:
+        pool = self._engine.pool
+        return pool if isinstance(pool, ResizableQueuePool) else None
+
+    async def warmup(self, count: Optional[int] = None) -> int:
+        pool = self.pool
+        if pool is None:
+            return 0
+        count = pool.size() if count is None else count
+        results = await asyncio.gather(*(self._open() for _ in range(count)), return_exceptions=True)
+        opened = [c for c in results if not isinstance(c, BaseException)]
+        for conn in opened:
+            await conn.close()
+        failed = len(results) - len(opened)
+        if failed:
+            logger.warning(f"Pool warmup: {failed} of {count} connections failed to open")
+        logger.info(f"Pool warmup: opened {len(opened)} connections")
+        return len(opened)
+
+    async def _open(self):
+        conn = self._engine.connect()
+        await conn.start()
+        return conn
+
+    async def check_idle_connections(self) -> int:
+        pool = self.pool
+        if pool is None:
+            return 0
+        invalidated = 0
+        # The queue is FIFO, so checking out and returning checkedin() times visits each idle connection once.
+        for _ in range(pool.checkedin()):
+            conn = self._engine.connect()
+            try:
+                await conn.start()
+                await conn.execute(text("SELECT 1"))
+            except SQLAlchemyError as e:
+                invalidated += 1
+                logger.warning(f"Pool liveness: invalidating connection: {str(e)}")
+                try:
+                    await conn.invalidate()
+                except Exception:
+                    pass
+            finally:
+                await conn.close()
+        return invalidated
+
+    def adjust_overflow(self, wait: float) -> int:
+        pool = self.pool
+        if pool is None:
+            return 0
+        current = pool.max_overflow
+        capacity = pool.size() + max(current, 0)
+        utilization = pool.checkedout() / capacity if capacity else 0.0
+        target = current
+        if wait > self._target_wait:
+            target = min(current + max(1, pool.size() // 4), self._max_overflow)
+        elif wait < self._target_wait / 4 and utilization < 0.5:
+            target = max(current - 1, self._min_overflow)
+        if target != current:
+            pool.resize_overflow(target)
+            logger.info(f"Pool overflow adjusted: {current} -> {target} (checkout wait {wait * 1000:.1f}ms, utilization {utilization:.0%})")
+        return target
+
+    def start(self) -> None:
+        if self.pool is None:
+            return
+        if self._liveness_interval > 0:
+            self._tasks.append(asyncio.create_task(self._liveness_loop()))
+        if self._adaptive:
+            self._tasks.append(asyncio.create_task(self._adaptive_loop()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _liveness_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._liveness_interval)
+            try:
+                await self.check_idle_connections()
+            except Exception as e:
+                logger.error(f"Pool liveness check failed: {str(e)}", exc_info=True)
+
+    async def _adaptive_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._adaptive_interval)
+            pool = self.pool
+            if pool is None:
+                return
+            try:
+                # Waits seen by real checkouts over the interval; an idle interval counts as no wait.
+                _, wait, _ = pool.take_checkout_waits()
+                self.last_checkout_wait = wait
+                self.adjust_overflow(wait)
+            except Exception as e:
+                logger.error(f"Pool adaptive sizing failed: {str(e)}", exc_info=True)
@@ -0,0 +1,135 @@
+from types import TracebackType
+from typing import Dict, List, Optional, Type
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.infrastructure.database.base import acquire_write_lock
+from src.infrastructure.database.sharding import ShardedDatabase
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork, UnitOfWork
+from src.infrastructure.exceptions import CrossShardWriteException, DatabaseTransactionException
+from src.infrastructure.logger import logger
+from src.infrastructure.repositories.sharded_user_repository import ShardedUserRepository
+from src.infrastructure.repositories.user_directory import DirectoryEntry, UserDirectory
+from src.infrastructure.repositories.user_repository_impl import SQLAlchemyUserRepository
+from src.infrastructure.tracing import traced
+
+
+class ShardedUnitOfWork(UnitOfWork):
+    def __init__(self, database: ShardedDatabase, write_intent: bool = False, cached_statements: bool = True) -> None:
+        self.database = database
+        self.write_intent = write_intent
+        self.cached_statements = cached_statements
+        self.users = ShardedUserRepository(self)
+        self._directory: Optional[UserDirectory] = None
+        self._shards: Dict[int, SQLAlchemyUnitOfWork] = {}
+        self._written: List[int] = []
+        self._exclusive: Optional[int] = None
+
+    async def __aenter__(self) -> "ShardedUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]) -> bool:
+        try:
+            if exc_type is not None:
+                try:
+                    await self.rollback()
+                except Exception as e:
+                    logger.error(f"Rollback error in __aexit__: {str(e)}", exc_info=True)
+        finally:
+            await self._close()
+        return False
+
+    async def directory(self) -> UserDirectory:
+        if self._directory is None:
+            session = self.database.directory.session_factory()
+            if self.write_intent:
+                session.info["write_intent"] = True
+            self._directory = UserDirectory(session)
+        return self._directory
+
+    async def shard(self, index: int) -> SQLAlchemyUnitOfWork:
+        uow = self._shards.get(index)
+        if uow is None:
+            if self.write_intent:
+                # Writers always take the directory's SQLite lock before a shard's, so two of them
+                # can never wait on each other's locks in opposite order.
+                await acquire_write_lock((await self.directory()).session)
+            session = self.database.shards[index].session_factory()
+            if self.write_intent:
+                session.info["write_intent"] = True
+            # Each shard keeps its own outbox, which the single-database relay cannot read.
+            uow = SQLAlchemyUnitOfWork(session, SQLAlchemyUserRepository(session, cached_statements=self.cached_statements), record_events=False)
+            self._shards[index] = uow
+        return uow
+
+    def claim_write(self, index: int, exclusive: bool = True) -> None:
+        # A regular write must stay on one shard: there is no distributed commit, so a change spanning
+        # shards could land half-applied. Non-exclusive writes are for operations safe to re-run
+        # until they converge, which may then touch several shards, each committing on its own.
+        if exclusive and any(i != index for i in self._written) or self._exclusive not in (None, index):
+            raise CrossShardWriteException(f"Transaction already writes to shard {self._written[0]}, refusing a write to shard {index}")
+        if index not in self._written:
+            self._written.append(index)
+        if exclusive:
+            self._exclusive = index
+
+    @traced("db", name="COMMIT")
+    async def commit(self) -> None:
+        # The directory commits first: a shard failure afterwards is compensated below, while the
+        # reverse order could leave a user its uniqueness claims never covered.
+        previous: Dict[UUID, Optional[DirectoryEntry]] = {}
+        if self._directory is not None:
+            previous = dict(self._directory.previous)
+            self._directory.previous.clear()
+            try:
+                await self._directory.session.commit()
+            except SQLAlchemyError as e:
+                await self.rollback()
+                logger.error(f"Directory commit error: {str(e)}", exc_info=True)
+                raise DatabaseTransactionException(f"Failed to commit transaction: {str(e)}") from e
+        written, self._written, self._exclusive = self._written, [], None
+        try:
+            for index in written:
+                await self._shards[index].commit()
+        except DatabaseTransactionException:
+            await self._restore_directory(previous)
+            raise
+
+    async def rollback(self) -> None:
+        errors = []
+        if self._directory is not None:
+            self._directory.previous.clear()
+            try:
+                await self._directory.session.rollback()
+            except SQLAlchemyError as e:
+                errors.append(e)
+        for uow in self._shards.values():
+            try:
+                await uow.rollback()
+            except DatabaseTransactionException as e:
+                errors.append(e)
+        self._written, self._exclusive = [], None
+        if errors:
+            logger.error(f"Rollback error: {str(errors[0])}")
+            raise DatabaseTransactionException(f"Failed to rollback transaction: {str(errors[0])}") from errors[0]
+
+    async def _restore_directory(self, previous: Dict[UUID, Optional[DirectoryEntry]]) -> None:
+        if not previous:
+            return
+        try:
+            async with self.database.directory.session_factory() as session:
+                await UserDirectory(session).restore(previous)
+                await session.commit()
+        except Exception as e:
+            # Left behind, the claims are reclaimed once they are older than the stale-claim grace period.
+            logger.error(f"Failed to restore user directory after a shard commit failure: {str(e)}", exc_info=True)
+
+    async def _close(self) -> None:
+        sessions = [uow.session for uow in self._shards.values()]
+        if self._directory is not None:
+            sessions.append(self._directory.session)
+        for session in sessions:
+            await session.close()
+        self._shards.clear()
+        self._directory = None
@@ -0,0 +1,30 @@
+import asyncio
+import hashlib
+from typing import Any, List
+from uuid import UUID
+
+from src.infrastructure.database.base import Database
+
+
+class ShardedDatabase:
+    def __init__(self, shard_urls: List[str], directory: Database, **engine_options: Any) -> None:
+        if not shard_urls:
+            raise ValueError("At least one shard is required")
+        self.directory = directory
+        self.shards = [Database(url, **engine_options) for url in shard_urls]
+
+    def shard_for(self, user_id: UUID) -> int:
+        # A stable hash rather than hash(): the mapping must agree across processes and restarts.
+        # Changing the number of shards moves users, so it needs an offline rebalance.
+        digest = hashlib.blake2b(user_id.bytes, digest_size=8).digest()
+        return int.from_bytes(digest, "big") % len(self.shards)
+
+    async def create_tables(self) -> None:
+        await asyncio.gather(*(shard.create_tables() for shard in self.shards))
+
+    async def close(self) -> None:
+        await asyncio.gather(*(shard.close() for shard in self.shards))
+
+    def discard_after_fork(self) -> None:
+        for shard in self.shards:
+            shard.discard_after_fork()
@@ -1,4 +1,6 @@
+import json
 from abc import ABC, abstractmethod
+from datetime import timezone
 from types import TracebackType
 from typing import Optional, Type
 
@@ -6,8 +8,10 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.database.models.outbox_model import OutboxEventModel
 from src.infrastructure.exceptions import DatabaseException, DatabaseTransactionException
 from src.infrastructure.logger import logger
+from src.infrastructure.tracing import traced
 
 
 class UnitOfWork(ABC):
@@ -36,9 +40,10 @@ class UnitOfWork(ABC):
 
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
-    def __init__(self, session: AsyncSession, users: UserRepository) -> None:
+    def __init__(self, session: AsyncSession, users: UserRepository, record_events: bool = True) -> None:
         self.session = session
         self.users = users
+        self.record_events = record_events
 
     async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
         return self
@@ -51,8 +56,25 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
                 logger.error(f"Rollback error in __aexit__: {str(e)}", exc_info=True)
         return False
 
+    def _stage_events(self) -> None:
+        # Outbox rows ride in the same transaction as the change they describe.
+        events = self.users.pending_events
+        if self.record_events and events:
+            self.session.add_all([
+                OutboxEventModel(
+                    event_type=event.type,
+                    aggregate_id=str(event.user_id),
+                    payload=json.dumps(event.payload),
+                    created_at=event.occurred_at.astimezone(timezone.utc).replace(tzinfo=None),
+                )
+                for event in events
+            ])
+        events.clear()
+
+    @traced("db", name="COMMIT")
     async def commit(self) -> None:
         try:
+            self._stage_events()
             await self.session.commit()
         except SQLAlchemyError as e:
             try:
@@ -63,6 +85,7 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
             raise DatabaseTransactionException(f"Failed to commit transaction: {str(e)}") from e
 
     async def rollback(self) -> None:
+        self.users.pending_events.clear()
         try:
             await self.session.rollback()
         except SQLAlchemyError as e:
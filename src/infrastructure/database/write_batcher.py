@@ -0,0 +1,111 @@
+import asyncio
+import contextvars
+from typing import Awaitable, Callable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.infrastructure.database.base import Database, acquire_write_lock
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork, UnitOfWork
+from src.infrastructure.exceptions import DatabaseTransactionException
+from src.infrastructure.logger import logger
+from src.infrastructure.metrics import metrics
+from src.infrastructure.repositories.user_repository_impl import SQLAlchemyUserRepository
+
+T = TypeVar("T")
+WriteCommand = Callable[[UnitOfWork], Awaitable[T]]
+
+_batch_size = metrics.histogram("write_batch_size", "Commands applied per group commit", [1, 2, 4, 8, 16, 32, 64, 128])
+
+
+class BatchedUnitOfWork(SQLAlchemyUnitOfWork):
+    async def commit(self) -> None:
+        # The batch owns the real transaction; a command's commit only has to reach its savepoint.
+        try:
+            self._stage_events()
+            await self.session.flush()
+        except SQLAlchemyError as e:
+            raise DatabaseTransactionException(f"Failed to flush batched command: {str(e)}") from e
+
+
+class WriteBatcher:
+    def __init__(
+        self,
+        database: Database,
+        max_delay: float,
+        max_batch_size: int,
+        record_events: bool = True,
+        cached_statements: bool = True,
+    ) -> None:
+        self._database = database
+        self._record_events = record_events
+        self._cached_statements = cached_statements
+        self._max_delay = max_delay
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: List[Tuple[WriteCommand, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, command: WriteCommand[T]) -> T:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending.append((command, fut))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+        return await fut
+
+    async def close(self) -> None:
+        self._flush()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        # A fresh context keeps the batch out of whichever request's trace happened to trigger the flush.
+        task = asyncio.create_task(self._run(batch), context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[WriteCommand, asyncio.Future]]) -> None:
+        _batch_size.observe(len(batch))
+        applied: List[Tuple[asyncio.Future, object]] = []
+        try:
+            async with self._database.session_factory() as session:
+                await acquire_write_lock(session)
+                uow = BatchedUnitOfWork(
+                    session,
+                    SQLAlchemyUserRepository(session, cached_statements=self._cached_statements),
+                    record_events=self._record_events,
+                )
+                for command, fut in batch:
+                    if fut.done():
+                        continue
+                    try:
+                        async with session.begin_nested():
+                            result = await command(uow)
+                    except Exception as e:
+                        # Events of a command that never reached its commit must not leak into the next one.
+                        uow.users.pending_events.clear()
+                        fut.set_exception(e)
+                    else:
+                        applied.append((fut, result))
+                if applied:
+                    await session.commit()
+        except Exception as e:
+            logger.error(f"Group commit of {len(batch)} commands failed: {str(e)}", exc_info=True)
+            error = e if isinstance(e, DatabaseTransactionException) else DatabaseTransactionException(f"Failed to commit transaction: {str(e)}")
+            for fut, _ in applied:
+                if not fut.done():
+                    fut.set_exception(error)
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(error)
+            return
+        for fut, result in applied:
+            if not fut.done():
+                fut.set_result(result)
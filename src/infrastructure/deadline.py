@@ -0,0 +1,95 @@
+import asyncio
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.exceptions import DeadlineExceededException
+from src.infrastructure.metrics import metrics
+
+_exceeded = metrics.counter("request_deadline_exceeded_total", "Work stopped because its request deadline passed or its client left")
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+_SELECT = re.compile(r"^\s*SELECT\s", re.IGNORECASE)
+_MYSQL_MAX_EXECUTION_TIME_EXCEEDED = 3024
+
+
+def remaining() -> Optional[float]:
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@contextmanager
+def deadline_scope(timeout: float) -> Iterator[None]:
+    token = _deadline.set(time.monotonic() + timeout)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def record_exceeded(stage: str) -> None:
+    _exceeded.inc(stage=stage)
+
+
+def _interrupt(state: dict) -> None:
+    # Runs on the event loop while the statement runs on the driver's thread; sqlite3's interrupt is thread-safe.
+    if not state["active"]:
+        return
+    state["interrupted"] = True
+    try:
+        state["connection"].interrupt()
+    except Exception:
+        pass
+
+
+def enforce_statement_deadlines(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+    dialect = sync_engine.dialect.name
+
+    @event.listens_for(sync_engine, "before_cursor_execute", retval=True)
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        left = remaining()
+        if left is None:
+            return statement, parameters
+        if left <= 0:
+            record_exceeded("before_statement")
+            raise DeadlineExceededException("Request deadline exceeded before the statement was sent")
+        if dialect == "mysql" and _SELECT.match(statement):
+            # The server stops the SELECT itself, even when the client has already gone.
+            # MySQL offers no equivalent for writes, which rely on the request being cancelled.
+            statement = _SELECT.sub(f"SELECT /*+ MAX_EXECUTION_TIME({max(1, int(left * 1000))}) */ ", statement, count=1)
+        elif dialect == "sqlite" and context is not None:
+            # aiosqlite's own interrupt() would queue behind the running statement on its worker thread.
+            state = {"connection": conn.connection.driver_connection._conn, "active": True, "interrupted": False}
+            state["handle"] = asyncio.get_running_loop().call_later(left, _interrupt, state)
+            context._deadline_state = state
+        return statement, parameters
+
+    def _disarm(context) -> Optional[dict]:
+        state = getattr(context, "_deadline_state", None)
+        if state is not None:
+            state["active"] = False
+            state["handle"].cancel()
+        return state
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        _disarm(context)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        state = _disarm(exception_context.execution_context)
+        original = exception_context.original_exception
+        timed_out = (state is not None and state["interrupted"]) or (
+            dialect == "mysql" and getattr(original, "args", None) and original.args[0] == _MYSQL_MAX_EXECUTION_TIME_EXCEEDED
+        )
+        if timed_out:
+            record_exceeded("statement")
+            return DeadlineExceededException("Statement interrupted at the request deadline")
+        return None
@@ -9,3 +9,43 @@ class DatabaseConnectionException(DatabaseException):
 class DatabaseTransactionException(DatabaseException):
     pass
 
+
+class CrossShardWriteException(DatabaseTransactionException):
+    pass
+
+
+class DeadlineExceededException(Exception):
+    pass
+
+
+
+class JobException(Exception):
+    pass
+
+
+class JobNotFoundException(JobException):
+    pass
+
+
+class InvalidJobException(JobException):
+    pass
+
+
+class JobNotFinishedException(JobException):
+    pass
+
+
+class ProfilingException(Exception):
+    pass
+
+
+class ProfileNotFoundException(ProfilingException):
+    pass
+
+
+class ProfilerBusyException(ProfilingException):
+    pass
+
+
+class TracemallocNotRunningException(ProfilingException):
+    pass
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from src.infrastructure.database.base import Database
+from src.infrastructure.logger import logger
+from src.infrastructure.metrics import metrics
+
+_up_gauge = metrics.gauge("database_health_up", "Whether the last background database check succeeded")
+_latency_gauge = metrics.gauge("database_health_latency_seconds", "Round trip of the last background database check")
+
+
+@dataclass
+class HealthSample:
+    database_ok: bool
+    latency: Optional[float]
+    error: Optional[str]
+    pool_saturated: bool
+    checked_at: float
+
+
+class HealthSampler:
+    def __init__(
+        self,
+        database: Database,
+        request_engine: AsyncEngine,
+        interval: float,
+        timeout: float,
+        stale_after: float,
+    ) -> None:
+        # Its own single-connection database, so probes neither take a request connection nor queue behind them.
+        self._database = database
+        self._request_engine = request_engine
+        self._interval = interval
+        self._timeout = timeout
+        self._stale_after = stale_after
+        self._task: Optional[asyncio.Task] = None
+        self.sample: Optional[HealthSample] = None
+        _up_gauge.set_function(lambda: 1.0 if self.sample is not None and self.sample.database_ok else 0.0)
+        _latency_gauge.set_function(lambda: (self.sample.latency or 0.0) if self.sample is not None else 0.0)
+
+    def _pool_saturated(self) -> bool:
+        pool = self._request_engine.pool
+        if not isinstance(pool, QueuePool):
+            return False
+        return pool.checkedout() >= pool.size() + max(pool._max_overflow, 0)
+
+    async def check(self) -> HealthSample:
+        started = time.perf_counter()
+        latency = error = None
+        try:
+            async with asyncio.timeout(self._timeout):
+                async with self._database.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            latency = time.perf_counter() - started
+        except TimeoutError:
+            error = f"no answer within {self._timeout:g}s"
+        except Exception as e:
+            error = str(e)
+        if error is not None and (self.sample is None or self.sample.database_ok):
+            logger.warning(f"Database health check failed: {error}")
+        self.sample = HealthSample(
+            database_ok=error is None,
+            latency=latency,
+            error=error,
+            pool_saturated=self._pool_saturated(),
+            checked_at=time.monotonic(),
+        )
+        return self.sample
+
+    def readiness(self, shedding: bool = False) -> Tuple[bool, Dict[str, Any]]:
+        sample = self.sample
+        fresh = sample is not None and time.monotonic() - sample.checked_at <= self._stale_after
+        checks = {
+            "database": "ok" if fresh and sample.database_ok else ("stale" if sample is not None and not fresh else "down"),
+            "database_latency_ms": round(sample.latency * 1000, 2) if sample is not None and sample.latency is not None else None,
+            "pool": "saturated" if sample is not None and sample.pool_saturated else "ok",
+            "load": "shedding" if shedding else "ok",
+        }
+        ready = checks["database"] == "ok" and checks["pool"] == "ok" and not shedding
+        return ready, checks
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._database.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.check()
+            except Exception as e:
+                logger.error(f"Health sampling failed: {str(e)}", exc_info=True)
+            await asyncio.sleep(self._interval)
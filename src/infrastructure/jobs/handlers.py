@@ -0,0 +1,63 @@
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, List
+from uuid import UUID
+
+from src.application.dto.user_dto import UserDTO
+from src.application.use_cases.set_users_status import SetUsersStatusUseCase
+from src.domain.repositories.user_repository import UserFilter, normalize_fields
+from src.infrastructure.config import settings
+from src.infrastructure.constants import BulkConstants, JobConstants
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.jobs.runner import JobContext, JobHandler
+from src.infrastructure.repositories.user_repository_impl import SQLAlchemyUserRepository
+
+
+async def export_users(ctx: JobContext) -> List[dict]:
+    batch_size = int(ctx.params.get("batch_size", JobConstants.DEFAULT_BATCH_SIZE))
+    fields = ctx.params.get("fields")
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    fields = normalize_fields(fields) if fields else None
+    exported: List[dict] = []
+    async with ctx.database.session_factory() as session:
+        repo = SQLAlchemyUserRepository(session, cached_statements=settings.database_cached_statements)
+        total = await repo.count()
+        while True:
+            if fields is not None:
+                users = await repo.get_all_projected(fields, skip=len(exported), limit=batch_size)
+                exported.extend(users)
+            else:
+                users = await repo.get_all(skip=len(exported), limit=batch_size)
+                exported.extend(asdict(UserDTO.from_entity(u)) for u in users)
+            await ctx.report_progress(len(exported) / total if total else 1.0, message=f"Exported {len(exported)} of {total}")
+            if len(users) < batch_size:
+                break
+            # Release the snapshot between batches so a long export does not pin old row versions.
+            await session.rollback()
+    return exported
+
+
+async def set_users_status(ctx: JobContext) -> dict:
+    params = ctx.params
+    user_filter = UserFilter(
+        ids=tuple(UUID(i) for i in params["ids"]) if params.get("ids") is not None else None,
+        created_before=datetime.fromisoformat(params["created_before"]) if params.get("created_before") else None,
+        email_domain=params.get("email_domain"),
+    )
+    async with ctx.database.session_factory() as session:
+        async with SQLAlchemyUnitOfWork(session, SQLAlchemyUserRepository(session, cached_statements=settings.database_cached_statements), record_events=settings.outbox_enabled) as uow:
+            affected = await SetUsersStatusUseCase(uow).execute(
+                user_filter,
+                is_active=bool(params["is_active"]),
+                batch_size=int(params.get("batch_size", BulkConstants.DEFAULT_BATCH_SIZE)),
+            )
+    return {"affected": affected}
+
+
+def default_handlers() -> Dict[str, JobHandler]:
+    return {
+        "users.export": JobHandler(export_users),
+        # Re-running only touches rows not yet in the target state, so an interrupted run can simply start over.
+        "users.set_status": JobHandler(set_users_status, resumable=True),
+    }
@@ -0,0 +1,56 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from src.infrastructure.database.models.job_model import JobModel
+
+
+class JobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+@dataclass
+class JobRecord:
+    id: UUID
+    type: str
+    status: str
+    params: dict
+    progress: float
+    message: Optional[str]
+    error: Optional[str]
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    @property
+    def finished(self) -> bool:
+        return self.status in JobStatus.FINISHED
+
+    @classmethod
+    def from_model(cls, model: JobModel) -> "JobRecord":
+        return cls(
+            id=UUID(model.id),
+            type=model.type,
+            status=model.status,
+            params=json.loads(model.params),
+            progress=model.progress,
+            message=model.message,
+            error=model.error,
+            attempts=model.attempts,
+            created_at=model.created_at,
+            started_at=model.started_at,
+            finished_at=model.finished_at,
+        )
+
+
+def dump_json(value: Any) -> str:
+    return json.dumps(value, default=str)
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import os
+import socket
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, update
+
+from src.infrastructure.database.base import Database, acquire_write_lock
+from src.infrastructure.database.models.job_model import JobModel
+from src.infrastructure.exceptions import InvalidJobException, JobNotFinishedException, JobNotFoundException
+from src.infrastructure.jobs.job import JobRecord, JobStatus, dump_json
+from src.infrastructure.logger import logger
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class JobContext:
+    def __init__(self, runner: "JobRunner", job_id: UUID, params: dict, checkpoint: Optional[dict]) -> None:
+        self._runner = runner
+        self.job_id = job_id
+        self.params = params
+        self.checkpoint = checkpoint
+
+    @property
+    def database(self) -> Database:
+        return self._runner.database
+
+    async def report_progress(self, progress: float, message: Optional[str] = None, checkpoint: Optional[dict] = None) -> None:
+        values: Dict[str, Any] = {"progress": min(max(progress, 0.0), 1.0), "heartbeat_at": _utcnow()}
+        if message is not None:
+            values["message"] = message[:255]
+        if checkpoint is not None:
+            self.checkpoint = checkpoint
+            values["checkpoint"] = dump_json(checkpoint)
+        await self._runner._update(self.job_id, **values)
+
+
+@dataclass
+class JobHandler:
+    run: Callable[[JobContext], Awaitable[Any]]
+    resumable: bool = False
+
+
+class JobRunner:
+    def __init__(
+        self,
+        database: Database,
+        handlers: Dict[str, JobHandler],
+        workers: int = 2,
+        poll_interval: float = 5.0,
+        heartbeat_interval: float = 10.0,
+    ) -> None:
+        self.database = database
+        self._handlers = handlers
+        self._workers = max(1, workers)
+        self._poll_interval = poll_interval
+        self._heartbeat_interval = heartbeat_interval
+        self._owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._queue: asyncio.Queue[UUID] = asyncio.Queue()
+        self._queued: set[UUID] = set()
+        self._running: Dict[UUID, asyncio.Task] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._stopping = False
+
+    async def start(self) -> None:
+        await self._recover()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
+        self._tasks.append(asyncio.create_task(self._heartbeat()))
+        logger.info(f"Job runner started with {self._workers} workers")
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for task in list(self._running.values()):
+            task.cancel()
+        await asyncio.gather(*self._running.values(), return_exceptions=True)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def submit(self, job_type: str, params: Optional[dict] = None) -> JobRecord:
+        if job_type not in self._handlers:
+            raise InvalidJobException(f"Unknown job type: {job_type}")
+        model = JobModel(
+            id=str(uuid4()),
+            type=job_type,
+            status=JobStatus.PENDING,
+            params=dump_json(params or {}),
+            progress=0.0,
+            cancel_requested=False,
+            attempts=0,
+            created_at=_utcnow(),
+        )
+        async with self.database.session_factory() as session:
+            await acquire_write_lock(session)
+            session.add(model)
+            await session.commit()
+            record = JobRecord.from_model(model)
+        self._enqueue(record.id)
+        return record
+
+    async def get(self, job_id: UUID) -> JobRecord:
+        return JobRecord.from_model(await self._load(job_id))
+
+    async def get_result(self, job_id: UUID) -> Any:
+        model = await self._load(job_id)
+        if model.status != JobStatus.SUCCEEDED:
+            raise JobNotFinishedException(f"Job {job_id} has no result (status: {model.status})")
+        return json.loads(model.result) if model.result is not None else None
+
+    async def cancel(self, job_id: UUID) -> JobRecord:
+        model = await self._load(job_id)
+        if model.status in JobStatus.FINISHED:
+            return JobRecord.from_model(model)
+        await self._update(job_id, cancel_requested=True)
+        # Pending jobs are cancelled here; running ones are cancelled by whichever process owns them.
+        await self._transition(job_id, JobStatus.PENDING, status=JobStatus.CANCELLED, finished_at=_utcnow())
+        task = self._running.get(job_id)
+        if task is not None:
+            task.cancel()
+        return await self.get(job_id)
+
+    async def _load(self, job_id: UUID) -> JobModel:
+        async with self.database.session_factory() as session:
+            model = await session.get(JobModel, str(job_id))
+        if model is None:
+            raise JobNotFoundException(f"Job with id {job_id} not found")
+        return model
+
+    async def _update(self, job_id: UUID, **values: Any) -> None:
+        async with self.database.session_factory() as session:
+            await acquire_write_lock(session)
+            await session.execute(update(JobModel).where(JobModel.id == str(job_id)).values(**values))
+            await session.commit()
+
+    async def _transition(self, job_id: UUID, from_status: str, **values: Any) -> bool:
+        async with self.database.session_factory() as session:
+            await acquire_write_lock(session)
+            result = await session.execute(
+                update(JobModel).where(JobModel.id == str(job_id), JobModel.status == from_status).values(**values)
+            )
+            await session.commit()
+            return result.rowcount == 1
+
+    async def _recover(self) -> None:
+        stale_before = _utcnow() - timedelta(seconds=self._heartbeat_interval * 3)
+        async with self.database.session_factory() as session:
+            result = await session.execute(
+                select(JobModel.id, JobModel.type).where(
+                    JobModel.status == JobStatus.RUNNING,
+                    (JobModel.heartbeat_at.is_(None)) | (JobModel.heartbeat_at < stale_before),
+                )
+            )
+            orphaned = result.all()
+        for job_id, job_type in orphaned:
+            handler = self._handlers.get(job_type)
+            if handler is not None and handler.resumable:
+                await self._transition(UUID(job_id), JobStatus.RUNNING, status=JobStatus.PENDING, owner=None)
+                logger.info(f"Job {job_id} interrupted by restart, resuming")
+            else:
+                await self._transition(
+                    UUID(job_id),
+                    JobStatus.RUNNING,
+                    status=JobStatus.FAILED,
+                    error="Interrupted by restart",
+                    finished_at=_utcnow(),
+                )
+                logger.warning(f"Job {job_id} interrupted by restart, marked failed")
+
+    async def _pending_ids(self) -> list[UUID]:
+        async with self.database.session_factory() as session:
+            result = await session.execute(
+                select(JobModel.id).where(JobModel.status == JobStatus.PENDING).order_by(JobModel.created_at).limit(100)
+            )
+            return [UUID(job_id) for job_id in result.scalars()]
+
+    def _enqueue(self, job_id: UUID) -> None:
+        if job_id not in self._queued:
+            self._queued.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                job_id = await asyncio.wait_for(self._queue.get(), timeout=self._poll_interval)
+            except asyncio.TimeoutError:
+                # Picks up jobs submitted by other processes and those left pending by a restart.
+                try:
+                    await self._recover()
+                    for pending_id in await self._pending_ids():
+                        self._enqueue(pending_id)
+                except Exception as e:
+                    logger.error(f"Job poll failed: {str(e)}", exc_info=True)
+                continue
+            self._queued.discard(job_id)
+            try:
+                await self._claim_and_run(job_id)
+            except Exception as e:
+                logger.error(f"Job {job_id} crashed the worker loop: {str(e)}", exc_info=True)
+
+    async def _claim_and_run(self, job_id: UUID) -> None:
+        claimed = await self._transition(
+            job_id,
+            JobStatus.PENDING,
+            status=JobStatus.RUNNING,
+            owner=self._owner,
+            started_at=_utcnow(),
+            heartbeat_at=_utcnow(),
+            attempts=JobModel.attempts + 1,
+        )
+        if not claimed:
+            return
+        model = await self._load(job_id)
+        handler = self._handlers[model.type]
+        checkpoint = json.loads(model.checkpoint) if model.checkpoint else None
+        context = JobContext(self, job_id, json.loads(model.params), checkpoint)
+        task = asyncio.create_task(self._execute(job_id, handler, context))
+        self._running[job_id] = task
+        try:
+            await task
+        finally:
+            self._running.pop(job_id, None)
+
+    async def _execute(self, job_id: UUID, handler: JobHandler, context: JobContext) -> None:
+        try:
+            result = await handler.run(context)
+        except asyncio.CancelledError:
+            if self._stopping and handler.resumable:
+                await self._transition(job_id, JobStatus.RUNNING, status=JobStatus.PENDING, owner=None)
+            elif self._stopping:
+                await self._transition(job_id, JobStatus.RUNNING, status=JobStatus.FAILED, error="Interrupted by shutdown", finished_at=_utcnow())
+            else:
+                await self._transition(job_id, JobStatus.RUNNING, status=JobStatus.CANCELLED, finished_at=_utcnow())
+            logger.info(f"Job {job_id} stopped before completion")
+            if self._stopping:
+                raise
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {str(e)}", exc_info=True)
+            await self._transition(job_id, JobStatus.RUNNING, status=JobStatus.FAILED, error=str(e), finished_at=_utcnow())
+        else:
+            await self._transition(
+                job_id,
+                JobStatus.RUNNING,
+                status=JobStatus.SUCCEEDED,
+                progress=1.0,
+                result=dump_json(result),
+                finished_at=_utcnow(),
+            )
+            logger.info(f"Job {job_id} succeeded")
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            if not self._running:
+                continue
+            try:
+                async with self.database.session_factory() as session:
+                    await acquire_write_lock(session)
+                    ids = [str(job_id) for job_id in self._running]
+                    await session.execute(update(JobModel).where(JobModel.id.in_(ids)).values(heartbeat_at=_utcnow()))
+                    result = await session.execute(
+                        select(JobModel.id).where(JobModel.id.in_(ids), JobModel.cancel_requested.is_(True))
+                    )
+                    cancelled = [UUID(job_id) for job_id in result.scalars()]
+                    await session.commit()
+                for job_id in cancelled:
+                    task = self._running.get(job_id)
+                    if task is not None:
+                        task.cancel()
+            except Exception as e:
+                logger.error(f"Job heartbeat failed: {str(e)}", exc_info=True)
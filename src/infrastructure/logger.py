@@ -1,8 +1,11 @@
 import logging
 import sys
+from contextvars import ContextVar
 
 from src.infrastructure.config import settings
 
+request_id_context: ContextVar[str] = ContextVar("request_id", default="N/A")
+
 
 def setup_logger(name: str = "test_api") -> logging.Logger:
     log = logging.getLogger(name)
@@ -28,7 +31,8 @@ def setup_logger(name: str = "test_api") -> logging.Logger:
 
 class RequestIDFilter(logging.Filter):
     def filter(self, record):
-        record.request_id = getattr(record, "request_id", "N/A")
+        # Records logged without an explicit request_id (e.g. from deep in a call stack) still carry the current one.
+        record.request_id = getattr(record, "request_id", None) or request_id_context.get()
         return True
 
 
@@ -0,0 +1,91 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from src.infrastructure.constants import LoopMonitorConstants
+from src.infrastructure.logger import logger
+from src.infrastructure.metrics import metrics
+
+_lag_histogram = metrics.histogram(
+    "event_loop_lag_seconds",
+    "Delay between when a loop timer was due and when it ran",
+    LoopMonitorConstants.LAG_BUCKETS,
+)
+_blocked_counter = metrics.counter("event_loop_blocked_total", "Loop stalls longer than the block threshold")
+
+
+class LoopMonitor:
+    def __init__(self, interval: float, block_threshold: float, debug: bool = False) -> None:
+        self._interval = interval
+        self._block_threshold = block_threshold
+        self._debug = debug
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._last_tick = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        if self._debug:
+            # asyncio then logs every callback slower than the threshold, naming its task and so the request.
+            # Debug mode slows the loop down itself; meant for staging.
+            self._loop.set_debug(True)
+            self._loop.slow_callback_duration = self._block_threshold or LoopMonitorConstants.DEFAULT_BLOCK_THRESHOLD_MS / 1000
+        self._last_tick = time.monotonic()
+        self._task = asyncio.create_task(self._run(), name="loop-monitor")
+        if self._block_threshold > 0:
+            self._stopping.clear()
+            self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+        if self._debug and self._loop is not None:
+            self._loop.set_debug(False)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            _lag_histogram.observe(max(0.0, loop.time() - due))
+            self._last_tick = time.monotonic()
+
+    def _watch(self) -> None:
+        reported_tick = None
+        # Checking at a fraction of the threshold bounds how late a stall is noticed.
+        while not self._stopping.wait(self._block_threshold / 4):
+            last_tick = self._last_tick
+            stalled = time.monotonic() - last_tick - self._interval
+            if stalled < self._block_threshold or reported_tick == last_tick:
+                continue
+            # One report per stall, with the stack the loop is stuck in right now.
+            reported_tick = last_tick
+            _blocked_counter.inc()
+            self._report(stalled)
+
+    def _report(self, stalled: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = "".join(traceback.format_stack(frame, limit=LoopMonitorConstants.STACK_LIMIT)) if frame is not None else ""
+        task = asyncio.current_task(self._loop)
+        task_name = task.get_name() if task is not None else "no task"
+        req_id = "N/A"
+        if task_name.startswith(LoopMonitorConstants.REQUEST_TASK_PREFIX):
+            req_id = task_name[len(LoopMonitorConstants.REQUEST_TASK_PREFIX):]
+        logger.warning(
+            f"Event loop blocked for {stalled * 1000:.0f} ms in {task_name}:\n{stack}",
+            extra={"request_id": req_id},
+        )
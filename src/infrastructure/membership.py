@@ -0,0 +1,179 @@
+import asyncio
+import hashlib
+import json
+import math
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.domain.events import UserEventType
+from src.infrastructure.database.base import Database
+from src.infrastructure.logger import logger
+from src.infrastructure.metrics import metrics
+from src.infrastructure.outbox.relay import OutboxEvent, OutboxRelay
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserStore
+
+KeyScan = Callable[[], AsyncIterator[Tuple[str, str]]]
+
+_checks = metrics.counter("availability_filter_checks_total", "Availability filter lookups by field and outcome")
+_rebuilds = metrics.counter("availability_filter_rebuilds_total", "Availability filter rebuilds from a full scan")
+_entries = metrics.gauge("availability_filter_entries", "Keys added to the availability filter since its last rebuild")
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> List[int]:
+        # Double hashing: k positions from one digest instead of k hash functions.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+def database_key_scan(database: Database, email: InstrumentedAttribute, username: InstrumentedAttribute, batch_size: int) -> KeyScan:
+    async def scan() -> AsyncIterator[Tuple[str, str]]:
+        async with database.session_factory() as session:
+            result = await session.stream(select(email, username).execution_options(yield_per=batch_size))
+            async for row in result:
+                yield row[0], row[1]
+
+    return scan
+
+
+def memory_key_scan(store: InMemoryUserStore) -> KeyScan:
+    async def scan() -> AsyncIterator[Tuple[str, str]]:
+        for user in list(store.by_id.values()):
+            yield user.email, user.username
+
+    return scan
+
+
+class UserAvailabilityIndex:
+    def __init__(self, scan: KeyScan, capacity: int, error_rate: float, rebuild_interval: float) -> None:
+        self._scan = scan
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._rebuild_interval = rebuild_interval
+        self._emails: Optional[BloomFilter] = None
+        self._usernames: Optional[BloomFilter] = None
+        # Keys added while a rebuild scans, replayed into the new filters before they are swapped in.
+        self._pending: Optional[List[Tuple[str, str]]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._rebuild_task: Optional[asyncio.Task] = None
+        _entries.set_function(lambda: self._emails.count if self._emails else 0)
+
+    @property
+    def ready(self) -> bool:
+        return self._emails is not None
+
+    def may_contain_email(self, email: str) -> bool:
+        return self._check("email", self._emails, email.lower().strip())
+
+    def may_contain_username(self, username: str) -> bool:
+        return self._check("username", self._usernames, username.strip())
+
+    @staticmethod
+    def _check(field: str, bloom: Optional[BloomFilter], key: str) -> bool:
+        # Until the first scan finishes every key is a possible positive.
+        if bloom is None:
+            return True
+        found = key in bloom
+        _checks.inc(field=field, result="positive" if found else "negative")
+        return found
+
+    def add(self, email: str, username: str) -> None:
+        email, username = email.lower().strip(), username.strip()
+        if self._pending is not None:
+            self._pending.append((email, username))
+        if self._emails is None or self._usernames is None:
+            return
+        self._emails.add(email)
+        self._usernames.add(username)
+        if self._emails.count > self._emails.capacity and self._pending is None:
+            # Past capacity the false-positive rate climbs; rebuild at a size that fits again.
+            self._rebuild_task = asyncio.create_task(self._rebuild_safely())
+
+    def observe(self, event: OutboxEvent) -> None:
+        if event.type in (UserEventType.CREATED, UserEventType.UPDATED):
+            payload = json.loads(event.payload)
+            self.add(payload["email"], payload["username"])
+
+    async def rebuild(self) -> None:
+        if self._pending is not None:
+            return
+        self._pending = []
+        try:
+            capacity = max(self._capacity, 2 * (self._emails.count if self._emails else 0))
+            emails = BloomFilter(capacity, self._error_rate)
+            usernames = BloomFilter(capacity, self._error_rate)
+            async for email, username in self._scan():
+                emails.add(email)
+                usernames.add(username)
+            for email, username in self._pending:
+                emails.add(email)
+                usernames.add(username)
+            self._emails, self._usernames = emails, usernames
+        finally:
+            self._pending = None
+        _rebuilds.inc()
+        logger.info(f"Availability filter rebuilt with {emails.count} users (capacity {capacity})")
+        if emails.count > capacity:
+            await self.rebuild()
+
+    async def _rebuild_safely(self) -> None:
+        try:
+            await self.rebuild()
+        except Exception as e:
+            logger.error(f"Availability filter rebuild failed: {str(e)}", exc_info=True)
+
+    def start(self, relay: Optional[OutboxRelay] = None) -> None:
+        self._task = asyncio.create_task(self._run(relay))
+
+    async def stop(self) -> None:
+        for task in (self._task, self._rebuild_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._task = self._rebuild_task = None
+
+    async def _run(self, relay: Optional[OutboxRelay]) -> None:
+        # Commits in this process are added by the use cases; the relay carries every other worker's.
+        # Deleted or renamed users stay in the filter as false positives until the periodic rebuild.
+        loop = asyncio.get_running_loop()
+        # Subscribing before the scan means nothing committed while it runs is missed.
+        subscription = relay.subscribe() if relay is not None else None
+        try:
+            while True:
+                await self._rebuild_safely()
+                deadline = loop.time() + self._rebuild_interval
+                while (remaining := deadline - loop.time()) > 0:
+                    if subscription is None:
+                        await asyncio.sleep(remaining)
+                        continue
+                    try:
+                        event = await subscription.get(timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if event is None:
+                        # Dropped for falling behind: events were lost, so start again from a scan.
+                        subscription = relay.subscribe()
+                        break
+                    self.observe(event)
+        finally:
+            if subscription is not None:
+                relay.unsubscribe(subscription)
@@ -0,0 +1,160 @@
+import asyncio
+import gc
+import os
+import resource
+import threading
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from src.infrastructure.exceptions import TracemallocNotRunningException
+from src.infrastructure.logger import logger
+from src.infrastructure.metrics import metrics
+
+_rss_gauge = metrics.gauge("process_resident_memory_bytes", "Resident set size of this worker")
+_gc_pending_gauge = metrics.gauge("python_gc_pending_objects", "Allocations since the last collection, per generation")
+_gc_collections_gauge = metrics.gauge("python_gc_collections", "Collections run since start, per generation")
+_gc_collected_gauge = metrics.gauge("python_gc_collected_objects", "Objects freed by the collector since start, per generation")
+_live_objects_gauge = metrics.gauge("python_live_objects", "Live instances of tracked types at the last memory scan")
+_traced_gauge = metrics.gauge("python_tracemalloc_traced_bytes", "Memory traced by tracemalloc, 0 while it is off")
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+# Allocations made by tracemalloc and the import system only add noise to the report.
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def read_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        # Peak rather than current RSS, but the best portable answer; ru_maxrss is KiB on Linux.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def register_process_gauges() -> None:
+    _rss_gauge.set_function(read_rss_bytes)
+    _traced_gauge.set_function(lambda: tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0)
+    for generation in range(3):
+        _gc_pending_gauge.set_function(lambda g=generation: gc.get_count()[g], generation=str(generation))
+        _gc_collections_gauge.set_function(lambda g=generation: gc.get_stats()[g]["collections"], generation=str(generation))
+        _gc_collected_gauge.set_function(lambda g=generation: gc.get_stats()[g]["collected"], generation=str(generation))
+
+
+class MemoryMonitor:
+    def __init__(self, tracked_types: Dict[str, type], interval: float) -> None:
+        self._tracked_types = tracked_types
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.scan()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def scan(self) -> Dict[str, int]:
+        # Walks every GC-tracked object, so it runs on an interval rather than on each scrape.
+        by_type = {t: name for name, t in self._tracked_types.items()}
+        counts = dict.fromkeys(self._tracked_types, 0)
+        for obj in gc.get_objects():
+            name = by_type.get(type(obj))
+            if name is not None:
+                counts[name] += 1
+        for name, count in counts.items():
+            _live_objects_gauge.set(count, type=name)
+        return counts
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                self.scan()
+            except Exception as e:
+                logger.error(f"Memory scan failed: {str(e)}", exc_info=True)
+
+
+@dataclass
+class AllocationStat:
+    location: str
+    size_bytes: int
+    count: int
+    size_diff_bytes: Optional[int] = None
+    count_diff: Optional[int] = None
+
+
+@dataclass
+class MemorySnapshotReport:
+    traced_current_bytes: int
+    traced_peak_bytes: int
+    rss_bytes: int
+    group_by: str
+    top: List[AllocationStat]
+    diff: Optional[List[AllocationStat]]
+
+
+class TracemallocSnapshots:
+    def __init__(self) -> None:
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self._previous = None
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self._previous = None
+
+    def snapshot(self, group_by: str, limit: int) -> MemorySnapshotReport:
+        # Blocking and CPU heavy on large heaps; callers run it off the event loop.
+        if not tracemalloc.is_tracing():
+            raise TracemallocNotRunningException("tracemalloc is not running; start it first")
+        with self._lock:
+            current = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            top = [
+                AllocationStat(location=_location(stat.traceback, group_by), size_bytes=stat.size, count=stat.count)
+                for stat in current.statistics(group_by)[:limit]
+            ]
+            diff = None
+            if self._previous is not None:
+                diff = [
+                    AllocationStat(
+                        location=_location(stat.traceback, group_by),
+                        size_bytes=stat.size,
+                        count=stat.count,
+                        size_diff_bytes=stat.size_diff,
+                        count_diff=stat.count_diff,
+                    )
+                    for stat in current.compare_to(self._previous, group_by)[:limit]
+                ]
+            self._previous = current
+        traced_current, traced_peak = tracemalloc.get_traced_memory()
+        return MemorySnapshotReport(
+            traced_current_bytes=traced_current,
+            traced_peak_bytes=traced_peak,
+            rss_bytes=read_rss_bytes(),
+            group_by=group_by,
+            top=top,
+            diff=diff,
+        )
+
+
+def _location(traceback: tracemalloc.Traceback, group_by: str) -> str:
+    if group_by == "filename":
+        return traceback[0].filename
+    return " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in traceback)
@@ -0,0 +1,127 @@
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        for key, value in list(self._values.items()):
+            yield f"{self.name}{_format_labels(key)} {value}"
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._callbacks: Dict[LabelKey, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[_label_key(labels)] = value
+
+    def set_function(self, fn: Callable[[], float], **labels: str) -> None:
+        self._callbacks[_label_key(labels)] = fn
+
+    def value(self, **labels: str) -> float:
+        key = _label_key(labels)
+        if key in self._callbacks:
+            return self._callbacks[key]()
+        return self._values.get(key, 0.0)
+
+    def samples(self) -> Iterable[str]:
+        for key, value in list(self._values.items()):
+            yield f"{self.name}{_format_labels(key)} {value}"
+        for key, fn in list(self._callbacks.items()):
+            yield f"{self.name}{_format_labels(key)} {fn()}"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: List[float]) -> None:
+        self.name = name
+        self.help = help_text
+        self.buckets = sorted(buckets)
+        self._counts: Dict[LabelKey, List[int]] = {}
+        self._sums: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def samples(self) -> Iterable[str]:
+        for key, counts in list(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(key, ('le', str(bound)))} {cumulative}"
+            cumulative += counts[-1]
+            yield f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(key)} {self._sums[key]}"
+            yield f"{self.name}_count{_format_labels(key)} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Counter | Gauge | Histogram] = {}
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._register(name, lambda: Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._register(name, lambda: Gauge(name, help_text))
+
+    def histogram(self, name: str, help_text: str, buckets: List[float]) -> Histogram:
+        return self._register(name, lambda: Histogram(name, help_text, buckets))
+
+    def _register(self, name: str, factory):
+        if name not in self._metrics:
+            self._metrics[name] = factory()
+        return self._metrics[name]
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,179 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import delete, func, select
+
+from src.infrastructure.database.base import Database, acquire_write_lock
+from src.infrastructure.database.models.outbox_model import OutboxEventModel
+from src.infrastructure.logger import logger
+from src.infrastructure.metrics import metrics
+
+_published = metrics.counter("outbox_events_published_total", "Outbox events fanned out to subscribers")
+_dropped = metrics.counter("outbox_subscribers_dropped_total", "Event stream subscribers disconnected for falling behind")
+_subscribers_gauge = metrics.gauge("outbox_subscribers", "Open event stream subscriptions")
+
+
+@dataclass(frozen=True)
+class OutboxEvent:
+    id: int
+    type: str
+    aggregate_id: str
+    payload: str
+    created_at: datetime
+
+    @classmethod
+    def from_model(cls, model: OutboxEventModel) -> "OutboxEvent":
+        return cls(
+            id=model.id,
+            type=model.event_type,
+            aggregate_id=model.aggregate_id,
+            payload=model.payload,
+            created_at=model.created_at,
+        )
+
+
+class Subscription:
+    def __init__(self, max_queue_size: int) -> None:
+        self._queue: asyncio.Queue[Optional[OutboxEvent]] = asyncio.Queue(max_queue_size)
+        self.closed = False
+
+    async def get(self, timeout: float) -> Optional[OutboxEvent]:
+        # None means the subscription was closed; a timeout raises asyncio.TimeoutError.
+        if self.closed and self._queue.empty():
+            return None
+        return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+
+    def _push(self, event: OutboxEvent) -> bool:
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def _close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        database: Database,
+        poll_interval: float = 0.5,
+        batch_size: int = 500,
+        gap_timeout: float = 2.0,
+        retention: timedelta = timedelta(hours=24),
+        purge_interval: float = 300.0,
+        subscriber_queue_size: int = 1000,
+    ) -> None:
+        self._database = database
+        self._poll_interval = poll_interval
+        self._batch_size = batch_size
+        self._gap_timeout = gap_timeout
+        self._retention = retention
+        self._purge_interval = purge_interval
+        self._subscriber_queue_size = subscriber_queue_size
+        self._subscribers: set[Subscription] = set()
+        self._cursor = 0
+        self._gap_since: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        _subscribers_gauge.set_function(lambda: len(self._subscribers))
+
+    @property
+    def cursor(self) -> int:
+        return self._cursor
+
+    async def start(self) -> None:
+        async with self._database.session_factory() as session:
+            result = await session.execute(select(func.max(OutboxEventModel.id)))
+            self._cursor = result.scalar_one() or 0
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Outbox relay started at event {self._cursor}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for subscription in list(self._subscribers):
+            self.unsubscribe(subscription)
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self._subscriber_queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+        subscription._close()
+
+    async def replay(self, after_id: int, limit: int) -> List[OutboxEvent]:
+        # Bounded by the relay cursor so replayed and live events meet without a gap.
+        async with self._database.session_factory() as session:
+            result = await session.execute(
+                select(OutboxEventModel)
+                .where(OutboxEventModel.id > after_id, OutboxEventModel.id <= self._cursor)
+                .order_by(OutboxEventModel.id)
+                .limit(limit)
+            )
+            return [OutboxEvent.from_model(m) for m in result.scalars()]
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_purge = loop.time() + self._purge_interval
+        while True:
+            try:
+                more = await self._poll()
+                if loop.time() >= next_purge:
+                    next_purge = loop.time() + self._purge_interval
+                    await self._purge()
+            except Exception as e:
+                logger.error(f"Outbox relay poll failed: {str(e)}", exc_info=True)
+                more = False
+            if not more:
+                await asyncio.sleep(self._poll_interval)
+
+    async def _poll(self) -> bool:
+        async with self._database.session_factory() as session:
+            result = await session.execute(
+                select(OutboxEventModel)
+                .where(OutboxEventModel.id > self._cursor)
+                .order_by(OutboxEventModel.id)
+                .limit(self._batch_size)
+            )
+            events = [OutboxEvent.from_model(m) for m in result.scalars()]
+        now = asyncio.get_running_loop().time()
+        for event in events:
+            if event.id != self._cursor + 1:
+                # Ids are allocated before commit, so a hole may still be filled by a transaction in flight.
+                if self._gap_since is None:
+                    self._gap_since = now
+                if now - self._gap_since < self._gap_timeout:
+                    return False
+            self._gap_since = None
+            self._publish(event)
+            self._cursor = event.id
+        return len(events) == self._batch_size
+
+    def _publish(self, event: OutboxEvent) -> None:
+        _published.inc()
+        for subscription in list(self._subscribers):
+            if not subscription._push(event):
+                # A consumer this far behind resumes from the table with Last-Event-ID instead.
+                _dropped.inc()
+                self.unsubscribe(subscription)
+
+    async def _purge(self) -> None:
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - self._retention
+        async with self._database.session_factory() as session:
+            await acquire_write_lock(session)
+            result = await session.execute(delete(OutboxEventModel).where(OutboxEventModel.created_at < cutoff))
+            await session.commit()
+        if result.rowcount:
+            logger.info(f"Purged {result.rowcount} outbox events older than {cutoff.isoformat()}")
@@ -0,0 +1,142 @@
+import cProfile
+import io
+import json
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.infrastructure.exceptions import ProfileNotFoundException, ProfilerBusyException
+
+_PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+@dataclass
+class ProfileInfo:
+    id: str
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    created_at: datetime
+
+
+class ProfileStore:
+    def __init__(self, directory: str, max_stored: int) -> None:
+        # On disk rather than in memory, so any worker can serve a profile another worker took.
+        self.directory = Path(directory)
+        self.max_stored = max(1, max_stored)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def save(self, info: ProfileInfo, profiler: cProfile.Profile) -> None:
+        profiler.dump_stats(self.directory / f"{info.id}.prof")
+        meta = {
+            "id": info.id,
+            "method": info.method,
+            "path": info.path,
+            "status_code": info.status_code,
+            "duration_ms": info.duration_ms,
+            "created_at": info.created_at.isoformat(),
+        }
+        (self.directory / f"{info.id}.json").write_text(json.dumps(meta), encoding="utf-8")
+        self._prune()
+
+    def list(self) -> List[ProfileInfo]:
+        infos = []
+        for meta_path in self.directory.glob("*.json"):
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            meta["created_at"] = datetime.fromisoformat(meta["created_at"])
+            infos.append(ProfileInfo(**meta))
+        infos.sort(key=lambda i: i.created_at, reverse=True)
+        return infos
+
+    def path(self, profile_id: str) -> Path:
+        path = self.directory / f"{profile_id}.prof"
+        if not _PROFILE_ID.match(profile_id) or not path.exists():
+            raise ProfileNotFoundException(f"Profile {profile_id} not found")
+        return path
+
+    def report(self, profile_id: str, sort: str = "cumulative", lines: int = 60) -> str:
+        out = io.StringIO()
+        stats = pstats.Stats(str(self.path(profile_id)), stream=out)
+        stats.strip_dirs().sort_stats(sort).print_stats(lines)
+        return out.getvalue()
+
+    def _prune(self) -> None:
+        profiles = sorted(self.directory.glob("*.prof"), key=lambda p: p.stat().st_mtime)
+        for stale in profiles[:-self.max_stored]:
+            stale.unlink(missing_ok=True)
+            stale.with_suffix(".json").unlink(missing_ok=True)
+
+
+class RequestProfiler:
+    def __init__(self, store: ProfileStore) -> None:
+        self.store = store
+        self._active = False
+
+    def start(self) -> Optional[cProfile.Profile]:
+        # cProfile hooks the whole thread, so only one request is profiled at a time;
+        # coroutines of other requests interleaved on the loop still show up in it.
+        if self._active:
+            return None
+        self._active = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def stop(self, profiler: cProfile.Profile) -> None:
+        profiler.disable()
+        self._active = False
+
+
+class StackSampler:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def sample(self, duration: float, interval: float) -> Dict[str, int]:
+        # Blocking; meant to run on its own thread while the event loop keeps serving requests.
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyException("A sampling profile is already running")
+        try:
+            own = threading.get_ident()
+            stacks: Counter = Counter()
+            deadline = time.monotonic() + duration
+            while time.monotonic() < deadline:
+                names = {t.ident: t.name for t in threading.enumerate()}
+                for ident, frame in sys._current_frames().items():
+                    if ident != own:
+                        stacks[_collapse(frame, names.get(ident, f"thread-{ident}"))] += 1
+                time.sleep(interval)
+            return dict(stacks)
+        finally:
+            self._lock.release()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    parts = Path(code.co_filename).parts
+    return f"{code.co_qualname} ({'/'.join(parts[-2:])})"
+
+
+def _collapse(frame, thread_name: str) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+def format_collapsed(stacks: Dict[str, int]) -> str:
+    # Brendan Gregg's folded format, readable by flamegraph.pl, speedscope and inferno.
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+
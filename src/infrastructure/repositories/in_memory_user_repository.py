@@ -0,0 +1,188 @@
+import bisect
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.domain.entities.user import User
+from src.domain.entities.user_tombstone import UserTombstone
+from src.domain.events import UserEvent, UserEventType
+from src.domain.exceptions import UserAlreadyExistsException
+from src.domain.repositories.user_repository import ChangeCursor, UserFilter, UserProjection, UserRepository
+from src.infrastructure.exceptions import DatabaseException
+
+OrderKey = Tuple[datetime, UUID]
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # Mirrors the DateTime columns, which store UTC without tzinfo.
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class InMemoryUserStore:
+    def __init__(self) -> None:
+        self.by_id: Dict[UUID, User] = {}
+        self.by_email: Dict[str, UUID] = {}
+        self.by_username: Dict[str, UUID] = {}
+        self.ordered: List[OrderKey] = []
+        self.tombstones: Dict[UUID, datetime] = {}
+
+    def put(self, user: User) -> None:
+        self.remove(user.id)
+        self.by_id[user.id] = user
+        self.by_email[user.email] = user.id
+        self.by_username[user.username] = user.id
+        bisect.insort(self.ordered, (user.created_at, user.id))
+
+    def remove(self, user_id: UUID) -> Optional[User]:
+        user = self.by_id.pop(user_id, None)
+        if user is None:
+            return None
+        del self.by_email[user.email]
+        del self.by_username[user.username]
+        key = (user.created_at, user.id)
+        index = bisect.bisect_left(self.ordered, key)
+        if index < len(self.ordered) and self.ordered[index] == key:
+            del self.ordered[index]
+        return user
+
+    def conflicts(self, user: User) -> Optional[str]:
+        email_owner = self.by_email.get(user.email)
+        if email_owner is not None and email_owner != user.id:
+            return f"Duplicate entry '{user.email}' for key 'email'"
+        username_owner = self.by_username.get(user.username)
+        if username_owner is not None and username_owner != user.id:
+            return f"Duplicate entry '{user.username}' for key 'username'"
+        return None
+
+    def clear(self) -> None:
+        self.by_id.clear()
+        self.by_email.clear()
+        self.by_username.clear()
+        self.ordered.clear()
+        self.tombstones.clear()
+
+
+class InMemoryUserRepository(UserRepository):
+    def __init__(self, store: InMemoryUserStore, journal: Optional[Dict[UUID, Optional[User]]] = None):
+        self.store = store
+        self.journal = journal if journal is not None else {}
+        self.pending_events: List[UserEvent] = []
+
+    def _touch(self, user_id: UUID) -> None:
+        # First write to a row in this unit of work snapshots its committed state for rollback.
+        if user_id not in self.journal:
+            self.journal[user_id] = self.store.by_id.get(user_id)
+
+    async def create(self, user: User) -> User:
+        stored = replace(user, created_at=_naive_utc(user.created_at), updated_at=_naive_utc(user.updated_at))
+        if stored.id in self.store.by_id:
+            raise DatabaseException(f"Failed to create user: Duplicate entry '{stored.id}' for key 'PRIMARY'")
+        conflict = self.store.conflicts(stored)
+        if conflict:
+            raise UserAlreadyExistsException("User with this email or username already exists")
+        self._touch(stored.id)
+        self.store.put(stored)
+        self.pending_events.append(UserEvent.snapshot(UserEventType.CREATED, stored))
+        return replace(stored)
+
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        user = self.store.by_id.get(user_id)
+        return replace(user) if user else None
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        user_id = self.store.by_email.get(email.lower().strip())
+        return await self.get_by_id(user_id) if user_id else None
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        user_id = self.store.by_username.get(username.strip())
+        return await self.get_by_id(user_id) if user_id else None
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+        end = len(self.store.ordered) - skip
+        if end <= 0 or limit <= 0:
+            return []
+        keys = self.store.ordered[max(0, end - limit):end]
+        return [replace(self.store.by_id[user_id]) for _, user_id in reversed(keys)]
+
+    async def get_projection_by_id(self, user_id: UUID, fields: Tuple[str, ...]) -> Optional[UserProjection]:
+        user = self.store.by_id.get(user_id)
+        return {name: getattr(user, name) for name in fields} if user else None
+
+    async def get_all_projected(self, fields: Tuple[str, ...], skip: int = 0, limit: int = 100) -> List[UserProjection]:
+        return [{name: getattr(user, name) for name in fields} for user in await self.get_all(skip, limit)]
+
+    async def count(self) -> int:
+        return len(self.store.by_id)
+
+    async def update(self, user: User) -> User:
+        current = self.store.by_id.get(user.id)
+        if current is None:
+            return user
+        stored = replace(
+            current,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            updated_at=_naive_utc(user.updated_at),
+        )
+        conflict = self.store.conflicts(stored)
+        if conflict:
+            raise UserAlreadyExistsException("User with this email or username already exists")
+        self._touch(user.id)
+        self.store.put(stored)
+        self.pending_events.append(UserEvent.snapshot(UserEventType.UPDATED, stored))
+        return replace(stored)
+
+    async def delete(self, user_id: UUID) -> bool:
+        if user_id not in self.store.by_id:
+            return False
+        self._touch(user_id)
+        self.store.remove(user_id)
+        self.store.tombstones[user_id] = _naive_utc(datetime.now(timezone.utc))
+        self.pending_events.append(UserEvent.deleted(user_id))
+        return True
+
+    async def set_active_status(self, user_filter: UserFilter, is_active: bool, updated_at: datetime, limit: int) -> List[UUID]:
+        if user_filter.ids is not None:
+            candidates = [self.store.by_id[i] for i in set(user_filter.ids) if i in self.store.by_id]
+        else:
+            candidates = list(self.store.by_id.values())
+        created_before = _naive_utc(user_filter.created_before) if user_filter.created_before else None
+        suffix = f"@{user_filter.email_domain.lower().strip().lstrip('@')}" if user_filter.email_domain is not None else None
+        matched = [
+            u for u in candidates
+            if u.is_active != is_active
+            and (created_before is None or u.created_at < created_before)
+            and (suffix is None or u.email.endswith(suffix))
+        ]
+        # The SQL implementation orders by the CHAR(36) id, i.e. by its string form.
+        matched.sort(key=lambda u: str(u.id))
+        changed = matched[:limit]
+        for user in changed:
+            self._touch(user.id)
+            self.store.put(replace(user, is_active=is_active, updated_at=_naive_utc(updated_at)))
+        self.pending_events.extend(UserEvent.status_changed(u.id, is_active, updated_at) for u in changed)
+        return [u.id for u in changed]
+
+    async def get_changed_since(self, after: Optional[ChangeCursor], until: datetime, limit: int) -> List[User]:
+        changed = _after_cursor(((u.updated_at, u.id, u) for u in self.store.by_id.values()), after, until)
+        return [replace(u) for u in changed[:limit]]
+
+    async def get_deleted_since(self, after: Optional[ChangeCursor], until: datetime, limit: int) -> List[UserTombstone]:
+        deleted = _after_cursor(((ts, i, i) for i, ts in self.store.tombstones.items()), after, until)
+        return [UserTombstone(id=i, deleted_at=self.store.tombstones[i]) for i in deleted[:limit]]
+
+
+def _after_cursor(rows, after: Optional[ChangeCursor], until: datetime) -> list:
+    # Same (timestamp, CHAR(36) id) ordering as the SQL keyset.
+    until = _naive_utc(until)
+    start = (_naive_utc(after[0]), str(after[1])) if after is not None else None
+    keyed = [((ts, str(i)), item) for ts, i, item in rows if ts <= until]
+    if start is not None:
+        keyed = [(k, item) for k, item in keyed if k > start]
+    keyed.sort(key=lambda pair: pair[0])
+    return [item for _, item in keyed]
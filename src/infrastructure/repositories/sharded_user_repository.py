@@ -0,0 +1,143 @@
+import asyncio
+import heapq
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from src.domain.entities.user import User
+from src.domain.entities.user_tombstone import UserTombstone
+from src.domain.events import UserEvent
+from src.domain.repositories.user_repository import (
+    USER_FIELDS,
+    ChangeCursor,
+    UserFilter,
+    UserProjection,
+    UserRepository,
+)
+from src.infrastructure.constants import ShardingConstants
+from src.infrastructure.tracing import traced
+
+if TYPE_CHECKING:
+    from src.infrastructure.database.sharded_unit_of_work import ShardedUnitOfWork
+
+T = TypeVar("T")
+
+
+def _merge(results: Iterable[List[T]], key: Callable[[T], tuple], reverse: bool, skip: int, limit: int) -> List[T]:
+    # Every shard returns its rows in the global order, so a k-way merge restores it across shards.
+    return list(islice(heapq.merge(*results, key=key, reverse=reverse), skip, skip + limit))
+
+
+class ShardedUserRepository(UserRepository):
+    def __init__(self, uow: "ShardedUnitOfWork") -> None:
+        self.uow = uow
+        # Events are recorded by the shard repositories; this one never writes rows itself.
+        self.pending_events: List[UserEvent] = []
+
+    async def _shard_repository(self, user_id: UUID) -> UserRepository:
+        return (await self.uow.shard(self.uow.database.shard_for(user_id))).users
+
+    async def _all_shards(self) -> List[UserRepository]:
+        # Opened one at a time so the sessions (and any SQLite locks) are taken in a fixed order.
+        return [(await self.uow.shard(i)).users for i in range(len(self.uow.database.shards))]
+
+    async def _release_stale_claims(self, user: User) -> None:
+        directory = await self.uow.directory()
+        threshold = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=ShardingConstants.STALE_CLAIM_SECONDS)
+        for owner, claimed_at in await directory.conflicts(user):
+            if claimed_at < threshold and await (await self._shard_repository(owner)).get_by_id(owner) is None:
+                await directory.release(owner)
+
+    @traced("repository")
+    async def create(self, user: User) -> User:
+        index = self.uow.database.shard_for(user.id)
+        self.uow.claim_write(index)
+        await self._release_stale_claims(user)
+        await (await self.uow.directory()).put(user)
+        return await (await self.uow.shard(index)).users.create(user)
+
+    @traced("repository")
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        return await (await self._shard_repository(user_id)).get_by_id(user_id)
+
+    @traced("repository")
+    async def get_by_email(self, email: str) -> Optional[User]:
+        user_id = await (await self.uow.directory()).find_by_email(email)
+        return await self.get_by_id(user_id) if user_id else None
+
+    @traced("repository")
+    async def get_by_username(self, username: str) -> Optional[User]:
+        user_id = await (await self.uow.directory()).find_by_username(username)
+        return await self.get_by_id(user_id) if user_id else None
+
+    @traced("repository")
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+        # Any shard may hold every row of the requested page, so each is asked for skip + limit rows.
+        shards = await self._all_shards()
+        results = await asyncio.gather(*(shard.get_all(0, skip + limit) for shard in shards))
+        return _merge(results, lambda u: (u.created_at, str(u.id)), reverse=True, skip=skip, limit=limit)
+
+    @traced("repository")
+    async def get_projection_by_id(self, user_id: UUID, fields: Tuple[str, ...]) -> Optional[UserProjection]:
+        return await (await self._shard_repository(user_id)).get_projection_by_id(user_id, fields)
+
+    @traced("repository")
+    async def get_all_projected(self, fields: Tuple[str, ...], skip: int = 0, limit: int = 100) -> List[UserProjection]:
+        # The merge needs the sort key from every shard even when the caller did not ask for it.
+        fetched = tuple(name for name in USER_FIELDS if name in fields or name in ("id", "created_at"))
+        shards = await self._all_shards()
+        results = await asyncio.gather(*(shard.get_all_projected(fetched, 0, skip + limit) for shard in shards))
+        merged = _merge(results, lambda p: (p["created_at"], str(p["id"])), reverse=True, skip=skip, limit=limit)
+        if fetched == fields:
+            return merged
+        return [{name: p[name] for name in fields} for p in merged]
+
+    @traced("repository")
+    async def count(self) -> int:
+        shards = await self._all_shards()
+        return sum(await asyncio.gather(*(shard.count() for shard in shards)))
+
+    @traced("repository")
+    async def update(self, user: User) -> User:
+        index = self.uow.database.shard_for(user.id)
+        self.uow.claim_write(index)
+        await self._release_stale_claims(user)
+        await (await self.uow.directory()).put(user)
+        return await (await self.uow.shard(index)).users.update(user)
+
+    @traced("repository")
+    async def delete(self, user_id: UUID) -> bool:
+        index = self.uow.database.shard_for(user_id)
+        self.uow.claim_write(index)
+        await (await self.uow.directory()).release(user_id)
+        return await (await self.uow.shard(index)).users.delete(user_id)
+
+    @traced("repository")
+    async def set_active_status(self, user_filter: UserFilter, is_active: bool, updated_at: datetime, limit: int) -> List[UUID]:
+        changed: List[UUID] = []
+        for index in range(len(self.uow.database.shards)):
+            shard_filter = user_filter
+            if user_filter.ids is not None:
+                shard_filter = replace(user_filter, ids=tuple(i for i in user_filter.ids if self.uow.database.shard_for(i) == index))
+                if not shard_filter.ids:
+                    continue
+            self.uow.claim_write(index, exclusive=False)
+            shard = (await self.uow.shard(index)).users
+            changed.extend(await shard.set_active_status(shard_filter, is_active, updated_at, limit - len(changed)))
+            if len(changed) >= limit:
+                break
+        return changed
+
+    @traced("repository")
+    async def get_changed_since(self, after: Optional[ChangeCursor], until: datetime, limit: int) -> List[User]:
+        shards = await self._all_shards()
+        results = await asyncio.gather(*(shard.get_changed_since(after, until, limit) for shard in shards))
+        return _merge(results, lambda u: (u.updated_at, str(u.id)), reverse=False, skip=0, limit=limit)
+
+    @traced("repository")
+    async def get_deleted_since(self, after: Optional[ChangeCursor], until: datetime, limit: int) -> List[UserTombstone]:
+        shards = await self._all_shards()
+        results = await asyncio.gather(*(shard.get_deleted_since(after, until, limit) for shard in shards))
+        return _merge(results, lambda t: (t.deleted_at, str(t.id)), reverse=False, skip=0, limit=limit)
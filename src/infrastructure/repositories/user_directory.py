@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.user import User
+from src.domain.exceptions import UserAlreadyExistsException
+from src.infrastructure.database.base import acquire_write_lock, prepare_session
+from src.infrastructure.database.models.user_directory_model import UserDirectoryModel
+from src.infrastructure.exceptions import DatabaseException
+
+DirectoryEntry = Tuple[str, str]
+
+
+class UserDirectory:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        # Entries as they were before this transaction changed them, so a committed directory
+        # change can be undone when the shard it belongs to fails to commit.
+        self.previous: Dict[UUID, Optional[DirectoryEntry]] = {}
+
+    async def find_by_email(self, email: str) -> Optional[UUID]:
+        return await self._find(UserDirectoryModel.email == email.lower().strip())
+
+    async def find_by_username(self, username: str) -> Optional[UUID]:
+        return await self._find(UserDirectoryModel.username == username.strip())
+
+    async def _find(self, condition) -> Optional[UUID]:
+        await prepare_session(self.session)
+        try:
+            result = await self.session.execute(select(UserDirectoryModel.user_id).where(condition))
+            user_id = result.scalar_one_or_none()
+            return UUID(user_id) if user_id else None
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to look up user directory: {str(e)}") from e
+
+    async def conflicts(self, user: User) -> List[Tuple[UUID, datetime]]:
+        await prepare_session(self.session)
+        try:
+            result = await self.session.execute(
+                select(UserDirectoryModel.user_id, UserDirectoryModel.claimed_at).where(
+                    or_(UserDirectoryModel.email == user.email, UserDirectoryModel.username == user.username),
+                    UserDirectoryModel.user_id != str(user.id),
+                )
+            )
+            return [(UUID(user_id), claimed_at) for user_id, claimed_at in result]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to look up user directory: {str(e)}") from e
+
+    async def put(self, user: User) -> None:
+        await acquire_write_lock(self.session)
+        try:
+            model = await self.session.get(UserDirectoryModel, str(user.id))
+            self.previous.setdefault(user.id, (model.email, model.username) if model else None)
+            if model is None:
+                model = UserDirectoryModel(user_id=str(user.id))
+                self.session.add(model)
+            model.email = user.email
+            model.username = user.username
+            model.claimed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            # Flushing now surfaces a uniqueness conflict before anything is written to the shard.
+            await self.session.flush()
+        except IntegrityError as e:
+            raise UserAlreadyExistsException("User with this email or username already exists") from e
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to claim user directory entry: {str(e)}") from e
+
+    async def release(self, user_id: UUID) -> None:
+        await acquire_write_lock(self.session)
+        try:
+            model = await self.session.get(UserDirectoryModel, str(user_id))
+            self.previous.setdefault(user_id, (model.email, model.username) if model else None)
+            if model is not None:
+                await self.session.delete(model)
+                await self.session.flush()
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to release user directory entry: {str(e)}") from e
+
+    async def restore(self, previous: Dict[UUID, Optional[DirectoryEntry]]) -> None:
+        await acquire_write_lock(self.session)
+        try:
+            # Deleting first lets entries that swapped an email or username be put back.
+            await self.session.execute(
+                delete(UserDirectoryModel).where(UserDirectoryModel.user_id.in_([str(i) for i in previous]))
+            )
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            self.session.add_all([
+                UserDirectoryModel(user_id=str(user_id), email=entry[0], username=entry[1], claimed_at=now)
+                for user_id, entry in previous.items()
+                if entry is not None
+            ])
+            await self.session.flush()
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to restore user directory: {str(e)}") from e
@@ -1,21 +1,114 @@
-from typing import List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Select, bindparam, func, select, tuple_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.user import User
-from src.domain.repositories.user_repository import UserRepository
+from src.domain.entities.user_tombstone import UserTombstone
+from src.domain.events import UserEvent, UserEventType
+from src.domain.exceptions import UserAlreadyExistsException
+from src.domain.repositories.user_repository import ChangeCursor, UserFilter, UserProjection, UserRepository
+from src.infrastructure.database.base import acquire_write_lock, prepare_session
 from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.user_tombstone_model import UserTombstoneModel
 from src.infrastructure.exceptions import DatabaseException
+from src.infrastructure.tracing import traced
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# Built once at import: a constant statement memoizes its cache key, so the hot reads skip both
+# construction and cache-key traversal. Selecting columns yields plain rows, which also skips
+# identity-map bookkeeping for data that is only ever read.
+_USER_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.username,
+    UserModel.full_name,
+    UserModel.is_active,
+    UserModel.created_at,
+    UserModel.updated_at,
+)
+_SELECT_BY_ID = select(*_USER_COLUMNS).where(UserModel.id == bindparam("id"))
+_SELECT_BY_EMAIL = select(*_USER_COLUMNS).where(UserModel.email == bindparam("email"))
+_SELECT_BY_USERNAME = select(*_USER_COLUMNS).where(UserModel.username == bindparam("username"))
+_SELECT_PAGE = (
+    select(*_USER_COLUMNS)
+    .order_by(UserModel.created_at.desc(), UserModel.id.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_COUNT = select(func.count(UserModel.id))
+_CHANGE_ORDER = (UserModel.updated_at, UserModel.id)
+_SELECT_CHANGED = (
+    select(*_USER_COLUMNS)
+    .where(UserModel.updated_at <= bindparam("until"))
+    .order_by(*_CHANGE_ORDER)
+    .limit(bindparam("limit"))
+)
+_SELECT_CHANGED_AFTER = _SELECT_CHANGED.where(
+    tuple_(*_CHANGE_ORDER)
+    > tuple_(bindparam("after_ts", type_=UserModel.updated_at.type), bindparam("after_id", type_=UserModel.id.type))
+)
+
+
+
+def _build_projection(fields: Tuple[str, ...]) -> Tuple[Select, Select]:
+    # Only the requested columns are read; (created_at, id) lookups are covered by idx_created_at on InnoDB.
+    columns = [getattr(UserModel, name) for name in fields]
+    by_id = select(*columns).where(UserModel.id == bindparam("id"))
+    page = (
+        select(*columns)
+        .order_by(UserModel.created_at.desc(), UserModel.id.desc())
+        .offset(bindparam("skip"))
+        .limit(bindparam("limit"))
+    )
+    return by_id, page
+
+
+# At most one entry per subset of USER_FIELDS, since fields arrive in canonical order.
+_projection = lru_cache(maxsize=None)(_build_projection)
+
+
+def _row_to_projection(fields: Tuple[str, ...], row: Row) -> UserProjection:
+    projected = dict(zip(fields, row))
+    if "id" in projected:
+        projected["id"] = UUID(projected["id"])
+    return projected
 
 
 class SQLAlchemyUserRepository(UserRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cached_statements: bool = True):
         self.session = session
+        self.cached_statements = cached_statements
+        self.pending_events: List[UserEvent] = []
+
+    async def _fetch_one(self, cached: Select, params: dict, build: Callable[[], Select]) -> Optional[User]:
+        if self.cached_statements:
+            row = (await self.session.execute(cached, params)).one_or_none()
+            return self._model_to_entity(row) if row else None
+        model = (await self.session.execute(build())).scalar_one_or_none()
+        return self._model_to_entity(model) if model else None
+
+    async def _fetch_all(self, cached: Select, params: dict, build: Callable[[], Select]) -> List[User]:
+        if self.cached_statements:
+            result = await self.session.execute(cached, params)
+        else:
+            result = (await self.session.execute(build())).scalars()
+        return [self._model_to_entity(m) for m in result]
 
+    @traced("repository")
     async def create(self, user: User) -> User:
+        await acquire_write_lock(self.session)
         try:
             model = UserModel(
                 id=str(user.id),
@@ -29,53 +122,91 @@ class SQLAlchemyUserRepository(UserRepository):
             self.session.add(model)
             await self.session.flush()
             await self.session.refresh(model)
-            return self._model_to_entity(model)
+            created = self._model_to_entity(model)
+            self.pending_events.append(UserEvent.snapshot(UserEventType.CREATED, created))
+            return created
+        except IntegrityError as e:
+            # The unique indexes are the final word when the existence checks were skipped or raced.
+            raise UserAlreadyExistsException("User with this email or username already exists") from e
         except SQLAlchemyError as e:
             raise DatabaseException(f"Failed to create user: {str(e)}") from e
 
+    @traced("repository")
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        await prepare_session(self.session)
         try:
-            result = await self.session.execute(select(UserModel).where(UserModel.id == str(user_id)))
-            model = result.scalar_one_or_none()
-            return self._model_to_entity(model) if model else None
+            key = str(user_id)
+            return await self._fetch_one(_SELECT_BY_ID, {"id": key}, lambda: select(UserModel).where(UserModel.id == key))
         except SQLAlchemyError as e:
             raise DatabaseException(f"Failed to get user by id: {str(e)}") from e
 
+    @traced("repository")
     async def get_by_email(self, email: str) -> Optional[User]:
+        await prepare_session(self.session)
         try:
-            result = await self.session.execute(select(UserModel).where(UserModel.email == email.lower().strip()))
-            model = result.scalar_one_or_none()
-            return self._model_to_entity(model) if model else None
+            key = email.lower().strip()
+            return await self._fetch_one(_SELECT_BY_EMAIL, {"email": key}, lambda: select(UserModel).where(UserModel.email == key))
         except SQLAlchemyError as e:
             raise DatabaseException(f"Failed to get user by email: {str(e)}") from e
 
+    @traced("repository")
     async def get_by_username(self, username: str) -> Optional[User]:
+        await prepare_session(self.session)
         try:
-            result = await self.session.execute(select(UserModel).where(UserModel.username == username.strip()))
-            model = result.scalar_one_or_none()
-            return self._model_to_entity(model) if model else None
+            key = username.strip()
+            return await self._fetch_one(
+                _SELECT_BY_USERNAME, {"username": key}, lambda: select(UserModel).where(UserModel.username == key)
+            )
         except SQLAlchemyError as e:
             raise DatabaseException(f"Failed to get user by username: {str(e)}") from e
 
+    @traced("repository")
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+        await prepare_session(self.session)
         try:
-            result = await self.session.execute(
-                select(UserModel).offset(skip).limit(limit).order_by(UserModel.created_at.desc())
+            return await self._fetch_all(
+                _SELECT_PAGE,
+                {"skip": skip, "limit": limit},
+                lambda: select(UserModel).offset(skip).limit(limit).order_by(UserModel.created_at.desc(), UserModel.id.desc()),
             )
-            models = result.scalars().all()
-            return [self._model_to_entity(m) for m in models]
         except SQLAlchemyError as e:
             raise DatabaseException(f"Failed to get all users: {str(e)}") from e
 
+    def _projection_statements(self, fields: Tuple[str, ...]) -> Tuple[Select, Select]:
+        return _projection(fields) if self.cached_statements else _build_projection(fields)
+
+    @traced("repository")
+    async def get_projection_by_id(self, user_id: UUID, fields: Tuple[str, ...]) -> Optional[UserProjection]:
+        await prepare_session(self.session)
+        try:
+            by_id, _ = self._projection_statements(fields)
+            row = (await self.session.execute(by_id, {"id": str(user_id)})).one_or_none()
+            return _row_to_projection(fields, row) if row else None
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to get user projection by id: {str(e)}") from e
+
+    @traced("repository")
+    async def get_all_projected(self, fields: Tuple[str, ...], skip: int = 0, limit: int = 100) -> List[UserProjection]:
+        await prepare_session(self.session)
+        try:
+            _, page = self._projection_statements(fields)
+            result = await self.session.execute(page, {"skip": skip, "limit": limit})
+            return [_row_to_projection(fields, row) for row in result]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to get user projections: {str(e)}") from e
+
+    @traced("repository")
     async def count(self) -> int:
+        await prepare_session(self.session)
         try:
-            from sqlalchemy import func
-            result = await self.session.execute(select(func.count(UserModel.id)))
+            result = await self.session.execute(_COUNT if self.cached_statements else select(func.count(UserModel.id)))
             return result.scalar_one()
         except SQLAlchemyError as e:
             raise DatabaseException(f"Failed to count users: {str(e)}") from e
 
+    @traced("repository")
     async def update(self, user: User) -> User:
+        await acquire_write_lock(self.session)
         try:
             result = await self.session.execute(select(UserModel).where(UserModel.id == str(user.id)))
             model = result.scalar_one_or_none()
@@ -89,25 +220,99 @@ class SQLAlchemyUserRepository(UserRepository):
             model.updated_at = user.updated_at
             await self.session.flush()
             await self.session.refresh(model)
-            return self._model_to_entity(model)
+            updated = self._model_to_entity(model)
+            self.pending_events.append(UserEvent.snapshot(UserEventType.UPDATED, updated))
+            return updated
+        except IntegrityError as e:
+            raise UserAlreadyExistsException("User with this email or username already exists") from e
         except SQLAlchemyError as e:
             raise DatabaseException(f"Failed to update user: {str(e)}") from e
 
+    @traced("repository")
     async def delete(self, user_id: UUID) -> bool:
+        await acquire_write_lock(self.session)
         try:
             result = await self.session.execute(select(UserModel).where(UserModel.id == str(user_id)))
             model = result.scalar_one_or_none()
             if model:
                 await self.session.delete(model)
+                await self.session.merge(UserTombstoneModel(id=model.id, deleted_at=_naive_utc(datetime.now(timezone.utc))))
                 await self.session.flush()
+                self.pending_events.append(UserEvent.deleted(user_id))
                 return True
             return False
         except SQLAlchemyError as e:
             raise DatabaseException(f"Failed to delete user: {str(e)}") from e
 
+    @traced("repository")
+    async def set_active_status(self, user_filter: UserFilter, is_active: bool, updated_at: datetime, limit: int) -> List[UUID]:
+        await acquire_write_lock(self.session)
+        try:
+            conditions = self._filter_conditions(user_filter)
+            conditions.append(UserModel.is_active != is_active)
+            result = await self.session.execute(select(UserModel.id).where(*conditions).order_by(UserModel.id).limit(limit))
+            ids = list(result.scalars())
+            if not ids:
+                return []
+            # Re-checking is_active keeps rows changed concurrently since the SELECT from being bumped again.
+            await self.session.execute(
+                update(UserModel)
+                .where(UserModel.id.in_(ids), UserModel.is_active != is_active)
+                .values(is_active=is_active, updated_at=updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            changed = [UUID(i) for i in ids]
+            self.pending_events.extend(UserEvent.status_changed(i, is_active, updated_at) for i in changed)
+            return changed
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to set user status: {str(e)}") from e
+
+    @traced("repository")
+    async def get_changed_since(self, after: Optional[ChangeCursor], until: datetime, limit: int) -> List[User]:
+        await prepare_session(self.session)
+        try:
+            params = {"until": _naive_utc(until), "limit": limit}
+            if after is not None:
+                params.update(after_ts=_naive_utc(after[0]), after_id=str(after[1]))
+
+            def build():
+                query = select(UserModel).where(UserModel.updated_at <= params["until"])
+                if after is not None:
+                    query = query.where(tuple_(UserModel.updated_at, UserModel.id) > (params["after_ts"], params["after_id"]))
+                return query.order_by(UserModel.updated_at, UserModel.id).limit(limit)
+
+            return await self._fetch_all(_SELECT_CHANGED if after is None else _SELECT_CHANGED_AFTER, params, build)
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to get changed users: {str(e)}") from e
+
+    @traced("repository")
+    async def get_deleted_since(self, after: Optional[ChangeCursor], until: datetime, limit: int) -> List[UserTombstone]:
+        await prepare_session(self.session)
+        try:
+            query = select(UserTombstoneModel).where(UserTombstoneModel.deleted_at <= _naive_utc(until))
+            if after is not None:
+                query = query.where(
+                    tuple_(UserTombstoneModel.deleted_at, UserTombstoneModel.id) > (_naive_utc(after[0]), str(after[1]))
+                )
+            result = await self.session.execute(query.order_by(UserTombstoneModel.deleted_at, UserTombstoneModel.id).limit(limit))
+            return [UserTombstone(id=UUID(m.id), deleted_at=m.deleted_at) for m in result.scalars()]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Failed to get deleted users: {str(e)}") from e
+
+    @staticmethod
+    def _filter_conditions(user_filter: UserFilter) -> list:
+        conditions = []
+        if user_filter.ids is not None:
+            conditions.append(UserModel.id.in_([str(i) for i in user_filter.ids]))
+        if user_filter.created_before is not None:
+            conditions.append(UserModel.created_at < _naive_utc(user_filter.created_before))
+        if user_filter.email_domain is not None:
+            domain = user_filter.email_domain.lower().strip().lstrip("@")
+            conditions.append(UserModel.email.endswith(f"@{domain}", autoescape=True))
+        return conditions
+
     @staticmethod
-    def _model_to_entity(model: UserModel | None) -> User | None:
-        from uuid import UUID
+    def _model_to_entity(model: UserModel | Row | None) -> User | None:
         if model is None:
             return None
         try:
@@ -0,0 +1,60 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from src.infrastructure.metrics import metrics
+
+T = TypeVar("T")
+
+_hits = metrics.counter("single_flight_hits_total", "Calls that joined an in-flight call instead of executing")
+_executions = metrics.counter("single_flight_executions_total", "Calls that executed because no identical call was in flight")
+
+
+class _LeaderCancelled(Exception):
+    pass
+
+
+class SingleFlight:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            fut = self._calls.get(key)
+            if fut is None:
+                return await self._lead(key, fn)
+            _hits.inc(group=self.name)
+            try:
+                return await asyncio.shield(fut)
+            except _LeaderCancelled:
+                # The leader's request went away mid-call; the next waiter takes over.
+                continue
+
+    async def _lead(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        fut = asyncio.get_running_loop().create_future()
+        fut.add_done_callback(_consume_exception)
+        self._calls[key] = fut
+        _executions.inc(group=self.name)
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            fut.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is fut:
+                del self._calls[key]
+
+
+def _consume_exception(fut: asyncio.Future) -> None:
+    if not fut.cancelled():
+        fut.exception()
@@ -0,0 +1,302 @@
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.constants import TracingConstants
+
+T = TypeVar("T")
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# Server-Timing entries, in header order.
+LAYERS = ("total", "queue", "pre", "handler", "usecase", "repository", "db", "post")
+_LAYER_DESCRIPTIONS = {
+    "pre": "middleware, validation, dependencies",
+    "post": "serialization",
+}
+
+
+@dataclass
+class Span:
+    name: str
+    layer: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    kind: int = SPAN_KIND_INTERNAL
+    error: bool = False
+    nested: bool = False
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+
+class Trace:
+    def __init__(self, trace_id: str, record: bool) -> None:
+        self.trace_id = trace_id
+        self.record = record
+        self.spans: List[Span] = []
+
+    def add(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def layer_totals(self) -> Dict[str, Tuple[float, int]]:
+        totals: Dict[str, Tuple[float, int]] = {}
+        for span in self.spans:
+            # A layer calling into itself would otherwise be counted twice.
+            if span.nested:
+                continue
+            duration, count = totals.get(span.layer, (0.0, 0))
+            totals[span.layer] = (duration + span.duration_ms, count + 1)
+        return totals
+
+    def server_timing(self, root: Span, now_ns: int) -> str:
+        totals = self.layer_totals()
+        totals["total"] = ((now_ns - root.start_ns) / 1_000_000, 1)
+        handlers = [s for s in self.spans if s.layer == "handler" and not s.nested]
+        if handlers:
+            queued = totals.get("queue", (0.0, 0))[0]
+            totals["pre"] = ((handlers[0].start_ns - root.start_ns) / 1_000_000 - queued, 1)
+            totals["post"] = ((now_ns - handlers[-1].end_ns) / 1_000_000, 1)
+        entries = []
+        for layer in LAYERS:
+            if layer not in totals:
+                continue
+            duration, count = totals[layer]
+            entry = f"{layer};dur={duration:.2f}"
+            if layer == "db":
+                entry += f';desc="{count} statements"'
+            elif layer in _LAYER_DESCRIPTIONS:
+                entry += f';desc="{_LAYER_DESCRIPTIONS[layer]}"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def _new_span(trace: Trace, name: str, layer: str, kind: int, attributes: Dict[str, Any]) -> Span:
+    parent = _current_span.get()
+    return Span(
+        name=name,
+        layer=layer,
+        trace_id=trace.trace_id,
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent else None,
+        start_ns=time.time_ns(),
+        kind=kind,
+        nested=parent is not None and parent.layer == layer,
+        attributes=attributes,
+    )
+
+
+@contextmanager
+def span(name: str, layer: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Optional[Span]]:
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    current = _new_span(trace, name, layer, kind, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException:
+        current.error = True
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+        trace.add(current)
+
+
+def traced(layer: str, name: Optional[str] = None) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            # Untraced requests pay for one context variable lookup.
+            if _current_trace.get() is None:
+                return await fn(*args, **kwargs)
+            with span(span_name, layer):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def trace_request(
+    name: str,
+    record: bool,
+    trace_id: Optional[str] = None,
+    parent_span_id: Optional[str] = None,
+    **attributes: Any,
+) -> Iterator[Tuple[Trace, Span]]:
+    trace = Trace(trace_id or secrets.token_hex(16), record)
+    root = Span(
+        name=name,
+        layer="total",
+        trace_id=trace.trace_id,
+        span_id=secrets.token_hex(8),
+        parent_id=parent_span_id,
+        start_ns=time.time_ns(),
+        kind=SPAN_KIND_SERVER,
+        attributes=attributes,
+    )
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(root)
+    try:
+        yield trace, root
+    except BaseException:
+        root.error = True
+        raise
+    finally:
+        root.end_ns = time.time_ns()
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        trace.add(root)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    # W3C trace context: version-traceid-parentid-flags.
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or len(parts[3]) != 2:
+        return None
+    try:
+        int(parts[1], 16)
+        int(parts[2], 16)
+        flags = int(parts[3], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return parts[1], parts[2], bool(flags & 1)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+    system = sync_engine.dialect.name
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None and _current_trace.get() is not None:
+            context._trace_start_ns = time.time_ns()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        trace = _current_trace.get()
+        start_ns = getattr(context, "_trace_start_ns", None)
+        if trace is None or start_ns is None:
+            return
+        parent = _current_span.get()
+        words = statement.split(None, 1)
+        trace.add(Span(
+            name=words[0].upper() if words else "SQL",
+            layer="db",
+            trace_id=trace.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=start_ns,
+            end_ns=time.time_ns(),
+            kind=SPAN_KIND_CLIENT,
+            nested=parent is not None and parent.layer == "db",
+            attributes={"db.system": system, "db.statement": statement[:TracingConstants.MAX_STATEMENT_LENGTH]},
+        ))
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def to_otlp(trace: Trace, service_name: str) -> Dict[str, Any]:
+    # OTLP/JSON (ExportTraceServiceRequest), so the file can be replayed into an OpenTelemetry collector.
+    spans = []
+    for s in trace.spans:
+        entry: Dict[str, Any] = {
+            "traceId": s.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": s.kind,
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": [_attribute("app.layer", s.layer)] + [_attribute(k, v) for k, v in s.attributes.items()],
+            "status": {"code": 2 if s.error else 0},
+        }
+        if s.parent_id:
+            entry["parentSpanId"] = s.parent_id
+        spans.append(entry)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_attribute("service.name", service_name), _attribute("process.pid", os.getpid())]},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+        }]
+    }
+
+
+class _OtlpFormatter(logging.Formatter):
+    def __init__(self, service_name: str) -> None:
+        super().__init__()
+        self.service_name = service_name
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(to_otlp(record.msg, self.service_name), separators=(",", ":"))
+
+
+class _TraceQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Serialization happens on the listener thread, not the event loop.
+        return record
+
+
+class TraceRecorder:
+    def __init__(self, path: str, service_name: str, max_bytes: int, backup_count: int) -> None:
+        # One file per process; RotatingFileHandler cannot be shared between processes.
+        self.path = Path(path.format(pid=os.getpid()))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(self.path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        file_handler.setFormatter(_OtlpFormatter(service_name))
+        self._handler = _TraceQueueHandler(queue.SimpleQueue())
+        self._listener = logging.handlers.QueueListener(self._handler.queue, file_handler)
+        self._listener.start()
+
+    def record(self, trace: Trace) -> None:
+        self._handler.handle(logging.makeLogRecord({"msg": trace, "levelno": logging.INFO, "levelname": "INFO"}))
+
+    def close(self) -> None:
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
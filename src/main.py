@@ -6,37 +6,120 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.domain.exceptions import DomainException
 from src.infrastructure.config import settings
-from src.infrastructure.exceptions import DatabaseException
+from src.infrastructure.constants import ConcurrencyConstants, DeadlineConstants
+from src.infrastructure.exceptions import DatabaseException, DeadlineExceededException
 from src.infrastructure.logger import logger
-from src.presentation.dependencies import get_database
+from src.infrastructure.memory import register_process_gauges
+from src.infrastructure.metrics import metrics
+from src.presentation.dependencies import (
+    get_availability_index,
+    get_concurrency_limiter,
+    get_database,
+    get_health_sampler,
+    get_job_runner,
+    get_jobs_database,
+    get_loop_monitor,
+    get_memory_monitor,
+    get_outbox_relay,
+    get_pool_maintainer,
+    get_request_profiler,
+    get_sharded_database,
+    get_trace_recorder,
+    get_write_batcher,
+)
 from src.presentation.middleware.error_handler import (
     database_exception_handler,
+    deadline_exception_handler,
     domain_exception_handler,
     general_exception_handler,
     http_exception_handler,
     validation_exception_handler,
 )
+from src.presentation.middleware.concurrency_limit import ConcurrencyLimitMiddleware
+from src.presentation.middleware.deadline import DeadlineMiddleware
+from src.presentation.middleware.profiling import ProfilingMiddleware
 from src.presentation.middleware.request_id import RequestIDMiddleware
+from src.presentation.middleware.tracing import TracingMiddleware
+from src.presentation.routers.admin_router import router as admin_router
+from src.presentation.routers.job_router import router as job_router
 from src.presentation.routers.user_router import router as user_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Application startup")
+    register_process_gauges()
+    if settings.memory_monitor_enabled:
+        get_memory_monitor().start()
+    if settings.loop_monitor_enabled:
+        get_loop_monitor().start()
+    availability = get_availability_index()
+    if settings.in_memory:
+        logger.info("Using in-memory storage; data is not persisted")
+        if availability is not None:
+            availability.start()
+        yield
+        logger.info("Application shutdown")
+        if availability is not None:
+            await availability.stop()
+        await _stop_diagnostics()
+        return
     db = get_database()
     try:
         await db.create_tables()
+        if settings.sharded:
+            await get_sharded_database().create_tables()
         logger.info("Tables initialized")
     except Exception as e:
         logger.error(f"Failed to create tables: {e}")
         raise
+    pool_maintainer = get_pool_maintainer()
+    if settings.database_pool_warmup:
+        await pool_maintainer.warmup()
+    pool_maintainer.start()
+    health_sampler = get_health_sampler()
+    health_sampler.start()
+    # Jobs and the outbox relay work against a single database and are off when sharded.
+    background = not settings.sharded
+    if settings.jobs_enabled and background:
+        await get_job_runner().start()
+    if settings.outbox_enabled and background:
+        await get_outbox_relay().start()
+    if availability is not None:
+        availability.start(get_outbox_relay() if settings.outbox_enabled and background else None)
     yield
     logger.info("Application shutdown")
+    if availability is not None:
+        await availability.stop()
+    if settings.outbox_enabled and background:
+        await get_outbox_relay().stop()
+    if settings.jobs_enabled and background:
+        await get_job_runner().stop()
+        await get_jobs_database().close()
+    write_batcher = get_write_batcher()
+    if write_batcher is not None:
+        await write_batcher.close()
+    await pool_maintainer.stop()
+    await health_sampler.stop()
+    if settings.sharded:
+        await get_sharded_database().close()
     await db.close()
+    await _stop_diagnostics()
+
+
+async def _stop_diagnostics() -> None:
+    if settings.loop_monitor_enabled:
+        await get_loop_monitor().stop()
+    if settings.memory_monitor_enabled:
+        await get_memory_monitor().stop()
+    recorder = get_trace_recorder()
+    if recorder is not None:
+        recorder.close()
 
 
 app = FastAPI(
@@ -46,7 +129,28 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+if settings.profiling_available:
+    app.add_middleware(ProfilingMiddleware, profiler=get_request_profiler(), admin_token=settings.admin_token)
 app.add_middleware(RequestIDMiddleware)
+if settings.concurrency_limit_enabled:
+    app.add_middleware(
+        ConcurrencyLimitMiddleware,
+        limiter=get_concurrency_limiter(),
+        queue_timeout=settings.concurrency_queue_timeout,
+        retry_after=settings.concurrency_retry_after,
+        # Event streams stay open indefinitely and would otherwise pin a slot each.
+        priority_paths=(*ConcurrencyConstants.PRIORITY_PATHS, f"{settings.api_prefix}/users/events"),
+    )
+if settings.request_deadline_enabled:
+    # Outside the limiter, so time spent queueing for a slot counts against the budget.
+    app.add_middleware(
+        DeadlineMiddleware,
+        default_timeout=settings.request_deadline_default,
+        route_timeouts={
+            **{f"{settings.api_prefix}{path}": timeout for path, timeout in DeadlineConstants.ROUTE_TIMEOUTS.items()},
+            **settings.request_deadline_routes,
+        },
+    )
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -54,14 +158,25 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.tracing_enabled:
+    # Outermost, so the timings cover every other middleware.
+    app.add_middleware(
+        TracingMiddleware,
+        recorder=get_trace_recorder(),
+        server_timing=settings.server_timing_enabled,
+        sample_rate=settings.trace_sample_rate,
+    )
 
 app.add_exception_handler(DomainException, domain_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(DatabaseException, database_exception_handler)
+app.add_exception_handler(DeadlineExceededException, deadline_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
 app.include_router(user_router, prefix=settings.api_prefix)
+app.include_router(job_router, prefix=settings.api_prefix)
+app.include_router(admin_router, prefix=settings.api_prefix)
 
 
 @app.get("/")
@@ -69,19 +184,40 @@ async def root():
     return {"message": "API is running"}
 
 
+@app.get("/metrics", tags=["health"], response_class=PlainTextResponse)
+async def metrics_endpoint():
+    return metrics.render()
+
+
 @app.get("/health", tags=["health"])
 async def health():
-    from sqlalchemy import text
-    db = get_database()
-    try:
-        async for session in db.get_session():
-            await session.execute(text("SELECT 1"))
-            break
+    if settings.in_memory:
+        return {"status": "ok", "database": "memory"}
+    # Served from the background sample, so a probe never takes a pool connection.
+    _, checks = get_health_sampler().readiness()
+    if checks["database"] == "ok":
         return {"status": "ok", "database": "connected"}
-    except Exception as e:
-        logger.error(f"Health check failed: {e}", exc_info=True)
-        return {"status": "error", "database": "disconnected"}
-
+    return {"status": "error", "database": "disconnected"}
+
+
+@app.get("/livez", tags=["health"])
+async def livez():
+    # Answering at all shows the event loop is turning; dependencies belong to /readyz.
+    return {"status": "ok"}
+
+
+@app.get("/readyz", tags=["health"])
+async def readyz():
+    limiter = get_concurrency_limiter() if settings.concurrency_limit_enabled else None
+    shedding = limiter is not None and limiter.shedding
+    if settings.in_memory:
+        ready, checks = not shedding, {"database": "memory", "load": "shedding" if shedding else "ok"}
+    else:
+        ready, checks = get_health_sampler().readiness(shedding)
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "not_ready", "checks": checks},
+    )
 
 if __name__ == "__main__":
     import uvicorn
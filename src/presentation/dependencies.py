@@ -1,15 +1,60 @@
+import os
+import secrets
+from datetime import timedelta
 from typing import AsyncGenerator
 
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.dto.user_dto import UserDTO
+from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.database.base import Database
+from src.infrastructure.database.in_memory_unit_of_work import InMemoryUnitOfWork
+from src.infrastructure.database.models.user_directory_model import UserDirectoryModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.pool import PoolMaintainer
+from src.infrastructure.database.sharded_unit_of_work import ShardedUnitOfWork
+from src.infrastructure.database.sharding import ShardedDatabase
 from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork, UnitOfWork
+from src.infrastructure.database.write_batcher import WriteBatcher
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserStore
 from src.infrastructure.repositories.user_repository_impl import SQLAlchemyUserRepository
 from src.infrastructure.config import settings
+from src.infrastructure.constants import AvailabilityConstants, HealthConstants, OutboxConstants
+from src.infrastructure.deadline import enforce_statement_deadlines
+from src.infrastructure.health import HealthSampler
+from src.infrastructure.jobs.handlers import default_handlers
+from src.infrastructure.jobs.runner import JobRunner
+from src.infrastructure.loop_monitor import LoopMonitor
+from src.infrastructure.membership import UserAvailabilityIndex, database_key_scan, memory_key_scan
+from src.infrastructure.memory import MemoryMonitor, TracemallocSnapshots
+from src.infrastructure.outbox.relay import OutboxRelay
+from src.infrastructure.profiling import ProfileStore, RequestProfiler, StackSampler
+from src.infrastructure.single_flight import SingleFlight
+from src.infrastructure.tracing import TraceRecorder, instrument_engine
+from src.presentation.middleware.concurrency_limit import AdaptiveConcurrencyLimiter
+from src.presentation.schemas.user_schema import UserResponseSchema
 
 _db: Database | None = None
+_sharded_db: ShardedDatabase | None = None
+_pool_maintainer: PoolMaintainer | None = None
+_concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
+_read_coalescer = SingleFlight("user_reads")
+_write_batcher: WriteBatcher | None = None
+_jobs_db: Database | None = None
+_health_db: Database | None = None
+_health_sampler: HealthSampler | None = None
+_job_runner: JobRunner | None = None
+_outbox_relay: OutboxRelay | None = None
+_availability_index: UserAvailabilityIndex | None = None
+_trace_recorder: TraceRecorder | None = None
+_request_profiler: RequestProfiler | None = None
+_stack_sampler = StackSampler()
+_memory_monitor: MemoryMonitor | None = None
+_loop_monitor: LoopMonitor | None = None
+_tracemalloc_snapshots = TracemallocSnapshots()
+_memory_store = InMemoryUserStore()
 
 
 def get_database() -> Database:
@@ -21,22 +66,289 @@ def get_database() -> Database:
             pool_size=settings.database_pool_size,
             max_overflow=settings.database_max_overflow,
             pool_pre_ping=settings.database_pool_pre_ping,
+            sqlite_pragmas=settings.sqlite_pragmas,
         )
+        if settings.tracing_enabled:
+            instrument_engine(_db.engine)
+        if settings.request_deadline_enabled:
+            enforce_statement_deadlines(_db.engine)
     return _db
 
 
+def get_sharded_database() -> ShardedDatabase:
+    global _sharded_db
+    if _sharded_db is None:
+        # The primary database keeps the uniqueness directory; users live on the shards.
+        _sharded_db = ShardedDatabase(
+            settings.database_shard_urls,
+            get_database(),
+            echo=settings.debug,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_pre_ping=settings.database_pool_pre_ping,
+            sqlite_pragmas=settings.sqlite_pragmas,
+        )
+        for shard in _sharded_db.shards:
+            if settings.tracing_enabled:
+                instrument_engine(shard.engine)
+            if settings.request_deadline_enabled:
+                enforce_statement_deadlines(shard.engine)
+    return _sharded_db
+
+
+def get_pool_maintainer() -> PoolMaintainer:
+    global _pool_maintainer
+    if _pool_maintainer is None:
+        _pool_maintainer = PoolMaintainer(
+            get_database().engine,
+            liveness_interval=settings.database_pool_liveness_interval,
+            adaptive=settings.database_pool_adaptive,
+            adaptive_interval=settings.database_pool_adaptive_interval,
+            min_overflow=settings.database_pool_adaptive_min_overflow,
+            max_overflow=settings.database_pool_adaptive_max_overflow,
+            target_wait_ms=settings.database_pool_target_wait_ms,
+        )
+    return _pool_maintainer
+
+
+def get_concurrency_limiter() -> AdaptiveConcurrencyLimiter:
+    global _concurrency_limiter
+    if _concurrency_limiter is None:
+        pool_capacity = settings.database_pool_size + settings.database_max_overflow
+        max_overflow = settings.database_pool_adaptive_max_overflow if settings.database_pool_adaptive else settings.database_max_overflow
+        _concurrency_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=settings.concurrency_limit_initial or pool_capacity,
+            min_limit=settings.concurrency_limit_min,
+            max_limit=settings.concurrency_limit_max or settings.database_pool_size + max_overflow,
+            queue_factor=settings.concurrency_queue_factor,
+            latency_target=settings.concurrency_latency_target_ms / 1000,
+        )
+    return _concurrency_limiter
+
+
+def get_read_coalescer() -> SingleFlight | None:
+    return _read_coalescer if settings.read_coalescing_enabled else None
+
+
+def get_availability_index() -> UserAvailabilityIndex | None:
+    global _availability_index
+    if not settings.availability_filter_enabled:
+        return None
+    if _availability_index is None:
+        if settings.in_memory:
+            scan = memory_key_scan(_memory_store)
+        elif settings.sharded:
+            scan = database_key_scan(get_database(), UserDirectoryModel.email, UserDirectoryModel.username, AvailabilityConstants.SCAN_BATCH_SIZE)
+        else:
+            scan = database_key_scan(get_database(), UserModel.email, UserModel.username, AvailabilityConstants.SCAN_BATCH_SIZE)
+        _availability_index = UserAvailabilityIndex(
+            scan,
+            capacity=settings.availability_filter_capacity,
+            error_rate=settings.availability_filter_error_rate,
+            rebuild_interval=settings.availability_filter_rebuild_interval,
+        )
+    return _availability_index
+
+
+def get_memory_store() -> InMemoryUserStore:
+    return _memory_store
+
+
+def get_write_batcher() -> WriteBatcher | None:
+    global _write_batcher
+    if not settings.write_batching_enabled or settings.in_memory or settings.sharded:
+        return None
+    if _write_batcher is None:
+        _write_batcher = WriteBatcher(
+            get_database(),
+            max_delay=settings.write_batch_max_delay_ms / 1000,
+            max_batch_size=settings.write_batch_max_size,
+            record_events=settings.outbox_enabled,
+            cached_statements=settings.database_cached_statements,
+        )
+    return _write_batcher
+
+
+def get_jobs_database() -> Database:
+    global _jobs_db
+    if _jobs_db is None:
+        _jobs_db = Database(
+            database_url=settings.database_url,
+            echo=settings.debug,
+            pool_size=settings.jobs_database_pool_size,
+            max_overflow=0,
+            pool_pre_ping=True,
+            sqlite_pragmas=settings.sqlite_pragmas,
+        )
+    return _jobs_db
+
+
+def get_health_sampler() -> HealthSampler:
+    global _health_db, _health_sampler
+    if _health_sampler is None:
+        _health_db = Database(
+            database_url=settings.database_url,
+            echo=settings.debug,
+            pool_size=1,
+            max_overflow=0,
+            pool_pre_ping=True,
+            sqlite_pragmas=settings.sqlite_pragmas,
+        )
+        _health_sampler = HealthSampler(
+            _health_db,
+            get_database().engine,
+            interval=settings.health_sample_interval,
+            timeout=settings.health_sample_timeout,
+            stale_after=settings.health_sample_interval * HealthConstants.STALE_INTERVALS + settings.health_sample_timeout,
+        )
+    return _health_sampler
+
+
+def get_job_runner() -> JobRunner:
+    global _job_runner
+    if not settings.jobs_enabled or settings.in_memory or settings.sharded:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Background jobs are disabled")
+    if _job_runner is None:
+        _job_runner = JobRunner(
+            get_jobs_database(),
+            default_handlers(),
+            workers=settings.jobs_workers,
+            poll_interval=settings.jobs_poll_interval,
+            heartbeat_interval=settings.jobs_heartbeat_interval,
+        )
+    return _job_runner
+
+
+def get_outbox_relay() -> OutboxRelay:
+    global _outbox_relay
+    if not settings.outbox_enabled or settings.in_memory or settings.sharded:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Event stream is disabled")
+    if _outbox_relay is None:
+        _outbox_relay = OutboxRelay(
+            get_database(),
+            poll_interval=settings.outbox_poll_interval,
+            batch_size=settings.outbox_batch_size,
+            gap_timeout=settings.outbox_gap_timeout,
+            retention=timedelta(hours=settings.outbox_retention_hours),
+            purge_interval=OutboxConstants.PURGE_INTERVAL,
+            subscriber_queue_size=settings.outbox_subscriber_queue_size,
+        )
+    return _outbox_relay
+
+
+def get_trace_recorder() -> TraceRecorder | None:
+    global _trace_recorder
+    if settings.trace_sample_rate <= 0:
+        return None
+    if _trace_recorder is None:
+        _trace_recorder = TraceRecorder(
+            settings.trace_file,
+            service_name=settings.api_title,
+            max_bytes=settings.trace_file_max_bytes,
+            backup_count=settings.trace_file_backup_count,
+        )
+    return _trace_recorder
+
+
+def require_admin_token(x_admin_token: str | None = Header(None, alias="X-Admin-Token")) -> None:
+    if not settings.admin_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token.encode(), settings.admin_token.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
+
+
+def get_request_profiler() -> RequestProfiler:
+    global _request_profiler
+    if not settings.profiling_available:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Profiling is disabled")
+    if _request_profiler is None:
+        _request_profiler = RequestProfiler(ProfileStore(settings.profiling_dir, settings.profiling_max_stored))
+    return _request_profiler
+
+
+def get_stack_sampler() -> StackSampler:
+    if not settings.profiling_available:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Profiling is disabled")
+    return _stack_sampler
+
+
+def get_memory_monitor() -> MemoryMonitor:
+    global _memory_monitor
+    if _memory_monitor is None:
+        _memory_monitor = MemoryMonitor(
+            {"User": User, "UserDTO": UserDTO, "UserModel": UserModel, "UserResponseSchema": UserResponseSchema},
+            interval=settings.memory_monitor_interval,
+        )
+    return _memory_monitor
+
+
+def get_loop_monitor() -> LoopMonitor:
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopMonitor(
+            interval=settings.loop_monitor_interval,
+            block_threshold=settings.loop_block_threshold_ms / 1000,
+            debug=settings.loop_debug,
+        )
+    return _loop_monitor
+
+
+def get_tracemalloc_snapshots() -> TracemallocSnapshots:
+    return _tracemalloc_snapshots
+
+
+def _reset_after_fork() -> None:
+    global _db, _sharded_db, _jobs_db, _pool_maintainer, _job_runner, _write_batcher, _outbox_relay, _availability_index
+    global _health_db, _health_sampler, _trace_recorder, _request_profiler, _memory_monitor, _loop_monitor
+    for database in (_db, _sharded_db, _jobs_db, _health_db):
+        if database is not None:
+            database.discard_after_fork()
+    _db = _sharded_db = _jobs_db = _health_db = _health_sampler = None
+    _pool_maintainer = _job_runner = _write_batcher = _outbox_relay = _availability_index = None
+    _trace_recorder = _request_profiler = _memory_monitor = _loop_monitor = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async for session in get_database().get_session():
         yield session
 
 
 def get_user_repository(session: AsyncSession = Depends(get_db_session)) -> UserRepository:
-    return SQLAlchemyUserRepository(session)
+    return SQLAlchemyUserRepository(session, cached_statements=settings.database_cached_statements)
+
 
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    if settings.in_memory:
+        async with InMemoryUnitOfWork(get_memory_store()) as uow:
+            yield uow
+        return
+    if settings.sharded:
+        async with ShardedUnitOfWork(get_sharded_database(), cached_statements=settings.database_cached_statements) as uow:
+            yield uow
+        return
+    async for session in get_db_session():
+        repo = SQLAlchemyUserRepository(session, cached_statements=settings.database_cached_statements)
+        uow = SQLAlchemyUnitOfWork(session, repo, record_events=settings.outbox_enabled)
+        async with uow:
+            yield uow
 
-async def get_unit_of_work(session: AsyncSession = Depends(get_db_session)) -> AsyncGenerator[UnitOfWork, None]:
-    repo = SQLAlchemyUserRepository(session)
-    uow = SQLAlchemyUnitOfWork(session, repo)
-    async with uow:
-        yield uow
 
+async def get_write_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    if settings.in_memory:
+        async with InMemoryUnitOfWork(get_memory_store()) as uow:
+            yield uow
+        return
+    if settings.sharded:
+        async with ShardedUnitOfWork(get_sharded_database(), write_intent=True, cached_statements=settings.database_cached_statements) as uow:
+            yield uow
+        return
+    async for session in get_db_session():
+        session.info["write_intent"] = True
+        repo = SQLAlchemyUserRepository(session, cached_statements=settings.database_cached_statements)
+        uow = SQLAlchemyUnitOfWork(session, repo, record_events=settings.outbox_enabled)
+        async with uow:
+            yield uow
@@ -1,16 +1,27 @@
+from src.presentation.middleware.concurrency_limit import AdaptiveConcurrencyLimiter, ConcurrencyLimitMiddleware
+from src.presentation.middleware.deadline import DeadlineMiddleware
 from src.presentation.middleware.error_handler import (
     database_exception_handler,
+    deadline_exception_handler,
     domain_exception_handler,
     http_exception_handler,
     validation_exception_handler,
 )
+from src.presentation.middleware.profiling import ProfilingMiddleware
 from src.presentation.middleware.request_id import RequestIDMiddleware
+from src.presentation.middleware.tracing import TracingMiddleware
 
 __all__ = [
     "RequestIDMiddleware",
+    "ConcurrencyLimitMiddleware",
+    "DeadlineMiddleware",
+    "AdaptiveConcurrencyLimiter",
+    "TracingMiddleware",
+    "ProfilingMiddleware",
     "domain_exception_handler",
     "validation_exception_handler",
     "http_exception_handler",
     "database_exception_handler",
+    "deadline_exception_handler",
 ]
 
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Deque, Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.logger import logger
+from src.infrastructure.metrics import metrics
+from src.infrastructure.tracing import span
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_in_flight_gauge = metrics.gauge("http_concurrency_in_flight", "Requests currently holding a concurrency slot")
+_limit_gauge = metrics.gauge("http_concurrency_limit", "Current adaptive concurrency limit")
+_queue_gauge = metrics.gauge("http_concurrency_queue_depth", "Requests waiting for a concurrency slot")
+_shed_counter = metrics.counter("http_requests_shed_total", "Requests rejected with 503 by the concurrency limiter")
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        queue_factor: float,
+        latency_target: float,
+        backoff_ratio: float = 0.9,
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.queue_factor = queue_factor
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self.in_flight = 0
+        self._reads: Deque[asyncio.Future] = deque()
+        self._writes: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self.shedding = False
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def queue_limit(self) -> int:
+        return max(1, int(self._limit * self.queue_factor))
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._reads) + len(self._writes)
+
+    async def acquire(self, read_only: bool, timeout: float) -> bool:
+        if self.in_flight < self.limit and not self.queue_depth:
+            self.in_flight += 1
+            self.shedding = False
+            return True
+
+        # Reads may fill the whole queue; writes are shed once half of it is taken.
+        queue_cap = self.queue_limit if read_only else self.queue_limit // 2
+        if self.queue_depth >= queue_cap:
+            self.shedding = True
+            return False
+
+        waiters = self._reads if read_only else self._writes
+        fut = asyncio.get_running_loop().create_future()
+        waiters.append(fut)
+        try:
+            await asyncio.wait((fut,), timeout=timeout)
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release()
+            else:
+                self._discard(waiters, fut)
+            raise
+        if fut.done():
+            return True
+        self._discard(waiters, fut)
+        self.shedding = True
+        return False
+
+    def release(self) -> None:
+        for waiters in (self._reads, self._writes):
+            while waiters:
+                fut = waiters.popleft()
+                if not fut.done():
+                    # Hand the slot over directly so in_flight stays unchanged.
+                    if self.in_flight <= self.limit:
+                        fut.set_result(None)
+                        return
+                    waiters.appendleft(fut)
+                    self.in_flight -= 1
+                    return
+        self.in_flight -= 1
+
+    def record(self, latency: float, failed: bool) -> None:
+        now = time.monotonic()
+        if failed or latency > self.latency_target:
+            # Back off at most once per target interval so a single burst does not collapse the limit.
+            if now - self._last_decrease >= self.latency_target:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                self._last_decrease = now
+        else:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    @staticmethod
+    def _discard(waiters: Deque[asyncio.Future], fut: asyncio.Future) -> None:
+        try:
+            waiters.remove(fut)
+        except ValueError:
+            pass
+        fut.cancel()
+
+
+class ConcurrencyLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: AdaptiveConcurrencyLimiter,
+        queue_timeout: float,
+        retry_after: int,
+        priority_paths: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.priority_paths = frozenset(priority_paths)
+        _limit_gauge.set_function(lambda: limiter.limit)
+        _in_flight_gauge.set_function(lambda: limiter.in_flight)
+        _queue_gauge.set_function(lambda: limiter.queue_depth)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.priority_paths:
+            await self.app(scope, receive, send)
+            return
+
+        read_only = scope["method"] in READ_METHODS
+        lane = "read" if read_only else "write"
+        with span("concurrency.acquire", "queue"):
+            admitted = await self.limiter.acquire(read_only, self.queue_timeout)
+        if not admitted:
+            _shed_counter.inc(lane=lane)
+            await self._reject(scope, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.limiter.record(time.perf_counter() - started, status_code >= 500)
+            self.limiter.release()
+
+    async def _reject(self, scope: Scope, send: Send) -> None:
+        req_id = None
+        for name, value in scope.get("headers", []):
+            if name == b"x-request-id":
+                req_id = value.decode("latin-1")
+                break
+        logger.warning(
+            f"Load shed: {scope['method']} {scope['path']} (in flight {self.limiter.in_flight}, queued {self.limiter.queue_depth})",
+            extra={"request_id": req_id or "N/A"},
+        )
+        body = json.dumps({"detail": "Service overloaded, retry later", "error_code": "SERVICE_OVERLOADED", "request_id": req_id}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(self.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
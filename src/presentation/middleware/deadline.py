@@ -0,0 +1,123 @@
+import asyncio
+import json
+from typing import Dict, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.constants import DeadlineConstants
+from src.infrastructure.deadline import deadline_scope, record_exceeded
+from src.infrastructure.logger import logger
+
+
+class DeadlineMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_timeout: float,
+        route_timeouts: Dict[str, Optional[float]],
+        client_header: str = DeadlineConstants.CLIENT_HEADER,
+    ) -> None:
+        self.app = app
+        self.default_timeout = default_timeout
+        # Longest prefix first, so /users/bulk wins over /users.
+        self.route_timeouts = sorted(route_timeouts.items(), key=lambda item: len(item[0]), reverse=True)
+        self.client_header = client_header.lower().encode("latin-1")
+
+    def _timeout_for(self, scope: Scope) -> Optional[float]:
+        timeout = self.default_timeout
+        path = scope["path"]
+        for prefix, route_timeout in self.route_timeouts:
+            if path.startswith(prefix):
+                timeout = route_timeout
+                break
+        if timeout is None:
+            return None
+        for name, value in scope.get("headers", []):
+            if name == self.client_header:
+                try:
+                    # A client may only shorten its budget, never extend it past the route's.
+                    timeout = min(timeout, int(value) / 1000)
+                except ValueError:
+                    pass
+                break
+        return timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timeout = self._timeout_for(scope)
+        if timeout is None:
+            await self.app(scope, receive, send)
+            return
+        if timeout <= 0:
+            record_exceeded("admission")
+            await self._reject(scope, send)
+            return
+
+        response_started = False
+        disconnected = False
+        messages: asyncio.Queue = asyncio.Queue()
+
+        async def receive_wrapper() -> Message:
+            message = await messages.get()
+            if message["type"] == "http.disconnect":
+                messages.put_nowait(message)
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            with deadline_scope(timeout):
+                async with asyncio.timeout(timeout) as cm:
+
+                    async def watch_disconnect() -> None:
+                        nonlocal disconnected
+                        while True:
+                            message = await receive()
+                            messages.put_nowait(message)
+                            if message["type"] == "http.disconnect":
+                                break
+                        if not response_started:
+                            # Nobody is waiting for the answer any more; stop spending database time on it.
+                            disconnected = True
+                            cm.reschedule(asyncio.get_running_loop().time())
+
+                    watcher = asyncio.create_task(watch_disconnect())
+                    try:
+                        await self.app(scope, receive_wrapper, send_wrapper)
+                    finally:
+                        watcher.cancel()
+        except TimeoutError:
+            record_exceeded("abandoned" if disconnected else "request")
+            if disconnected:
+                logger.info(f"Client disconnected, cancelled {scope['method']} {scope['path']}", extra={"request_id": self._request_id(scope) or "N/A"})
+                return
+            if response_started:
+                raise
+            await self._reject(scope, send)
+
+    @staticmethod
+    def _request_id(scope: Scope) -> Optional[str]:
+        for name, value in scope.get("headers", []):
+            if name == b"x-request-id":
+                return value.decode("latin-1")
+        return None
+
+    async def _reject(self, scope: Scope, send: Send) -> None:
+        req_id = self._request_id(scope)
+        logger.warning(f"Deadline exceeded: {scope['method']} {scope['path']}", extra={"request_id": req_id or "N/A"})
+        body = json.dumps({"detail": "Request deadline exceeded", "error_code": "DEADLINE_EXCEEDED", "request_id": req_id}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 504,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
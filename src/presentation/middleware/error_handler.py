@@ -1,4 +1,5 @@
 from fastapi import Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -10,7 +11,7 @@ from src.domain.exceptions import (
     InvalidEmailException,
     InvalidUsernameException,
 )
-from src.infrastructure.exceptions import DatabaseException
+from src.infrastructure.exceptions import DatabaseException, DeadlineExceededException
 from src.infrastructure.logger import logger
 
 
@@ -43,7 +44,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={"detail": exc.errors(), "error_code": "VALIDATION_ERROR", "request_id": req_id},
+        content={"detail": jsonable_encoder(exc.errors()), "error_code": "VALIDATION_ERROR", "request_id": req_id},
     )
 
 
@@ -65,6 +66,16 @@ async def database_exception_handler(request: Request, exc: DatabaseException) -
     )
 
 
+async def deadline_exception_handler(request: Request, exc: DeadlineExceededException) -> JSONResponse:
+    req_id = getattr(request.state, "request_id", None)
+    logger.warning(f"Deadline exceeded: {str(exc)}", extra={"request_id": req_id})
+    
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": "Request deadline exceeded", "error_code": "DEADLINE_EXCEEDED", "request_id": req_id},
+    )
+
+
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     req_id = getattr(request.state, "request_id", None)
     logger.error(f"Unhandled exception: {type(exc).__name__} - {str(exc)}", extra={"request_id": req_id}, exc_info=True)
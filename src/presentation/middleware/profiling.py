@@ -0,0 +1,69 @@
+import asyncio
+import secrets
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.constants import ProfilingConstants
+from src.infrastructure.logger import logger
+from src.infrastructure.profiling import ProfileInfo, RequestProfiler
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler, admin_token: str) -> None:
+        self.app = app
+        self.profiler = profiler
+        self.admin_token = admin_token.encode()
+        self.request_header = ProfilingConstants.REQUEST_HEADER.encode()
+        self.token_header = ProfilingConstants.TOKEN_HEADER.encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = self.profiler.start()
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid4().hex
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message = {**message, "headers": [*message.get("headers", []), (b"x-profile-id", profile_id.encode())]}
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.profiler.stop(profile)
+            info = ProfileInfo(
+                id=profile_id,
+                method=scope["method"],
+                path=scope["path"],
+                status_code=status_code,
+                duration_ms=round((time.perf_counter() - started) * 1000, 3),
+                created_at=datetime.now(timezone.utc),
+            )
+            try:
+                await asyncio.to_thread(self.profiler.store.save, info, profile)
+            except Exception as e:
+                logger.error(f"Failed to store profile {profile_id}: {str(e)}", exc_info=True)
+
+    def _requested(self, scope: Scope) -> bool:
+        requested = False
+        token = None
+        for name, value in scope.get("headers", []):
+            if name == self.request_header:
+                requested = True
+            elif name == self.token_header:
+                token = value
+        # Without a valid token the header is ignored rather than rejected, so the surface stays invisible.
+        return requested and token is not None and secrets.compare_digest(token, self.admin_token)
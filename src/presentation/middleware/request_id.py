@@ -1,15 +1,42 @@
+import asyncio
 from uuid import uuid4
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
 
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        req_id = request.headers.get("X-Request-ID") or str(uuid4())
-        request.state.request_id = req_id
-        
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = req_id
-        return response
+from src.infrastructure.constants import LoopMonitorConstants
+from src.infrastructure.logger import request_id_context
 
+
+class RequestIDMiddleware:
+    # Plain ASGI rather than BaseHTTPMiddleware, so the handler runs on the request's own task
+    # and that task can carry the request id in its name for loop-stall reports.
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        req_id = None
+        for name, value in scope.get("headers", []):
+            if name == b"x-request-id":
+                req_id = value.decode("latin-1")
+                break
+        req_id = req_id or str(uuid4())
+        scope.setdefault("state", {})["request_id"] = req_id
+        task = asyncio.current_task()
+        if task is not None:
+            task.set_name(f"{LoopMonitorConstants.REQUEST_TASK_PREFIX}{req_id}")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = req_id
+            await send(message)
+
+        token = request_id_context.set(req_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_context.reset(token)
@@ -0,0 +1,67 @@
+import random
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.logger import logger
+from src.infrastructure.tracing import TraceRecorder, parse_traceparent, trace_request
+
+
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp, recorder: Optional[TraceRecorder], server_timing: bool, sample_rate: float) -> None:
+        self.app = app
+        self.recorder = recorder
+        self.server_timing = server_timing
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for name, value in scope.get("headers", []):
+            if name == b"traceparent":
+                traceparent = parse_traceparent(value.decode("latin-1"))
+                break
+        record = self.recorder is not None and (
+            (traceparent is not None and traceparent[2]) or random.random() < self.sample_rate
+        )
+        if not record and not self.server_timing:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        with trace_request(
+            f"{scope['method']} {scope['path']}",
+            record,
+            trace_id=traceparent[0] if traceparent else None,
+            parent_span_id=traceparent[1] if traceparent else None,
+            **{"http.method": scope["method"], "http.target": scope["path"]},
+        ) as (trace, root):
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if self.server_timing:
+                        headers = list(message.get("headers", []))
+                        headers.append((b"server-timing", trace.server_timing(root, time.time_ns()).encode("latin-1")))
+                        message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                root.attributes["http.status_code"] = status_code
+                if route is not None:
+                    root.name = f"{scope['method']} {route.path}"
+                    root.attributes["http.route"] = route.path
+                root.error = root.error or status_code >= 500
+        if record:
+            try:
+                self.recorder.record(trace)
+            except Exception as e:
+                logger.error(f"Failed to record trace {trace.trace_id}: {str(e)}", exc_info=True)
@@ -0,0 +1,122 @@
+import asyncio
+import tracemalloc
+from typing import List, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from src.infrastructure.constants import MemoryConstants, ProfilingConstants
+from src.infrastructure.exceptions import (
+    ProfileNotFoundException,
+    ProfilerBusyException,
+    ProfilingException,
+    TracemallocNotRunningException,
+)
+from src.infrastructure.logger import logger
+from src.infrastructure.memory import MemoryMonitor, TracemallocSnapshots, read_rss_bytes
+from src.infrastructure.profiling import RequestProfiler, StackSampler, format_collapsed
+from src.presentation.dependencies import (
+    get_memory_monitor,
+    get_request_profiler,
+    get_stack_sampler,
+    get_tracemalloc_snapshots,
+    require_admin_token,
+)
+from src.presentation.schemas.admin_schema import (
+    LiveObjectsSchema,
+    MemorySnapshotSchema,
+    ProfileInfoSchema,
+    TracemallocStatusSchema,
+)
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+def _profiling_exception_to_http(exc: ProfilingException) -> HTTPException:
+    if isinstance(exc, ProfileNotFoundException):
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    if isinstance(exc, (ProfilerBusyException, TracemallocNotRunningException)):
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.post("/profiling/sample", response_class=PlainTextResponse, summary="Sample all threads and return collapsed stacks")
+async def sample_stacks(
+    request: Request,
+    seconds: float = Query(ProfilingConstants.SAMPLE_DEFAULT_SECONDS, gt=0, le=ProfilingConstants.SAMPLE_MAX_SECONDS),
+    interval_ms: float = Query(ProfilingConstants.SAMPLE_DEFAULT_INTERVAL_MS, ge=ProfilingConstants.SAMPLE_MIN_INTERVAL_MS),
+    sampler: StackSampler = Depends(get_stack_sampler),
+):
+    req_id = getattr(request.state, "request_id", "N/A")
+    logger.info(f"Sampling stacks for {seconds}s every {interval_ms}ms", extra={"request_id": req_id})
+    try:
+        # The sampler runs on a worker thread so the event loop it is observing keeps serving traffic.
+        stacks = await asyncio.to_thread(sampler.sample, seconds, interval_ms / 1000)
+    except ProfilingException as e:
+        raise _profiling_exception_to_http(e)
+    return PlainTextResponse(format_collapsed(stacks))
+
+
+@router.get("/profiling/requests", response_model=List[ProfileInfoSchema], summary="List stored request profiles")
+async def list_request_profiles(profiler: RequestProfiler = Depends(get_request_profiler)):
+    infos = await asyncio.to_thread(profiler.store.list)
+    return [ProfileInfoSchema.model_validate(i) for i in infos]
+
+
+@router.get("/profiling/requests/{profile_id}", summary="Get a stored request profile")
+async def get_request_profile(
+    profile_id: str,
+    format: Literal["text", "pstats"] = Query("text"),
+    sort: Literal["cumulative", "tottime", "calls"] = Query("cumulative"),
+    profiler: RequestProfiler = Depends(get_request_profiler),
+):
+    try:
+        if format == "pstats":
+            return FileResponse(profiler.store.path(profile_id), media_type="application/octet-stream", filename=f"{profile_id}.prof")
+        report = await asyncio.to_thread(profiler.store.report, profile_id, sort, ProfilingConstants.REPORT_LINES)
+        return PlainTextResponse(report)
+    except ProfilingException as e:
+        raise _profiling_exception_to_http(e)
+
+
+def _tracemalloc_status(snapshots: TracemallocSnapshots) -> TracemallocStatusSchema:
+    current, peak = tracemalloc.get_traced_memory()
+    return TracemallocStatusSchema(tracing=snapshots.tracing, traced_current_bytes=current, traced_peak_bytes=peak)
+
+
+@router.post("/memory/tracemalloc/start", response_model=TracemallocStatusSchema, summary="Start tracing allocations")
+async def start_tracemalloc(
+    request: Request,
+    frames: int = Query(MemoryConstants.DEFAULT_TRACEMALLOC_FRAMES, ge=1, le=MemoryConstants.MAX_TRACEMALLOC_FRAMES),
+    snapshots: TracemallocSnapshots = Depends(get_tracemalloc_snapshots),
+):
+    req_id = getattr(request.state, "request_id", "N/A")
+    logger.info(f"Starting tracemalloc with {frames} frames", extra={"request_id": req_id})
+    snapshots.start(frames)
+    return _tracemalloc_status(snapshots)
+
+
+@router.post("/memory/tracemalloc/stop", response_model=TracemallocStatusSchema, summary="Stop tracing allocations")
+async def stop_tracemalloc(request: Request, snapshots: TracemallocSnapshots = Depends(get_tracemalloc_snapshots)):
+    req_id = getattr(request.state, "request_id", "N/A")
+    logger.info("Stopping tracemalloc", extra={"request_id": req_id})
+    snapshots.stop()
+    return _tracemalloc_status(snapshots)
+
+
+@router.post("/memory/snapshot", response_model=MemorySnapshotSchema, summary="Snapshot allocations and diff against the previous snapshot")
+async def take_memory_snapshot(
+    group_by: Literal["lineno", "filename", "traceback"] = Query("lineno"),
+    limit: int = Query(MemoryConstants.DEFAULT_TOP_LIMIT, ge=1, le=MemoryConstants.MAX_TOP_LIMIT),
+    snapshots: TracemallocSnapshots = Depends(get_tracemalloc_snapshots),
+):
+    try:
+        report = await asyncio.to_thread(snapshots.snapshot, group_by, limit)
+    except ProfilingException as e:
+        raise _profiling_exception_to_http(e)
+    return MemorySnapshotSchema.model_validate(report)
+
+
+@router.get("/memory/objects", response_model=LiveObjectsSchema, summary="Count live instances of tracked types")
+async def count_live_objects(monitor: MemoryMonitor = Depends(get_memory_monitor)):
+    return LiveObjectsSchema(rss_bytes=read_rss_bytes(), counts=monitor.scan())
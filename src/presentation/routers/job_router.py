@@ -0,0 +1,60 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from src.infrastructure.exceptions import InvalidJobException, JobException, JobNotFinishedException, JobNotFoundException
+from src.infrastructure.jobs.runner import JobRunner
+from src.infrastructure.logger import logger
+from src.presentation.dependencies import get_job_runner
+from src.presentation.schemas.job_schema import JobResponseSchema, JobResultSchema, JobSubmitSchema
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def _job_exception_to_http(exc: JobException) -> HTTPException:
+    if isinstance(exc, JobNotFoundException):
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    if isinstance(exc, JobNotFinishedException):
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    if isinstance(exc, InvalidJobException):
+        return HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.post("", response_model=JobResponseSchema, status_code=status.HTTP_202_ACCEPTED, summary="Submit a background job")
+async def submit_job(request: Request, job_data: JobSubmitSchema, runner: JobRunner = Depends(get_job_runner)):
+    req_id = getattr(request.state, "request_id", "N/A")
+    try:
+        job = await runner.submit(job_data.type, job_data.params)
+        logger.info(f"Job submitted: {job.id} ({job.type})", extra={"request_id": req_id})
+        return JobResponseSchema.model_validate(job)
+    except JobException as e:
+        logger.warning(f"Job error: {str(e)}", extra={"request_id": req_id})
+        raise _job_exception_to_http(e)
+
+
+@router.get("/{job_id}", response_model=JobResponseSchema, summary="Get job status")
+async def get_job(job_id: UUID, runner: JobRunner = Depends(get_job_runner)):
+    try:
+        return JobResponseSchema.model_validate(await runner.get(job_id))
+    except JobException as e:
+        raise _job_exception_to_http(e)
+
+
+@router.get("/{job_id}/result", response_model=JobResultSchema, summary="Get job result")
+async def get_job_result(job_id: UUID, runner: JobRunner = Depends(get_job_runner)):
+    try:
+        return JobResultSchema(id=job_id, result=await runner.get_result(job_id))
+    except JobException as e:
+        raise _job_exception_to_http(e)
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponseSchema, summary="Cancel a job")
+async def cancel_job(request: Request, job_id: UUID, runner: JobRunner = Depends(get_job_runner)):
+    req_id = getattr(request.state, "request_id", "N/A")
+    try:
+        job = await runner.cancel(job_id)
+        logger.info(f"Job cancel requested: {job_id}", extra={"request_id": req_id})
+        return JobResponseSchema.model_validate(job)
+    except JobException as e:
+        raise _job_exception_to_http(e)
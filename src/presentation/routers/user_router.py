@@ -1,33 +1,59 @@
-from typing import List
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple, TypeVar
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from src.application.dto.user_dto import UserDTO
+from src.application.use_cases.check_availability import CheckAvailabilityUseCase
 from src.application.use_cases.create_user import CreateUserUseCase
 from src.application.use_cases.delete_user import DeleteUserUseCase
 from src.application.use_cases.get_all_users import GetAllUsersUseCase
 from src.application.use_cases.get_user import GetUserUseCase
+from src.application.use_cases.get_user_changes import GetUserChangesUseCase
+from src.application.use_cases.set_users_status import SetUsersStatusUseCase
 from src.application.use_cases.update_user import UpdateUserUseCase
 from src.domain.exceptions import (
     DomainException,
     UserAlreadyExistsException,
     UserNotFoundException,
 )
-from src.infrastructure.constants import PaginationConstants
+from src.domain.repositories.user_repository import USER_FIELDS, UserFilter, normalize_fields
+from src.infrastructure.constants import BulkConstants, OutboxConstants, PaginationConstants, SyncConstants
 from src.infrastructure.database.unit_of_work import UnitOfWork
+from src.infrastructure.database.write_batcher import WriteBatcher
 from src.infrastructure.exceptions import DatabaseException
 from src.infrastructure.logger import logger
-from src.presentation.dependencies import get_unit_of_work
+from src.infrastructure.membership import UserAvailabilityIndex
+from src.infrastructure.outbox.relay import OutboxEvent, OutboxRelay
+from src.infrastructure.tracing import traced
+from src.infrastructure.single_flight import SingleFlight
+from src.presentation.dependencies import (
+    get_availability_index,
+    get_outbox_relay,
+    get_read_coalescer,
+    get_unit_of_work,
+    get_write_batcher,
+    get_write_unit_of_work,
+)
 from src.presentation.schemas.pagination_schema import PaginatedResponse, PaginationMeta
 from src.presentation.schemas.user_schema import (
+    DeletedUserSchema,
+    UserAvailabilityResponseSchema,
+    UserBulkStatusResponseSchema,
+    UserBulkStatusSchema,
+    UserChangesResponseSchema,
     UserCreateSchema,
     UserResponseSchema,
     UserUpdateSchema,
+    user_projection_schema,
 )
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+T = TypeVar("T")
+
 
 def _domain_exception_to_http(exc: DomainException) -> HTTPException:
     if isinstance(exc, UserNotFoundException):
@@ -37,6 +63,28 @@ def _domain_exception_to_http(exc: DomainException) -> HTTPException:
     return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
 
+async def _execute_write(uow: UnitOfWork, batcher: WriteBatcher | None, command: Callable[[UnitOfWork], Awaitable[T]]) -> T:
+    if batcher is None:
+        return await command(uow)
+    return await batcher.submit(command)
+
+
+def _parse_fields(fields: str | None) -> Optional[Tuple[str, ...]]:
+    if fields is None:
+        return None
+    try:
+        projected = normalize_fields(fields.split(","))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    # Asking for every field is the ordinary read.
+    return None if projected == USER_FIELDS else projected
+
+
+def _json_response(model) -> Response:
+    # Bypasses response_model, which describes the full user rather than the projection.
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 def _dto_to_response(dto: UserDTO) -> UserResponseSchema:
     return UserResponseSchema(
         id=dto.id,
@@ -50,13 +98,23 @@ def _dto_to_response(dto: UserDTO) -> UserResponseSchema:
 
 
 @router.post("", response_model=UserResponseSchema, status_code=status.HTTP_201_CREATED, summary="Create a new user")
-async def create_user(request: Request, user_data: UserCreateSchema, uow: UnitOfWork = Depends(get_unit_of_work)):
+@traced("handler")
+async def create_user(
+    request: Request,
+    user_data: UserCreateSchema,
+    uow: UnitOfWork = Depends(get_write_unit_of_work),
+    batcher: WriteBatcher | None = Depends(get_write_batcher),
+    availability: UserAvailabilityIndex | None = Depends(get_availability_index),
+):
     req_id = getattr(request.state, "request_id", "N/A")
     logger.info(f"Creating user: {user_data.email}", extra={"request_id": req_id})
     
     try:
-        use_case = CreateUserUseCase(uow)
-        dto = await use_case.execute(email=user_data.email, username=user_data.username, full_name=user_data.full_name)
+        dto = await _execute_write(
+            uow,
+            batcher,
+            lambda w: CreateUserUseCase(w, availability).execute(email=user_data.email, username=user_data.username, full_name=user_data.full_name),
+        )
         logger.info(f"User created: {dto.id}", extra={"request_id": req_id})
         return _dto_to_response(dto)
     except DomainException as e:
@@ -67,13 +125,121 @@ async def create_user(request: Request, user_data: UserCreateSchema, uow: UnitOf
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error occurred")
 
 
+@router.get("/changes", response_model=UserChangesResponseSchema, summary="Get users changed since a sync token")
+@traced("handler")
+async def get_user_changes(
+    request: Request,
+    since: str | None = Query(None, max_length=512),
+    limit: int = Query(SyncConstants.DEFAULT_LIMIT, ge=1, le=SyncConstants.MAX_LIMIT),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+):
+    req_id = getattr(request.state, "request_id", "N/A")
+    try:
+        use_case = GetUserChangesUseCase(uow, settle_seconds=SyncConstants.SETTLE_SECONDS)
+        changes = await use_case.execute(since, limit=limit)
+        return UserChangesResponseSchema(
+            items=[_dto_to_response(u) for u in changes.users],
+            deleted=[DeletedUserSchema(id=d.id, deleted_at=d.deleted_at) for d in changes.deleted],
+            next_token=changes.next_token,
+            has_more=changes.has_more,
+        )
+    except DomainException as e:
+        logger.warning(f"Domain error: {str(e)}", extra={"request_id": req_id})
+        raise _domain_exception_to_http(e)
+    except DatabaseException as e:
+        logger.error(f"Database error: {str(e)}", extra={"request_id": req_id}, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error occurred")
+
+
+@router.get("/availability", response_model=UserAvailabilityResponseSchema, summary="Check whether an email or username is free")
+@traced("handler")
+async def check_availability(
+    request: Request,
+    email: str | None = Query(None, max_length=255),
+    username: str | None = Query(None, max_length=100),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    availability: UserAvailabilityIndex | None = Depends(get_availability_index),
+):
+    if email is None and username is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Provide email, username or both")
+    try:
+        dto = await CheckAvailabilityUseCase(uow, availability).execute(email=email, username=username)
+        return UserAvailabilityResponseSchema(email_available=dto.email_available, username_available=dto.username_available)
+    except DatabaseException as e:
+        req_id = getattr(request.state, "request_id", "N/A")
+        logger.error(f"Database error: {str(e)}", extra={"request_id": req_id}, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error occurred")
+
+
+def _format_event(event: OutboxEvent) -> str:
+    return f"id: {event.id}\nevent: {event.type}\ndata: {event.payload}\n\n"
+
+
+async def _event_stream(relay: OutboxRelay, last_event_id: int | None) -> AsyncIterator[str]:
+    # Subscribing before the replay means nothing committed in between is missed; ids already sent are skipped.
+    subscription = relay.subscribe()
+    try:
+        yield f"retry: {OutboxConstants.SSE_RETRY_MS}\n\n"
+        last_sent = relay.cursor if last_event_id is None else last_event_id
+        if last_event_id is not None:
+            while True:
+                events = await relay.replay(last_sent, OutboxConstants.DEFAULT_BATCH_SIZE)
+                for event in events:
+                    yield _format_event(event)
+                    last_sent = event.id
+                if len(events) < OutboxConstants.DEFAULT_BATCH_SIZE:
+                    break
+        while True:
+            try:
+                event = await subscription.get(OutboxConstants.SSE_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                return
+            if event.id > last_sent:
+                yield _format_event(event)
+                last_sent = event.id
+    finally:
+        relay.unsubscribe(subscription)
+
+
+@router.get("/events", summary="Stream user change events (server-sent events)")
+@traced("handler")
+async def stream_user_events(
+    request: Request,
+    last_event_id: int | None = Query(None, ge=0),
+    last_event_id_header: int | None = Header(None, alias="Last-Event-ID", ge=0),
+    relay: OutboxRelay = Depends(get_outbox_relay),
+):
+    req_id = getattr(request.state, "request_id", "N/A")
+    resume_from = last_event_id_header if last_event_id_header is not None else last_event_id
+    logger.info(f"Opening user event stream from {resume_from if resume_from is not None else 'now'}", extra={"request_id": req_id})
+    return StreamingResponse(
+        _event_stream(relay, resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{user_id}", response_model=UserResponseSchema, summary="Get user by ID")
-async def get_user(request: Request, user_id: UUID, uow: UnitOfWork = Depends(get_unit_of_work)):
+@traced("handler")
+async def get_user(
+    request: Request,
+    user_id: UUID,
+    fields: str | None = Query(None, max_length=200, description="Comma-separated user fields to return"),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    coalescer: SingleFlight | None = Depends(get_read_coalescer),
+):
     req_id = getattr(request.state, "request_id", "N/A")
     logger.info(f"Getting user: {user_id}", extra={"request_id": req_id})
+    projection = _parse_fields(fields)
     
     try:
-        use_case = GetUserUseCase(uow)
+        use_case = GetUserUseCase(uow, coalescer)
+        if projection is not None:
+            projected = await use_case.execute_projected(user_id, projection)
+            return _json_response(user_projection_schema(projection).model_validate(projected))
         dto = await use_case.execute(user_id)
         return _dto_to_response(dto)
     except DomainException as e:
@@ -85,16 +251,23 @@ async def get_user(request: Request, user_id: UUID, uow: UnitOfWork = Depends(ge
 
 
 @router.get("", response_model=PaginatedResponse[UserResponseSchema], summary="Get all users")
+@traced("handler")
 async def get_all_users(
     request: Request,
     page: int = Query(PaginationConstants.DEFAULT_PAGE, ge=PaginationConstants.MIN_PAGE),
     page_size: int = Query(PaginationConstants.DEFAULT_PAGE_SIZE, ge=PaginationConstants.MIN_PAGE_SIZE, le=PaginationConstants.MAX_PAGE_SIZE),
+    fields: str | None = Query(None, max_length=200, description="Comma-separated user fields to return"),
     uow: UnitOfWork = Depends(get_unit_of_work),
+    coalescer: SingleFlight | None = Depends(get_read_coalescer),
 ):
+    projection = _parse_fields(fields)
     try:
         skip = (page - 1) * page_size
-        use_case = GetAllUsersUseCase(uow)
-        users, total = await use_case.execute(skip=skip, limit=page_size)
+        use_case = GetAllUsersUseCase(uow, coalescer)
+        if projection is not None:
+            users, total = await use_case.execute_projected(projection, skip=skip, limit=page_size)
+        else:
+            users, total = await use_case.execute(skip=skip, limit=page_size)
         
         total_pages = (total + page_size - 1) // page_size if total > 0 else 0
         
@@ -107,6 +280,8 @@ async def get_all_users(
             has_prev=page > 1,
         )
         
+        if projection is not None:
+            return _json_response(PaginatedResponse[user_projection_schema(projection)](items=users, meta=meta))
         return PaginatedResponse(items=[_dto_to_response(u) for u in users], meta=meta)
     except DatabaseException as e:
         req_id = getattr(request.state, "request_id", "N/A")
@@ -115,13 +290,24 @@ async def get_all_users(
 
 
 @router.put("/{user_id}", response_model=UserResponseSchema, summary="Update user")
-async def update_user(request: Request, user_id: UUID, user_data: UserUpdateSchema, uow: UnitOfWork = Depends(get_unit_of_work)):
+@traced("handler")
+async def update_user(
+    request: Request,
+    user_id: UUID,
+    user_data: UserUpdateSchema,
+    uow: UnitOfWork = Depends(get_write_unit_of_work),
+    batcher: WriteBatcher | None = Depends(get_write_batcher),
+    availability: UserAvailabilityIndex | None = Depends(get_availability_index),
+):
     req_id = getattr(request.state, "request_id", "N/A")
     logger.info(f"Updating user: {user_id}", extra={"request_id": req_id})
     
     try:
-        use_case = UpdateUserUseCase(uow)
-        dto = await use_case.execute(user_id=user_id, email=user_data.email, username=user_data.username, full_name=user_data.full_name)
+        dto = await _execute_write(
+            uow,
+            batcher,
+            lambda w: UpdateUserUseCase(w, availability).execute(user_id=user_id, email=user_data.email, username=user_data.username, full_name=user_data.full_name),
+        )
         logger.info(f"User updated: {user_id}", extra={"request_id": req_id})
         return _dto_to_response(dto)
     except DomainException as e:
@@ -133,7 +319,8 @@ async def update_user(request: Request, user_id: UUID, user_data: UserUpdateSche
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete user")
-async def delete_user(request: Request, user_id: UUID, uow: UnitOfWork = Depends(get_unit_of_work)):
+@traced("handler")
+async def delete_user(request: Request, user_id: UUID, uow: UnitOfWork = Depends(get_write_unit_of_work)):
     req_id = getattr(request.state, "request_id", "N/A")
     logger.info(f"Deleting user: {user_id}", extra={"request_id": req_id})
     
@@ -148,3 +335,37 @@ async def delete_user(request: Request, user_id: UUID, uow: UnitOfWork = Depends
         logger.error(f"Database error: {str(e)}", extra={"request_id": req_id}, exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error occurred")
 
+
+async def _set_users_status(request: Request, bulk_data: UserBulkStatusSchema, is_active: bool, uow: UnitOfWork) -> UserBulkStatusResponseSchema:
+    req_id = getattr(request.state, "request_id", "N/A")
+    action = "Activating" if is_active else "Deactivating"
+    logger.info(f"{action} users in bulk", extra={"request_id": req_id})
+
+    try:
+        user_filter = UserFilter(
+            ids=tuple(bulk_data.ids) if bulk_data.ids is not None else None,
+            created_before=bulk_data.created_before,
+            email_domain=bulk_data.email_domain,
+        )
+        use_case = SetUsersStatusUseCase(uow)
+        affected = await use_case.execute(user_filter, is_active=is_active, batch_size=BulkConstants.DEFAULT_BATCH_SIZE)
+        logger.info(f"Bulk status change affected {affected} users", extra={"request_id": req_id})
+        return UserBulkStatusResponseSchema(affected=affected)
+    except DomainException as e:
+        logger.warning(f"Domain error: {str(e)}", extra={"request_id": req_id})
+        raise _domain_exception_to_http(e)
+    except DatabaseException as e:
+        logger.error(f"Database error: {str(e)}", extra={"request_id": req_id}, exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database error occurred")
+
+
+@router.post("/bulk/activate", response_model=UserBulkStatusResponseSchema, summary="Activate users in bulk")
+@traced("handler")
+async def activate_users(request: Request, bulk_data: UserBulkStatusSchema, uow: UnitOfWork = Depends(get_write_unit_of_work)):
+    return await _set_users_status(request, bulk_data, True, uow)
+
+
+@router.post("/bulk/deactivate", response_model=UserBulkStatusResponseSchema, summary="Deactivate users in bulk")
+@traced("handler")
+async def deactivate_users(request: Request, bulk_data: UserBulkStatusSchema, uow: UnitOfWork = Depends(get_write_unit_of_work)):
+    return await _set_users_status(request, bulk_data, False, uow)
@@ -1,15 +1,43 @@
+from src.presentation.schemas.admin_schema import (
+    AllocationStatSchema,
+    LiveObjectsSchema,
+    MemorySnapshotSchema,
+    ProfileInfoSchema,
+    TracemallocStatusSchema,
+)
+from src.presentation.schemas.job_schema import JobResponseSchema, JobResultSchema, JobSubmitSchema
 from src.presentation.schemas.pagination_schema import PaginatedResponse, PaginationMeta
 from src.presentation.schemas.user_schema import (
+    UserBulkStatusResponseSchema,
+    UserBulkStatusSchema,
+    UserChangesResponseSchema,
+    DeletedUserSchema,
+    UserAvailabilityResponseSchema,
     UserCreateSchema,
     UserResponseSchema,
     UserUpdateSchema,
+    user_projection_schema,
 )
 
 __all__ = [
     "UserCreateSchema",
     "UserUpdateSchema",
     "UserResponseSchema",
+    "UserBulkStatusSchema",
+    "UserBulkStatusResponseSchema",
+    "UserChangesResponseSchema",
+    "DeletedUserSchema",
+    "UserAvailabilityResponseSchema",
+    "user_projection_schema",
     "PaginatedResponse",
     "PaginationMeta",
+    "JobSubmitSchema",
+    "JobResponseSchema",
+    "JobResultSchema",
+    "ProfileInfoSchema",
+    "TracemallocStatusSchema",
+    "AllocationStatSchema",
+    "MemorySnapshotSchema",
+    "LiveObjectsSchema",
 ]
 
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class ProfileInfoSchema(BaseModel):
+    id: str
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TracemallocStatusSchema(BaseModel):
+    tracing: bool
+    traced_current_bytes: int
+    traced_peak_bytes: int
+
+
+class AllocationStatSchema(BaseModel):
+    location: str
+    size_bytes: int
+    count: int
+    size_diff_bytes: Optional[int] = None
+    count_diff: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
+class MemorySnapshotSchema(BaseModel):
+    traced_current_bytes: int
+    traced_peak_bytes: int
+    rss_bytes: int
+    group_by: str
+    top: List[AllocationStatSchema]
+    diff: Optional[List[AllocationStatSchema]]
+
+    class Config:
+        from_attributes = True
+
+
+class LiveObjectsSchema(BaseModel):
+    rss_bytes: int
+    counts: Dict[str, int]
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class JobSubmitSchema(BaseModel):
+    type: str = Field(..., min_length=1, max_length=100)
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+
+class JobResponseSchema(BaseModel):
+    id: UUID
+    type: str
+    status: str
+    params: Dict[str, Any]
+    progress: float
+    message: Optional[str]
+    error: Optional[str]
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class JobResultSchema(BaseModel):
+    id: UUID
+    result: Any
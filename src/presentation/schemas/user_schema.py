@@ -1,8 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, create_model, field_validator, model_validator
+
+from src.infrastructure.constants import BulkConstants
 
 
 class UserCreateSchema(BaseModel):
@@ -43,3 +46,44 @@ class UserResponseSchema(BaseModel):
     class Config:
         from_attributes = True
 
+
+@lru_cache(maxsize=None)
+def user_projection_schema(fields: Tuple[str, ...]) -> Type[BaseModel]:
+    # One model per canonical field tuple, built on first use instead of per response.
+    return create_model(
+        f"UserProjection_{'_'.join(fields)}",
+        **{name: (UserResponseSchema.model_fields[name].annotation, ...) for name in fields},
+    )
+
+
+class UserBulkStatusSchema(BaseModel):
+    ids: Optional[List[UUID]] = Field(None, min_length=1, max_length=BulkConstants.MAX_IDS)
+    created_before: Optional[datetime] = None
+    email_domain: Optional[str] = Field(None, min_length=1, max_length=255, pattern=r"^@?[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+    @model_validator(mode="after")
+    def validate_criteria(self) -> "UserBulkStatusSchema":
+        if self.ids is None and self.created_before is None and self.email_domain is None:
+            raise ValueError("At least one of ids, created_before or email_domain is required")
+        return self
+
+
+class UserBulkStatusResponseSchema(BaseModel):
+    affected: int
+
+
+class DeletedUserSchema(BaseModel):
+    id: UUID
+    deleted_at: datetime
+
+
+class UserChangesResponseSchema(BaseModel):
+    items: List[UserResponseSchema]
+    deleted: List[DeletedUserSchema]
+    next_token: str
+    has_more: bool
+
+
+class UserAvailabilityResponseSchema(BaseModel):
+    email_available: Optional[bool] = None
+    username_available: Optional[bool] = None
@@ -0,0 +1,68 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+import os
+from typing import Tuple
+
+import uvicorn
+
+from src.infrastructure.config import settings
+from src.infrastructure.database.base import Database
+from src.infrastructure.logger import logger
+from src.presentation import dependencies  # noqa: F401  registers every model on Base.metadata
+
+
+def default_workers() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def split_connection_budget(total: int, workers: int) -> Tuple[int, int]:
+    # Every worker also holds its job runner pool, so that comes off the top of its share.
+    per_worker = total // workers - (settings.jobs_database_pool_size if settings.jobs_enabled else 0)
+    if per_worker < 1:
+        raise ValueError(f"Connection budget {total} is too small for {workers} workers")
+    configured = settings.database_pool_size + settings.database_max_overflow
+    pool_size = max(1, round(per_worker * settings.database_pool_size / configured)) if configured else per_worker
+    pool_size = min(pool_size, per_worker)
+    return pool_size, per_worker - pool_size
+
+
+async def prepare_schema() -> None:
+    # Created once here so that workers starting together do not race on CREATE TABLE.
+    db = Database(settings.database_url, pool_size=1, max_overflow=0, sqlite_pragmas=settings.sqlite_pragmas)
+    try:
+        await db.create_tables()
+    finally:
+        await db.close()
+
+
+def main() -> None:
+    workers = settings.server_workers or default_workers()
+    if settings.database_max_connections:
+        pool_size, max_overflow = split_connection_budget(settings.database_max_connections, workers)
+        # Workers are spawned, not forked, and each re-reads its settings from the environment.
+        os.environ["DATABASE_POOL_SIZE"] = str(pool_size)
+        os.environ["DATABASE_MAX_OVERFLOW"] = str(max_overflow)
+        os.environ["DATABASE_POOL_ADAPTIVE_MAX_OVERFLOW"] = str(min(max_overflow, settings.database_pool_adaptive_max_overflow))
+        os.environ["DATABASE_POOL_ADAPTIVE_MIN_OVERFLOW"] = str(min(max_overflow, settings.database_pool_adaptive_min_overflow))
+        logger.info(f"Starting {workers} workers with pool_size={pool_size}, max_overflow={max_overflow} each")
+    else:
+        logger.info(f"Starting {workers} workers")
+
+    asyncio.run(prepare_schema())
+    uvicorn.run(
+        "src.main:app",
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=workers,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        log_level="debug" if settings.debug else "info",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+import os
+
+# Settings are read once at import, so the app under test is pinned to the in-memory backend
+# before anything from src is imported. Tests that need a real database build their own.
+os.environ.setdefault("DATABASE_BACKEND", "memory")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+import pytest
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def sqlite_url(tmp_path):
+    return f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
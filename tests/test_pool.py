@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.database.base import Database
+from src.infrastructure.database.pool import PoolMaintainer, ResizableQueuePool
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def database(sqlite_url):
+    db = Database(sqlite_url, pool_size=3, max_overflow=2)
+    yield db
+    await db.close()
+
+
+async def test_uses_resizable_pool(database):
+    assert isinstance(database.engine.pool, ResizableQueuePool)
+    assert database.engine.pool.max_overflow == 2
+
+
+async def test_warmup_opens_pool_size_connections(database):
+    maintainer = PoolMaintainer(database.engine)
+    assert await maintainer.warmup() == 3
+    assert database.engine.pool.checkedin() == 3
+    assert database.engine.pool.checkedout() == 0
+
+
+async def test_liveness_check_visits_idle_connections(database):
+    maintainer = PoolMaintainer(database.engine)
+    await maintainer.warmup()
+    assert await maintainer.check_idle_connections() == 0
+    assert database.engine.pool.checkedin() == 3
+
+
+async def test_checkout_waits_are_recorded_from_real_checkouts(database):
+    pool = database.engine.pool
+    pool.take_checkout_waits()
+    for _ in range(4):
+        async with database.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    count, mean, peak = pool.take_checkout_waits()
+    assert count == 4
+    assert 0 <= mean <= peak
+    assert pool.take_checkout_waits() == (0, 0.0, 0.0)
+
+
+async def test_checkout_wait_includes_time_queued_for_a_connection(sqlite_url):
+    db = Database(sqlite_url, pool_size=1, max_overflow=0)
+    try:
+        pool = db.engine.pool
+        holder = await db.engine.connect()
+        waiter = asyncio.create_task(db.engine.connect())
+        await asyncio.sleep(0.1)
+        pool.take_checkout_waits()
+        await holder.close()
+        conn = await waiter
+        await conn.close()
+        count, _, peak = pool.take_checkout_waits()
+        assert count == 1
+        assert peak >= 0.1
+    finally:
+        await db.close()
+
+
+async def test_adjust_overflow_grows_on_wait_and_shrinks_when_idle(database):
+    maintainer = PoolMaintainer(database.engine, adaptive=True, min_overflow=1, max_overflow=4, target_wait_ms=10)
+    pool = database.engine.pool
+
+    assert maintainer.adjust_overflow(0.05) == 3
+    assert pool.max_overflow == 3
+    assert maintainer.adjust_overflow(0.05) == 4
+    assert maintainer.adjust_overflow(0.05) == 4
+
+    assert maintainer.adjust_overflow(0.0) == 3
+    for _ in range(5):
+        maintainer.adjust_overflow(0.0)
+    assert pool.max_overflow == 1
+
+
+async def test_resized_overflow_bounds_checkouts(sqlite_url):
+    db = Database(sqlite_url, pool_size=1, max_overflow=0)
+    try:
+        pool = db.engine.pool
+        pool.resize_overflow(1)
+        first = await db.engine.connect()
+        second = await asyncio.wait_for(db.engine.connect(), timeout=1)
+        assert pool.checkedout() == 2
+        await first.close()
+        await second.close()
+    finally:
+        await db.close()
+
+
+async def test_resized_overflow_survives_pool_recreate(database):
+    database.engine.pool.resize_overflow(5)
+    await database.engine.dispose()
+    assert isinstance(database.engine.pool, ResizableQueuePool)
+    assert database.engine.pool.max_overflow == 5